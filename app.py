@@ -1,602 +1,819 @@
-import streamlit as st
-import os
-from datetime import datetime
-
-# ВАЖНО: st.set_page_config должен быть ПЕРВОЙ командой Streamlit
-st.set_page_config(
-    page_title="AI Customer Support System",
-    page_icon="🤖",
-    layout="wide"
-)
-
-# Company configuration
-COMPANY_INFO = {
-    "name": "TechCorp Solutions",
-    "email": "support@techcorp.com",
-    "phone": "+1-800-TECH-HELP"
-}
-
-def create_ticket(ticket_data):
-    """Create a support ticket (demo version)"""
-    try:
-        ticket_id = f"TICKET-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        
-        if "tickets" not in st.session_state:
-            st.session_state.tickets = []
-        
-        ticket_record = {
-            "ticket_id": ticket_id,
-            "name": ticket_data['name'],
-            "email": ticket_data['email'],
-            "title": ticket_data['title'],
-            "description": ticket_data['description'],
-            "created_at": ticket_data['created_at']
-        }
-        
-        st.session_state.tickets.append(ticket_record)
-        
-        return {
-            "success": True,
-            "ticket_id": ticket_id,
-            "platform": "Demo System"
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
-
-def process_pdf_file(file_path, filename, show_debug=False):
-    """Process PDF file with optional debugging"""
-    try:
-        import PyPDF2
-        
-        file_size = os.path.getsize(file_path)
-        if file_size == 0:
-            if show_debug:
-                st.error(f"❌ File {filename} is empty (0 bytes)")
-            return None
-        
-        with open(file_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            total_pages = len(pdf_reader.pages)
-            
-            if show_debug:
-                st.info(f"📄 PDF {filename} has {total_pages} pages, size: {file_size} bytes")
-            
-            if total_pages == 0:
-                if show_debug:
-                    st.warning(f"⚠️ PDF {filename} has no pages")
-                return None
-            
-            full_text = ""
-            pages_with_text = 0
-            
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        full_text += f"\n--- Page {page_num} ---\n{page_text}\n"
-                        pages_with_text += 1
-                except Exception:
-                    continue
-            
-            if show_debug:
-                st.info(f"📝 Extracted text from {pages_with_text}/{total_pages} pages, {len(full_text)} chars")
-            
-            if full_text.strip():
-                return {
-                    "filename": filename,
-                    "content": full_text,
-                    "pages": total_pages,
-                    "type": "pdf"
-                }
-            else:
-                if show_debug:
-                    st.warning(f"⚠️ No readable text found in PDF {filename}")
-                return None
-                    
-    except ImportError:
-        if show_debug:
-            st.error("❌ PyPDF2 not available")
-        return None
-    except Exception as e:
-        if show_debug:
-            st.error(f"❌ Error processing PDF {filename}: {str(e)}")
-        return None
-
-def load_documents_from_root(show_debug=False):
-    """Load documents from the same directory as app.py"""
-    documents = []
-    current_dir = "."
-    
-    try:
-        all_files = os.listdir(current_dir)
-        
-        # Фильтровать файлы
-        pdf_files = [f for f in all_files if f.lower().endswith('.pdf')]
-        txt_files = [f for f in all_files if f.lower().endswith('.txt') and 
-                    f.lower() not in ['requirements.txt', 'runtime.txt']]
-        
-        if show_debug:
-            st.header("🔍 Document Loading Debug Information")
-            st.info(f"📁 Directory: {os.path.abspath(current_dir)}")
-            st.info(f"📄 All files: {', '.join(sorted(all_files))}")
-            st.success(f"📄 PDF files: {pdf_files if pdf_files else 'None found'}")
-            st.success(f"📝 TXT files: {txt_files if txt_files else 'None found'}")
-        
-        # Process PDF files
-        for filename in pdf_files:
-            file_path = os.path.join(current_dir, filename)
-            
-            if show_debug:
-                st.markdown(f"**Processing: {filename}**")
-            
-            pdf_doc = process_pdf_file(file_path, filename, show_debug)
-            if pdf_doc:
-                documents.append(pdf_doc)
-                if show_debug:
-                    st.success(f"✅ Successfully loaded: {filename}")
-        
-        # Process TXT files
-        for filename in txt_files:
-            file_path = os.path.join(current_dir, filename)
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if content.strip():
-                        documents.append({
-                            "filename": filename,
-                            "content": content,
-                            "pages": 1,
-                            "type": "text"
-                        })
-                        if show_debug:
-                            st.success(f"✅ Loaded text file: {filename}")
-            except Exception as e:
-                if show_debug:
-                    st.error(f"❌ Error processing {filename}: {str(e)}")
-        
-        if show_debug:
-            st.markdown("---")
-            st.header("📊 Loading Summary")
-            total_loaded = len(documents)
-            pdf_loaded = len([d for d in documents if d["type"] == "pdf"])
-            txt_loaded = len([d for d in documents if d["type"] == "text"])
-            
-            st.success(f"✅ Total documents loaded: {total_loaded}")
-            st.info(f"📄 PDF documents: {pdf_loaded}")
-            st.info(f"📝 Text documents: {txt_loaded}")
-    
-    except Exception as e:
-        if show_debug:
-            st.error(f"❌ Error reading directory: {str(e)}")
-    
-    return documents
-
-def get_sample_documents():
-    """Get sample documents for the system"""
-    documents = [
-        {
-            "filename": "FAQ_Sample.txt",
-            "content": """# Frequently Asked Questions
-
-## Account Management
-**Q: How do I reset my password?**
-A: To reset your password, go to the login page and click "Forgot Password". Enter your email address and follow the instructions sent to your email.
-
-**Q: How do I update my account information?**
-A: Log into your account, navigate to "Account Settings", update your information, and click "Save Changes".
-
-## Technical Support
-**Q: What are your business hours?**
-A: Our support team is available Monday-Friday, 9 AM to 6 PM EST. Emergency support is available 24/7 for critical issues.
-
-**Q: How can I contact technical support?**
-A: You can reach us at support@techcorp.com, call 1-800-TECH-HELP, or use our live chat feature.
-
-## Billing
-**Q: What is your refund policy?**
-A: We offer full refunds within 30 days of purchase. Contact billing@techcorp.com for refund requests.
-
-**Q: How do I upgrade my subscription?**
-A: Log into your account, go to the Billing section, select "Upgrade Plan", and choose your new plan.
-""",
-            "pages": 1,
-            "type": "text"
-        }
-    ]
-    return documents
-
-def search_documents(query, documents):
-    """Improved search through documents with correct page detection"""
-    results = []
-    query_lower = query.lower()
-    query_words = [word for word in query_lower.split() if len(word) > 2]
-    
-    for doc in documents:
-        content_lower = doc["content"].lower()
-        
-        # Проверяем, есть ли хотя бы одно слово из запроса в документе
-        if any(word in content_lower for word in query_words):
-            
-            if doc["type"] == "pdf":
-                # Для PDF файлов ищем по страницам
-                # Улучшенный парсинг страниц
-                pages = doc["content"].split('\n--- Page ')
-                all_page_results = []
-                
-                for i, page_content in enumerate(pages):
-                    if i == 0 and not page_content.startswith('--- Page '):
-                        # Первая часть может не содержать номер страницы
-                        continue
-                    
-                    # Извлекаем номер страницы
-                    try:
-                        if i == 0:
-                            # Если первая часть начинается с '--- Page '
-                            page_content = page_content[4:]  # Убираем '--- '
-                        
-                        page_num_end = page_content.find(' ---')
-                        if page_num_end > 0:
-                            page_num = int(page_content[:page_num_end])
-                            page_text = page_content[page_num_end + 4:]  # Убираем " ---\n"
-                        else:
-                            continue
-                    except (ValueError, IndexError):
-                        continue
-                    
-                    # Проверяем, содержит ли эта страница искомый текст
-                    page_text_lower = page_text.lower()
-                    
-                    # Специальная проверка для точного поиска (например, "Essay#288")
-                    exact_match = query_lower in page_text_lower
-                    word_matches = sum(1 for word in query_words if word in page_text_lower)
-                    
-                    if exact_match or word_matches > 0:
-                        # Находим контекст вокруг совпадения
-                        context = ""
-                        
-                        if exact_match:
-                            # Для точного совпадения находим позицию и берем контекст
-                            pos = page_text_lower.find(query_lower)
-                            start = max(0, pos - 200)
-                            end = min(len(page_text), pos + 400)
-                            context = page_text[start:end].strip()
-                            if start > 0:
-                                context = "..." + context
-                            if end < len(page_text):
-                                context = context + "..."
-                        else:
-                            # Для поиска по словам - находим наиболее релевантный параграф
-                            paragraphs = [p.strip() for p in page_text.split('\n\n') if p.strip()]
-                            best_para = None
-                            max_matches = 0
-                            
-                            for para in paragraphs:
-                                para_matches = sum(1 for word in query_words if word in para.lower())
-                                if para_matches > max_matches:
-                                    max_matches = para_matches
-                                    best_para = para
-                            
-                            if best_para:
-                                context = best_para[:600] + "..." if len(best_para) > 600 else best_para
-                        
-                        if context:
-                            all_page_results.append({
-                                "filename": doc["filename"],
-                                "content": context,
-                                "page": page_num,
-                                "type": doc["type"],
-                                "matches": word_matches + (10 if exact_match else 0),  # Бонус за точное совпадение
-                                "exact_match": exact_match
-                            })
-                
-                # Добавляем все найденные результаты для этого документа
-                results.extend(all_page_results)
-                
-            else:
-                # Для текстовых файлов
-                exact_match = query_lower in content_lower
-                
-                if exact_match:
-                    # Для точного совпадения
-                    pos = content_lower.find(query_lower)
-                    start = max(0, pos - 200)
-                    end = min(len(doc["content"]), pos + 400)
-                    context = doc["content"][start:end].strip()
-                    if start > 0:
-                        context = "..." + context
-                    if end < len(doc["content"]):
-                        context = context + "..."
-                    
-                    results.append({
-                        "filename": doc["filename"],
-                        "content": context,
-                        "page": 1,
-                        "type": doc["type"],
-                        "matches": 10,  # Высокий приоритет для точного совпадения
-                        "exact_match": True
-                    })
-                else:
-                    # Поиск по словам
-                    paragraphs = [p.strip() for p in doc["content"].split('\n\n') if p.strip()]
-                    best_para = None
-                    max_matches = 0
-                    
-                    for para in paragraphs:
-                        para_matches = sum(1 for word in query_words if word in para.lower())
-                        if para_matches > max_matches:
-                            max_matches = para_matches
-                            best_para = para
-                    
-                    if best_para and max_matches > 0:
-                        results.append({
-                            "filename": doc["filename"],
-                            "content": best_para[:600] + "..." if len(best_para) > 600 else best_para,
-                            "page": 1,
-                            "type": doc["type"],
-                            "matches": max_matches,
-                            "exact_match": False
-                        })
-    
-    # Сортируем по приоритету: сначала точные совпадения, потом по количеству совпадений
-    results.sort(key=lambda x: (x.get("exact_match", False), x.get("matches", 0)), reverse=True)
-    
-    # Если есть точные совпадения, показываем все страницы где они найдены
-    if results and results[0].get("exact_match", False):
-        exact_results = [r for r in results if r.get("exact_match", False)]
-        return exact_results[:5]  # Показываем до 5 точных совпадений
-    
-    return results[:3]
-
-def generate_response(query, search_results):
-    """Generate response based on search results"""
-    if not search_results:
-        return {
-            "answer": f"I couldn't find specific information about '{query}' in our documentation.\n\nI'd be happy to help you create a support ticket so our team can provide detailed assistance.\n\nContact us:\n📧 {COMPANY_INFO['email']}\n📞 {COMPANY_INFO['phone']}",
-            "sources": []
-        }
-    
-    # Проверяем, есть ли точные совпадения
-    exact_matches = [r for r in search_results if r.get("exact_match", False)]
-    
-    if exact_matches:
-        # Если есть точные совпадения, показываем их все
-        if len(exact_matches) == 1:
-            result = exact_matches[0]
-            response = f"I found an exact match for '{query}' in our documentation:\n\n"
-            response += f"📄 **{result['filename']}** (Page {result['page']})\n\n"
-            response += f"{result['content']}\n\n"
-        else:
-            response = f"I found {len(exact_matches)} exact matches for '{query}' in our documentation:\n\n"
-            for idx, result in enumerate(exact_matches, 1):
-                response += f"**Match {idx}:** 📄 {result['filename']} (Page {result['page']})\n"
-                response += f"{result['content']}\n\n"
-                if idx < len(exact_matches):
-                    response += "---\n\n"
-    else:
-        # Если точных совпадений нет, показываем наиболее релевантные результаты
-        result = search_results[0]
-        response = f"Based on our documentation, here's what I found related to '{query}':\n\n"
-        response += f"{result['content']}\n\n"
-        
-        if len(search_results) > 1:
-            response += "**Other relevant information:**\n"
-            for res in search_results[1:]:
-                response += f"- 📄 {res['filename']} (Page {res['page']})\n"
-            response += "\n"
-    
-    response += f"For additional assistance, contact us at {COMPANY_INFO['email']} or {COMPANY_INFO['phone']}."
-    
-    return {
-        "answer": response,
-        "sources": [{"filename": res["filename"], "page": res["page"], "type": res["type"]} for res in search_results]
-    }
-
-# Main application
-st.title("🤖 AI Customer Support System")
-st.markdown(f"Welcome to **{COMPANY_INFO['name']}** - Your AI-powered support assistant!")
-
-# Initialize session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-if "show_ticket_form" not in st.session_state:
-    st.session_state.show_ticket_form = False
-if "documents_loaded" not in st.session_state:
-    st.session_state.documents_loaded = False
-if "documents" not in st.session_state:
-    st.session_state.documents = []
-if "show_debug" not in st.session_state:
-    st.session_state.show_debug = False
-
-# Load documents silently on first run
-if not st.session_state.documents_loaded:
-    # Load documents without showing debug info
-    root_docs = load_documents_from_root(show_debug=False)
-    
-    if root_docs:
-        st.session_state.documents = root_docs
-    else:
-        st.session_state.documents = get_sample_documents()
-    
-    st.session_state.documents_loaded = True
-
-documents = st.session_state.documents
-
-# Show debug information if requested
-if st.session_state.show_debug:
-    st.markdown("---")
-    load_documents_from_root(show_debug=True)
-    st.markdown("---")
-    
-    if st.button("❌ Hide Debug Info"):
-        st.session_state.show_debug = False
-        st.rerun()
-
-# Sidebar
-with st.sidebar:
-    st.header("📞 Company Information")
-    st.info(f"""
-    **{COMPANY_INFO['name']}**
-    
-    📧 **Email:** {COMPANY_INFO['email']}
-    📞 **Phone:** {COMPANY_INFO['phone']}
-    
-    🕒 **Hours:** Mon-Fri, 9 AM - 6 PM EST
-    """)
-    
-    st.header("📊 System Status")
-    total_docs = len(documents)
-    pdf_docs = len([d for d in documents if d["type"] == "pdf"])
-    text_docs = len([d for d in documents if d["type"] == "text"])
-    total_pages = sum(d["pages"] for d in documents)
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Total Docs", total_docs)
-        st.metric("PDF Files", pdf_docs)
-    with col2:
-        st.metric("Text Files", text_docs)
-        st.metric("Total Pages", total_pages)
-    
-    with st.expander("📄 Document Details"):
-        for doc in documents:
-            icon = "📄" if doc["type"] == "pdf" else "📝"
-            st.write(f"{icon} **{doc['filename']}** ({doc['pages']} pages)")
-    
-    st.header("🔧 System Tools")
-    
-    if st.button("🔄 Reload Documents", use_container_width=True):
-        st.session_state.documents_loaded = False
-        st.rerun()
-    
-    if st.button("🔍 Show Debug Info", use_container_width=True):
-        st.session_state.show_debug = True
-        st.rerun()
-    
-    st.header("🎫 Actions")
-    if st.button("Create Support Ticket", use_container_width=True):
-        st.session_state.show_ticket_form = True
-    
-    if st.button("Clear Chat History", use_container_width=True):
-        st.session_state.messages = []
-        st.rerun()
-
-# Main chat area
-st.header("💬 Chat Assistant")
-
-# Display messages
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
-        if message.get("sources"):
-            with st.expander("📚 Sources"):
-                for source in message["sources"]:
-                    icon = "📄" if source.get("type") == "pdf" else "📝"
-                    st.markdown(f"{icon} **{source['filename']}** (Page {source['page']})")
-
-# Chat input
-if prompt := st.chat_input("Ask me anything about our products and services..."):
-    # Add user message
-    st.session_state.messages.append({"role": "user", "content": prompt})
-    
-    with st.chat_message("user"):
-        st.markdown(prompt)
-    
-    # Generate response
-    with st.chat_message("assistant"):
-        with st.spinner("🔍 Searching..."):
-            search_results = search_documents(prompt, documents)
-            response = generate_response(prompt, search_results)
-        
-        st.markdown(response["answer"])
-        
-        if response.get("sources"):
-            with st.expander("📚 Sources"):
-                for source in response["sources"]:
-                    icon = "📄" if source.get("type") == "pdf" else "📝"
-                    st.markdown(f"{icon} **{source['filename']}** (Page {source['page']})")
-        
-        # Suggest ticket creation if no results
-        if not response.get("sources"):
-            if st.button("🎫 Create Ticket for This Question"):
-                st.session_state.show_ticket_form = True
-                st.session_state.ticket_question = prompt
-    
-    # Add assistant message
-    st.session_state.messages.append({
-        "role": "assistant",
-        "content": response["answer"],
-        "sources": response.get("sources", [])
-    })
-    st.rerun()
-
-# Ticket form
-if st.session_state.show_ticket_form:
-    st.header("🎫 Create Support Ticket")
-    
-    with st.form("ticket_form"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            name = st.text_input("Your Name *", placeholder="John Doe")
-            email = st.text_input("Your Email *", placeholder="john@example.com")
-        
-        with col2:
-            title = st.text_input("Ticket Title *", 
-                                value=st.session_state.get("ticket_question", ""),
-                                placeholder="Brief description")
-        
-        description = st.text_area("Detailed Description *", 
-                                 height=150,
-                                 placeholder="Describe your issue in detail...")
-        
-        col_submit, col_cancel = st.columns([1, 1])
-        
-        with col_submit:
-            submitted = st.form_submit_button("🚀 Create Ticket")
-        
-        with col_cancel:
-            cancelled = st.form_submit_button("❌ Cancel")
-        
-        if submitted:
-            if name and email and title and description:
-                ticket_data = {
-                    "name": name,
-                    "email": email,
-                    "title": title,
-                    "description": description,
-                    "created_at": datetime.now().isoformat()
-                }
-                
-                result = create_ticket(ticket_data)
-                
-                if result["success"]:
-                    st.success(f"✅ Ticket created successfully!")
-                    st.info(f"**Ticket ID:** {result['ticket_id']}")
-                    st.info(f"**Platform:** {result['platform']}")
-                    
-                    st.session_state.show_ticket_form = False
-                    if "ticket_question" in st.session_state:
-                        del st.session_state.ticket_question
-                    st.rerun()
-                else:
-                    st.error(f"❌ Error: {result.get('error')}")
-            else:
-                st.error("⚠️ Please fill in all required fields.")
-        
-        if cancelled:
-            st.session_state.show_ticket_form = False
-            if "ticket_question" in st.session_state:
-                del st.session_state.ticket_question
-            st.rerun()
-
-# Footer
-st.markdown("---")
-st.markdown("**AI Customer Support System** - Capstone Project for Advanced Generative AI")
-
-# Show created tickets for demo
-if "tickets" in st.session_state and st.session_state.tickets:
-    with st.expander(f"📋 Created Tickets ({len(st.session_state.tickets)})"):
-        for ticket in st.session_state.tickets[-3:]:
-            st.write(f"**{ticket['ticket_id']}** - {ticket['title']}")
+import streamlit as st
+import os
+import hashlib
+from datetime import datetime
+from functools import partial
+from src.archive_reader import is_archive, iter_archive_members, member_filename
+from src.index_artifact import prebuilt_documents
+from src.ingest_manifest import CORPUS_MANIFEST_PATH, IngestManifest
+from src.ingestion_report import IngestionReport
+from src.inverted_index import rank_pages, tokenize
+from src.live_corpus import LiveCorpus, load_priority
+from src.page_cache import read_pdf_pages
+from src.query_cache import search_cache
+from src.paged_document import PagedDocument
+from src.text_normalizer import normalize_query
+from src.upload_worker import UploadWorker
+
+# ВАЖНО: st.set_page_config должен быть ПЕРВОЙ командой Streamlit
+st.set_page_config(
+    page_title="AI Customer Support System",
+    page_icon="🤖",
+    layout="wide"
+)
+
+# Files in the app directory that are not documents
+NON_DOCUMENT_FILES = ['requirements.txt', 'runtime.txt']
+
+# Uploaded documents are kept apart from the bundled ones
+UPLOAD_DIR = os.path.join("data", "uploads")
+
+# Company configuration
+COMPANY_INFO = {
+    "name": "TechCorp Solutions",
+    "email": "support@techcorp.com",
+    "phone": "+1-800-TECH-HELP"
+}
+
+def create_ticket(ticket_data):
+    """Create a support ticket (demo version)"""
+    try:
+        ticket_id = f"TICKET-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        
+        if "tickets" not in st.session_state:
+            st.session_state.tickets = []
+        
+        ticket_record = {
+            "ticket_id": ticket_id,
+            "name": ticket_data['name'],
+            "email": ticket_data['email'],
+            "title": ticket_data['title'],
+            "description": ticket_data['description'],
+            "created_at": ticket_data['created_at']
+        }
+        
+        st.session_state.tickets.append(ticket_record)
+        
+        return {
+            "success": True,
+            "ticket_id": ticket_id,
+            "platform": "Demo System"
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def process_pdf_file(file_path, filename, show_debug=False, report=None, manifest=None, data=None):
+    """Process PDF file with optional debugging
+    
+    Pages that fail or go over their extraction budget are skipped and
+    recorded in report. The fastest extractor for the file is remembered in
+    manifest. data holds the PDF bytes of an archive member.
+    """
+    def on_error(page_num, e):
+        if report:
+            report.skip_page(filename, page_num, str(e))
+        if show_debug:
+            st.warning(f"⚠️ Skipped page {page_num} of {filename}: {str(e)}")
+    
+    try:
+        file_size = os.path.getsize(file_path) if data is None else len(data)
+        if file_size == 0:
+            if show_debug:
+                st.error(f"❌ File {filename} is empty (0 bytes)")
+            return None
+        
+        # Page texts come from the shared on-disk cache when the PDF is unchanged
+        page_texts = read_pdf_pages(file_path if data is None else data,
+                                    on_error=on_error, manifest=manifest)
+        total_pages = len(page_texts)
+        
+        if show_debug:
+            st.info(f"📄 PDF {filename} has {total_pages} pages, size: {file_size} bytes")
+        
+        if total_pages == 0:
+            if show_debug:
+                st.warning(f"⚠️ PDF {filename} has no pages")
+            return None
+        
+        pdf_doc = PagedDocument(
+            filename,
+            "pdf",
+            total_pages,
+            [
+                (page_num, page_text)
+                for page_num, page_text in enumerate(page_texts, 1)
+                if page_text and page_text.strip()
+            ]
+        )
+        
+        if show_debug:
+            st.info(f"📝 Extracted text from {len(pdf_doc)}/{total_pages} pages, {len(pdf_doc.text)} chars")
+        
+        if len(pdf_doc):
+            return pdf_doc
+        else:
+            if show_debug:
+                st.warning(f"⚠️ No readable text found in PDF {filename}")
+            return None
+                    
+    except ImportError:
+        if show_debug:
+            st.error("❌ No PDF extractor available (install PyPDF2 or pdfplumber)")
+        return None
+    except Exception as e:
+        if report:
+            report.fail_file(filename, str(e))
+        if show_debug:
+            st.error(f"❌ Error processing PDF {filename}: {str(e)}")
+        return None
+
+def load_archive(file_path, filename, show_debug=False, report=None, manifest=None,
+                 previous=None, corpus=None):
+    """Load the PDF and text files inside a zip or tar archive without unpacking it
+    
+    Every member is a document named by its path inside the archive. Members
+    whose content hash matches the manifest are reused from previous.
+    """
+    documents = []
+    member_paths = []
+    previous = previous or {}
+    
+    for member_name, data in iter_archive_members(file_path, ('.pdf', '.txt')):
+        if corpus and corpus.cancelled:
+            break
+        
+        member_path = os.path.join(file_path, member_name)
+        doc_name = member_filename(filename, member_name)
+        member_paths.append(member_path)
+        sha256 = hashlib.sha256(data).hexdigest()
+        
+        if doc_name in previous and manifest.is_member_unchanged(member_path, sha256):
+            loaded_doc = previous[doc_name]
+        elif member_name.lower().endswith('.pdf'):
+            if show_debug:
+                st.markdown(f"**Processing: {doc_name}**")
+            loaded_doc = process_pdf_file(member_path, doc_name, show_debug, report, manifest, data)
+            if loaded_doc and report:
+                report.record_file(doc_name, loaded_doc.pages)
+        else:
+            try:
+                content = data.decode('utf-8')
+                loaded_doc = PagedDocument.from_text(doc_name, content) if content.strip() else None
+            except UnicodeDecodeError as e:
+                loaded_doc = None
+                if show_debug:
+                    st.error(f"❌ Error processing {doc_name}: {str(e)}")
+        
+        if loaded_doc:
+            documents.append(loaded_doc)
+            manifest.record_member(file_path, member_path, len(data), sha256)
+            if show_debug:
+                st.success(f"✅ Loaded from archive: {doc_name}")
+            if corpus:
+                corpus.replace(loaded_doc)
+    
+    if not (corpus and corpus.cancelled):
+        manifest.prune_members(file_path, member_paths)
+    return documents
+
+def load_documents_from_root(show_debug=False, previous_documents=None, corpus=None):
+    """Load documents from the same directory as app.py and from UPLOAD_DIR
+    
+    Files that match the ingestion manifest are reused from previous_documents
+    instead of being extracted again. Files are loaded FAQ first, then by
+    size; with a LiveCorpus each document is published as soon as it is
+    loaded so search can use it while the rest is still pending. Zip and tar
+    archives are read member by member, see load_archive. Files that are
+    unchanged since an index artifact was built (python -m src.build_index)
+    are taken from the artifact instead of being parsed.
+    """
+    documents = []
+    current_dir = "."
+    manifest = IngestManifest(CORPUS_MANIFEST_PATH)
+    report = IngestionReport()
+    previous = {doc.filename: doc for doc in previous_documents or []}
+    
+    try:
+        file_paths = {f: os.path.join(current_dir, f) for f in os.listdir(current_dir)}
+        if os.path.isdir(UPLOAD_DIR):
+            for f in os.listdir(UPLOAD_DIR):
+                file_paths.setdefault(f, os.path.join(UPLOAD_DIR, f))
+        all_files = list(file_paths)
+        
+        # Фильтровать файлы
+        pdf_files = [f for f in all_files if f.lower().endswith('.pdf')]
+        txt_files = [f for f in all_files if f.lower().endswith('.txt') and 
+                    f.lower() not in NON_DOCUMENT_FILES]
+        archive_files = [f for f in all_files if is_archive(f)]
+        
+        if show_debug:
+            st.header("🔍 Document Loading Debug Information")
+            st.info(f"📁 Directory: {os.path.abspath(current_dir)}")
+            st.info(f"📄 All files: {', '.join(sorted(all_files))}")
+            st.success(f"📄 PDF files: {pdf_files if pdf_files else 'None found'}")
+            st.success(f"📝 TXT files: {txt_files if txt_files else 'None found'}")
+            st.success(f"🗜️ Archives: {archive_files if archive_files else 'None found'}")
+        
+        pending = sorted(pdf_files + txt_files + archive_files,
+                         key=lambda f: load_priority(file_paths[f]))
+        if corpus:
+            corpus.set_pending(pending)
+        
+        prebuilt = prebuilt_documents(current_dir)
+        
+        # Unchanged files are available right away
+        for filename in list(pending):
+            file_path = file_paths[filename]
+            
+            if is_archive(filename):
+                members = [doc for name, doc in previous.items() if name.startswith(filename + "/")]
+                if members and manifest.is_unchanged(file_path):
+                    documents.extend(members)
+                    pending.remove(filename)
+                    if corpus:
+                        for doc in members:
+                            corpus.publish(doc.filename, doc)
+                        corpus.publish(filename)
+            elif filename in previous and manifest.is_unchanged(file_path):
+                documents.append(previous[filename])
+                pending.remove(filename)
+                if corpus:
+                    corpus.publish(filename, previous[filename])
+            
+            if filename in prebuilt and filename in pending:
+                documents.extend(prebuilt[filename])
+                pending.remove(filename)
+                manifest.record(file_path)
+                if show_debug:
+                    st.success(f"✅ Loaded from index artifact: {filename}")
+                if corpus:
+                    for doc in prebuilt[filename]:
+                        corpus.publish(doc.filename, doc)
+                    corpus.publish(filename)
+        
+        for filename in pending:
+            if corpus and corpus.cancelled:
+                break
+            
+            file_path = file_paths[filename]
+            loaded_doc = None
+            
+            # Process archives member by member
+            if is_archive(filename):
+                try:
+                    documents.extend(load_archive(file_path, filename, show_debug, report, manifest,
+                                                  previous, corpus))
+                    if not (corpus and corpus.cancelled):
+                        manifest.record(file_path)
+                except Exception as e:
+                    report.fail_file(filename, str(e))
+                    if show_debug:
+                        st.error(f"❌ Error reading archive {filename}: {str(e)}")
+            
+            # Process PDF files
+            elif filename.lower().endswith('.pdf'):
+                if show_debug:
+                    st.markdown(f"**Processing: {filename}**")
+                
+                loaded_doc = process_pdf_file(file_path, filename, show_debug, report, manifest)
+                if loaded_doc:
+                    report.record_file(filename, loaded_doc.pages)
+                    if show_debug:
+                        st.success(f"✅ Successfully loaded: {filename}")
+            
+            # Process TXT files
+            else:
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                        if content.strip():
+                            loaded_doc = PagedDocument.from_text(filename, content)
+                            if show_debug:
+                                st.success(f"✅ Loaded text file: {filename}")
+                except Exception as e:
+                    if show_debug:
+                        st.error(f"❌ Error processing {filename}: {str(e)}")
+            
+            if loaded_doc:
+                documents.append(loaded_doc)
+                manifest.record(file_path)
+            if corpus:
+                corpus.publish(filename, loaded_doc)
+        
+        if show_debug:
+            st.markdown("---")
+            st.header("📊 Loading Summary")
+            total_loaded = len(documents)
+            pdf_loaded = len([d for d in documents if d.type == "pdf"])
+            txt_loaded = len([d for d in documents if d.type == "text"])
+            
+            st.success(f"✅ Total documents loaded: {total_loaded}")
+            st.info(f"📄 PDF documents: {pdf_loaded}")
+            st.info(f"📝 Text documents: {txt_loaded}")
+            
+            skipped = report.skipped_pages()
+            if skipped:
+                st.warning(f"⚠️ Skipped pages: {len(skipped)}")
+        
+        # Forget files that were deleted since the last load
+        existing_paths = [file_paths[f] for f in pdf_files + txt_files + archive_files]
+        manifest.prune(current_dir, existing_paths)
+        manifest.prune(UPLOAD_DIR, existing_paths)
+        manifest.save()
+        report.save()
+    
+    except Exception as e:
+        if show_debug:
+            st.error(f"❌ Error reading directory: {str(e)}")
+    
+    return documents
+
+def get_sample_documents():
+    """Get sample documents for the system"""
+    documents = [
+        PagedDocument.from_text(
+            "FAQ_Sample.txt",
+            """# Frequently Asked Questions
+
+## Account Management
+**Q: How do I reset my password?**
+A: To reset your password, go to the login page and click "Forgot Password". Enter your email address and follow the instructions sent to your email.
+
+**Q: How do I update my account information?**
+A: Log into your account, navigate to "Account Settings", update your information, and click "Save Changes".
+
+## Technical Support
+**Q: What are your business hours?**
+A: Our support team is available Monday-Friday, 9 AM to 6 PM EST. Emergency support is available 24/7 for critical issues.
+
+**Q: How can I contact technical support?**
+A: You can reach us at support@techcorp.com, call 1-800-TECH-HELP, or use our live chat feature.
+
+## Billing
+**Q: What is your refund policy?**
+A: We offer full refunds within 30 days of purchase. Contact billing@techcorp.com for refund requests.
+
+**Q: How do I upgrade my subscription?**
+A: Log into your account, go to the Billing section, select "Upgrade Plan", and choose your new plan.
+"""
+        )
+    ]
+    return documents
+
+def search_documents(query, documents, generation=None):
+    """Ranked keyword search through documents with correct page detection
+    
+    The query is normalized like the documents were at load time (see
+    src.text_normalizer) and looked up in each document's paragraph index
+    (see src.inverted_index): pages are ranked by BM25, so a query costs the
+    length of its posting lists instead of a scan of every page; only the
+    few pages shown are ever built (see rank_pages). Exact matches come
+    from the positional index, which also gives their offsets. Contexts
+    are cut from the original text through the document's offset map.
+    
+    With the generation of the documents (see LiveCorpus.snapshot), results
+    come from the shared query cache while that generation is current.
+    """
+    query_norm = normalize_query(query)
+    if generation is None:
+        return search_normalized(query_norm, documents)
+    return search_cache.get_or_compute(("documents", generation, query_norm),
+                                       partial(search_normalized, query_norm, documents))
+
+def search_normalized(query_norm, documents):
+    """search_documents for a query that is already normalized"""
+    query_terms = tokenize(query_norm)
+    # Short words are dropped before tokenizing, as the substring search did,
+    # so "24/7" still searches for its terms "24" and "7"
+    query_words = list(dict.fromkeys(
+        term for word in query_norm.split() if len(word) > 2 for term in tokenize(word)
+    ))
+    if not query_words:
+        return []
+    
+    # Специальная проверка для точного поиска (например, "Essay#288"):
+    # фраза ищется по позициям слов, затем ранжируются только её страницы
+    phrases = {}
+    for doc in documents:
+        doc_phrases = doc.search_index.find_phrase(query_terms)
+        if doc_phrases:
+            phrases[id(doc)] = doc_phrases
+    
+    # Если есть точные совпадения, показываем до 5 страниц где они найдены
+    if phrases:
+        return [
+            page_result(hit, len(query_terms), phrases[id(hit.doc)][hit.index])
+            for hit in rank_pages(documents, query_words, 5, pages=phrases)
+        ]
+    
+    return [page_result(hit) for hit in rank_pages(documents, query_words, 3)]
+
+def page_result(hit, phrase_length=0, match=None):
+    """Search result of a ranked page, quoting the phrase match or its best paragraph"""
+    doc = hit.doc
+    exact_match = match is not None
+    if exact_match:
+        paragraph, ordinal = match
+        start, end = doc.search_index.term_span(doc.normalized_page(hit.index), paragraph, ordinal, phrase_length)
+        context = exact_context(doc, hit.index, start, end)
+    else:
+        context = doc.paragraph_text(hit.paragraph, 600)
+    
+    return {
+        "filename": doc.filename,
+        "content": context,
+        "page": doc.page_numbers[hit.index],
+        "type": doc.type,
+        "matches": hit.term_count + (10 if exact_match else 0),  # Бонус за точное совпадение
+        "score": hit.score,
+        "exact_match": exact_match
+    }
+
+def exact_context(doc, index, start, end):
+    """Original text around the match at [start, end) of a normalized page"""
+    page_text = doc.page_text(index)
+    pos, _ = doc.original_span(index, start, end)
+    start = max(0, pos - 200)
+    end = min(len(page_text), pos + 400)
+    context = page_text[start:end].strip()
+    if start > 0:
+        context = "..." + context
+    if end < len(page_text):
+        context = context + "..."
+    return context
+
+def generate_response(query, search_results):
+    """Generate response based on search results"""
+    if not search_results:
+        return {
+            "answer": f"I couldn't find specific information about '{query}' in our documentation.\n\nI'd be happy to help you create a support ticket so our team can provide detailed assistance.\n\nContact us:\n📧 {COMPANY_INFO['email']}\n📞 {COMPANY_INFO['phone']}",
+            "sources": []
+        }
+    
+    # Проверяем, есть ли точные совпадения
+    exact_matches = [r for r in search_results if r.get("exact_match", False)]
+    
+    if exact_matches:
+        # Если есть точные совпадения, показываем их все
+        if len(exact_matches) == 1:
+            result = exact_matches[0]
+            response = f"I found an exact match for '{query}' in our documentation:\n\n"
+            response += f"📄 **{result['filename']}** (Page {result['page']})\n\n"
+            response += f"{result['content']}\n\n"
+        else:
+            response = f"I found {len(exact_matches)} exact matches for '{query}' in our documentation:\n\n"
+            for idx, result in enumerate(exact_matches, 1):
+                response += f"**Match {idx}:** 📄 {result['filename']} (Page {result['page']})\n"
+                response += f"{result['content']}\n\n"
+                if idx < len(exact_matches):
+                    response += "---\n\n"
+    else:
+        # Если точных совпадений нет, показываем наиболее релевантные результаты
+        result = search_results[0]
+        response = f"Based on our documentation, here's what I found related to '{query}':\n\n"
+        response += f"{result['content']}\n\n"
+        
+        if len(search_results) > 1:
+            response += "**Other relevant information:**\n"
+            for res in search_results[1:]:
+                response += f"- 📄 {res['filename']} (Page {res['page']})\n"
+            response += "\n"
+    
+    response += f"For additional assistance, contact us at {COMPANY_INFO['email']} or {COMPANY_INFO['phone']}."
+    
+    return {
+        "answer": response,
+        "sources": [{"filename": res["filename"], "page": res["page"], "type": res["type"]} for res in search_results]
+    }
+
+# Main application
+st.title("🤖 AI Customer Support System")
+st.markdown(f"Welcome to **{COMPANY_INFO['name']}** - Your AI-powered support assistant!")
+
+# Initialize session state
+if "messages" not in st.session_state:
+    st.session_state.messages = []
+if "show_ticket_form" not in st.session_state:
+    st.session_state.show_ticket_form = False
+if "documents_loaded" not in st.session_state:
+    st.session_state.documents_loaded = False
+if "corpus" not in st.session_state:
+    st.session_state.corpus = None
+if "show_debug" not in st.session_state:
+    st.session_state.show_debug = False
+
+def start_loading(previous_documents):
+    """Load documents in a background thread, publishing each one as it is ready"""
+    def loader(corpus):
+        # Load documents without showing debug info
+        root_docs = load_documents_from_root(show_debug=False,
+                                             previous_documents=previous_documents,
+                                             corpus=corpus)
+        
+        if not root_docs and not corpus.cancelled:
+            for doc in get_sample_documents():
+                corpus.publish(doc.filename, doc)
+    
+    corpus = LiveCorpus()
+    corpus.start(loader)
+    return corpus
+
+def ingest_upload(file_path, status, target):
+    """Worker-thread handler for an uploaded file: load it and add it to the live corpus
+    
+    target["corpus"] is the corpus the page currently shows, so an upload that
+    finishes after a reload lands in the new one.
+    """
+    filename = os.path.basename(file_path)
+    manifest = IngestManifest(CORPUS_MANIFEST_PATH)
+    report = IngestionReport()
+    
+    status.state = "extracting"
+    if is_archive(filename):
+        documents = load_archive(file_path, filename, report=report, manifest=manifest,
+                                 corpus=target["corpus"])
+    elif filename.lower().endswith('.pdf'):
+        loaded_doc = process_pdf_file(file_path, filename, report=report, manifest=manifest)
+        documents = [loaded_doc] if loaded_doc else []
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        documents = [PagedDocument.from_text(filename, content)] if content.strip() else []
+    
+    if not documents:
+        raise ValueError(report.files.get(filename, {}).get("error") or "No readable text found")
+    
+    # Archive members were added as they were read
+    status.state = "indexing"
+    status.chunks = len(documents)
+    if not is_archive(filename):
+        target["corpus"].replace(documents[0])
+    status.indexed = len(documents)
+    
+    manifest.record(file_path)
+    manifest.save()
+
+# Load documents in the background on first run; the page renders right away
+# and search uses whatever has been loaded so far
+if not st.session_state.documents_loaded:
+    previous_corpus = st.session_state.corpus
+    if previous_corpus:
+        previous_corpus.cancel()
+    
+    st.session_state.corpus = start_loading(previous_corpus.documents() if previous_corpus else [])
+    st.session_state.documents_loaded = True
+
+corpus = st.session_state.corpus
+documents = corpus.documents()
+pending_documents = corpus.pending()
+
+# Uploads are saved to UPLOAD_DIR, under a new name if a document already has theirs,
+# and loaded by a worker thread
+if "upload_worker" not in st.session_state:
+    st.session_state.upload_target = {}
+    st.session_state.upload_worker = UploadWorker(
+        partial(ingest_upload, target=st.session_state.upload_target),
+        upload_dir=UPLOAD_DIR,
+        extensions=('.pdf', '.txt', '.zip', '.tar.gz', '.tgz', '.tar'),
+        reserved_dirs=(".",)
+    )
+    st.session_state.submitted_uploads = set()
+st.session_state.upload_target["corpus"] = corpus
+upload_worker = st.session_state.upload_worker
+
+# Show debug information if requested
+if st.session_state.show_debug:
+    st.markdown("---")
+    load_documents_from_root(show_debug=True)
+    st.markdown("---")
+    
+    if st.button("❌ Hide Debug Info"):
+        st.session_state.show_debug = False
+        st.rerun()
+
+# Sidebar
+with st.sidebar:
+    st.header("📞 Company Information")
+    st.info(f"""
+    **{COMPANY_INFO['name']}**
+    
+    📧 **Email:** {COMPANY_INFO['email']}
+    📞 **Phone:** {COMPANY_INFO['phone']}
+    
+    🕒 **Hours:** Mon-Fri, 9 AM - 6 PM EST
+    """)
+    
+    st.header("📊 System Status")
+    total_docs = len(documents)
+    pdf_docs = len([d for d in documents if d.type == "pdf"])
+    text_docs = len([d for d in documents if d.type == "text"])
+    total_pages = sum(d.pages for d in documents)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Docs", total_docs)
+        st.metric("PDF Files", pdf_docs)
+    with col2:
+        st.metric("Text Files", text_docs)
+        st.metric("Total Pages", total_pages)
+    
+    cache_stats = search_cache.stats()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Cache Hits", cache_stats["hits"])
+    with col2:
+        st.metric("Cache Misses", cache_stats["misses"])
+    
+    with st.expander("📄 Document Details"):
+        for doc in documents:
+            icon = "📄" if doc.type == "pdf" else "📝"
+            st.write(f"{icon} **{doc.filename}** ({doc.pages} pages)")
+    
+    if corpus.loading:
+        if pending_documents:
+            st.warning(f"⏳ Loading documents... {len(pending_documents)} pending")
+        else:
+            st.warning("⏳ Loading documents...")
+        for filename in pending_documents:
+            st.caption(f"⏳ {filename}")
+        if st.button("🔄 Refresh Status", use_container_width=True):
+            st.rerun()
+    
+    st.header("📤 Upload Documents")
+    uploaded_files = st.file_uploader(
+        "Add PDF, TXT or ZIP/TAR files",
+        type=["pdf", "txt", "zip", "gz", "tgz", "tar"],
+        accept_multiple_files=True
+    )
+    for uploaded_file in uploaded_files or []:
+        # Streamlit hands back the same files on every rerun
+        if uploaded_file.file_id in st.session_state.submitted_uploads:
+            continue
+        st.session_state.submitted_uploads.add(uploaded_file.file_id)
+        if uploaded_file.name.lower() in NON_DOCUMENT_FILES:
+            st.error(f"❌ {uploaded_file.name} is reserved for the app itself")
+            continue
+        try:
+            upload_worker.submit(uploaded_file.name, uploaded_file.getvalue())
+        except (ValueError, OSError) as e:
+            st.error(f"❌ Could not save {uploaded_file.name}: {str(e)}")
+    
+    for status in upload_worker.statuses():
+        if status.state == "failed":
+            st.error(f"❌ {status.filename}: {status.error}")
+        elif status.state == "done":
+            st.success(f"✅ {status.filename} is searchable")
+        else:
+            st.progress(status.progress, text=f"⏳ {status.filename}: {status.state}")
+    
+    if upload_worker.busy:
+        if st.button("🔄 Refresh Uploads", use_container_width=True):
+            st.rerun()
+    elif upload_worker.statuses():
+        if st.button("Clear Upload List", use_container_width=True):
+            upload_worker.clear_finished()
+            st.rerun()
+    
+    st.header("🔧 System Tools")
+    
+    if st.button("🔄 Reload Documents", use_container_width=True):
+        st.session_state.documents_loaded = False
+        st.rerun()
+    
+    if st.button("🔍 Show Debug Info", use_container_width=True):
+        st.session_state.show_debug = True
+        st.rerun()
+    
+    st.header("🎫 Actions")
+    if st.button("Create Support Ticket", use_container_width=True):
+        st.session_state.show_ticket_form = True
+    
+    if st.button("Clear Chat History", use_container_width=True):
+        st.session_state.messages = []
+        st.rerun()
+
+# Main chat area
+st.header("💬 Chat Assistant")
+
+# Display messages
+for message in st.session_state.messages:
+    with st.chat_message(message["role"]):
+        st.markdown(message["content"])
+        if message.get("sources"):
+            with st.expander("📚 Sources"):
+                for source in message["sources"]:
+                    icon = "📄" if source.get("type") == "pdf" else "📝"
+                    st.markdown(f"{icon} **{source['filename']}** (Page {source['page']})")
+
+# Chat input
+if prompt := st.chat_input("Ask me anything about our products and services..."):
+    # Add user message
+    st.session_state.messages.append({"role": "user", "content": prompt})
+    
+    with st.chat_message("user"):
+        st.markdown(prompt)
+    
+    # Generate response
+    with st.chat_message("assistant"):
+        with st.spinner("🔍 Searching..."):
+            # Search whatever the background loader has published by now
+            generation, published = corpus.snapshot()
+            search_results = search_documents(prompt, published, generation)
+            response = generate_response(prompt, search_results)
+        
+        still_pending = corpus.pending()
+        if still_pending:
+            response["answer"] += f"\n\n_⏳ Still loading: {', '.join(still_pending)}. Results may be incomplete._"
+        
+        st.markdown(response["answer"])
+        
+        if response.get("sources"):
+            with st.expander("📚 Sources"):
+                for source in response["sources"]:
+                    icon = "📄" if source.get("type") == "pdf" else "📝"
+                    st.markdown(f"{icon} **{source['filename']}** (Page {source['page']})")
+        
+        # Suggest ticket creation if no results
+        if not response.get("sources"):
+            if st.button("🎫 Create Ticket for This Question"):
+                st.session_state.show_ticket_form = True
+                st.session_state.ticket_question = prompt
+    
+    # Add assistant message
+    st.session_state.messages.append({
+        "role": "assistant",
+        "content": response["answer"],
+        "sources": response.get("sources", [])
+    })
+    st.rerun()
+
+# Ticket form
+if st.session_state.show_ticket_form:
+    st.header("🎫 Create Support Ticket")
+    
+    with st.form("ticket_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            name = st.text_input("Your Name *", placeholder="John Doe")
+            email = st.text_input("Your Email *", placeholder="john@example.com")
+        
+        with col2:
+            title = st.text_input("Ticket Title *", 
+                                value=st.session_state.get("ticket_question", ""),
+                                placeholder="Brief description")
+        
+        description = st.text_area("Detailed Description *", 
+                                 height=150,
+                                 placeholder="Describe your issue in detail...")
+        
+        col_submit, col_cancel = st.columns([1, 1])
+        
+        with col_submit:
+            submitted = st.form_submit_button("🚀 Create Ticket")
+        
+        with col_cancel:
+            cancelled = st.form_submit_button("❌ Cancel")
+        
+        if submitted:
+            if name and email and title and description:
+                ticket_data = {
+                    "name": name,
+                    "email": email,
+                    "title": title,
+                    "description": description,
+                    "created_at": datetime.now().isoformat()
+                }
+                
+                result = create_ticket(ticket_data)
+                
+                if result["success"]:
+                    st.success(f"✅ Ticket created successfully!")
+                    st.info(f"**Ticket ID:** {result['ticket_id']}")
+                    st.info(f"**Platform:** {result['platform']}")
+                    
+                    st.session_state.show_ticket_form = False
+                    if "ticket_question" in st.session_state:
+                        del st.session_state.ticket_question
+                    st.rerun()
+                else:
+                    st.error(f"❌ Error: {result.get('error')}")
+            else:
+                st.error("⚠️ Please fill in all required fields.")
+        
+        if cancelled:
+            st.session_state.show_ticket_form = False
+            if "ticket_question" in st.session_state:
+                del st.session_state.ticket_question
+            st.rerun()
+
+# Footer
+st.markdown("---")
+st.markdown("**AI Customer Support System** - Capstone Project for Advanced Generative AI")
+
+# Show created tickets for demo
+if "tickets" in st.session_state and st.session_state.tickets:
+    with st.expander(f"📋 Created Tickets ({len(st.session_state.tickets)})"):
+        for ticket in st.session_state.tickets[-3:]:
+            st.write(f"**{ticket['ticket_id']}** - {ticket['title']}")
             st.caption(f"By: {ticket['name']} ({ticket['email']})")
\ No newline at end of file
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark document ingestion throughput on a synthetic corpus
+
+Each stage runs on each generated document in a fresh process, so peak RSS
+is per stage, and with an empty page cache, so extraction is really timed.
+Results are written as JSON for comparing releases.
+"""
+
+import os
+import sys
+import ast
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_corpus import generate_corpus, MIN_PAGES, MAX_PAGES
+
+STAGES = [
+    "app_process_pdf_file",
+    "processor_process_pdf",
+    "processor_alt_process_pdf",
+    "processor_alt_process_txt",
+    "chunking",
+    "dedup",
+    "vector_store_add_documents",
+]
+
+def load_app_functions(path: str = os.path.join(ROOT, "app.py")) -> dict:
+    """Execute only the imports, constants and functions of a Streamlit app
+
+    The apps build their UI at import time, so importing them is not an
+    option outside `streamlit run`.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    tree.body = [
+        node for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef))
+        or (isinstance(node, ast.Assign) and all(isinstance(t, ast.Name) and t.id.isupper() for t in node.targets))
+    ]
+    namespace = {"__name__": "app_functions"}
+    exec(compile(tree, path, "exec"), namespace)
+    return namespace
+
+def _use_fresh_page_cache(cache_dir: str):
+    import src.page_cache as page_cache
+    page_cache._default_cache = page_cache.PageCache(cache_dir)
+
+def _extract_chunks(file_path: str):
+    """Chunks of a PDF with extraction done up front, for the stages after it"""
+    from src.document_processor import DocumentProcessor
+
+    processor = DocumentProcessor(dedup_threshold=0)
+    return processor._process_pdf(file_path, os.path.basename(file_path), None)
+
+def run_stage(stage: str, file_path: str, work_dir: str, pages: int) -> dict:
+    """Time one stage on one file inside the current process
+
+    Rates are per generated page, since text files are ingested as a single
+    page and chunking skips pages without text.
+    """
+    filename = os.path.basename(file_path)
+    _use_fresh_page_cache(os.path.join(work_dir, "page_cache"))
+    chunks = None
+
+    if stage == "app_process_pdf_file":
+        process_pdf_file = load_app_functions()["process_pdf_file"]
+        started = time.perf_counter()
+        process_pdf_file(file_path, filename)
+        elapsed = time.perf_counter() - started
+
+    elif stage == "processor_process_pdf":
+        from src.document_processor import DocumentProcessor
+
+        processor = DocumentProcessor()
+        started = time.perf_counter()
+        result = processor._process_pdf(file_path, filename, None)
+        elapsed = time.perf_counter() - started
+        chunks = len(result)
+
+    elif stage in ("processor_alt_process_pdf", "processor_alt_process_txt"):
+        from src.document_processor_alt import DocumentProcessor
+        from src.ingest_manifest import IngestManifest
+
+        processor = DocumentProcessor()
+        processor.manifest = IngestManifest(os.path.join(work_dir, "manifest.json"))
+        process = processor._process_pdf if stage.endswith("pdf") else processor._process_txt
+        started = time.perf_counter()
+        result = process(file_path, filename)
+        elapsed = time.perf_counter() - started
+        chunks = len(result)
+
+    elif stage == "chunking":
+        from src.document_processor import DocumentProcessor
+        from src.page_cache import read_pdf_pages
+
+        processor = DocumentProcessor()
+        page_texts = read_pdf_pages(file_path)
+        started = time.perf_counter()
+        result = processor._chunk_pages(page_texts, filename, file_path)
+        elapsed = time.perf_counter() - started
+        chunks = len(result)
+
+    elif stage == "dedup":
+        from src.chunk_dedup import deduplicate_chunks
+
+        extracted = _extract_chunks(file_path)
+        started = time.perf_counter()
+        deduplicate_chunks(extracted)
+        elapsed = time.perf_counter() - started
+        chunks = len(extracted)
+
+    elif stage == "vector_store_add_documents":
+        import src.vector_store as vector_store
+
+        extracted = _extract_chunks(file_path)
+        vector_store.VECTOR_DB_PATH = os.path.join(work_dir, "vector_db")
+        store = vector_store.VectorStore()
+        started = time.perf_counter()
+        store.add_documents(extracted)
+        elapsed = time.perf_counter() - started
+        chunks = len(extracted)
+
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "stage": stage,
+        "file": filename,
+        "pages": pages,
+        "chunks": chunks,
+        "seconds": round(elapsed, 4),
+        "pages_per_sec": round(pages / elapsed, 2) if elapsed else None,
+        "chunks_per_sec": round(chunks / elapsed, 2) if chunks is not None and elapsed else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20, 1),
+        "peak_child_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale / 2**20, 1),
+    }
+
+def run_in_subprocess(stage: str, file_path: str, pages: int) -> dict:
+    with tempfile.TemporaryDirectory() as work_dir:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--stage", stage,
+             "--file", file_path, "--work-dir", work_dir, "--pages", str(pages)],
+            cwd=ROOT, capture_output=True, text=True
+        )
+    # The stage prints its progress; the result is the last line
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        error = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+        return {"stage": stage, "file": os.path.basename(file_path), "error": error}
+    return json.loads(lines[-1])
+
+def run_benchmark(page_counts, stages, corpus_dir=None) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_dir = corpus_dir or tmp_dir
+        paths = generate_corpus(corpus_dir, page_counts)
+        # generate_corpus writes a PDF and a text file per page count
+        file_pages = [pages for pages in page_counts for _ in range(2)]
+
+        results = []
+        for stage in stages:
+            extension = ".txt" if stage.endswith("_txt") else ".pdf"
+            for pages, path in zip(file_pages, paths):
+                if path.endswith(extension):
+                    result = run_in_subprocess(stage, path, pages)
+                    print(f"{stage:<30}{result['file']:<24}"
+                          f"{result.get('error') or str(result['pages_per_sec']) + ' pages/s'}",
+                          file=sys.stderr)
+                    results.append(result)
+
+    return {
+        "generated": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "page_counts": page_counts,
+        "results": results,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000],
+                        help=f"Page counts of the synthetic documents, {MIN_PAGES} to {MAX_PAGES}")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--corpus-dir", help="Keep the generated documents in this directory")
+    parser.add_argument("--output", help="Write the JSON results here instead of stdout")
+    parser.add_argument("--stage", choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage:
+        # Child process: run a single measurement
+        print(json.dumps(run_stage(args.stage, args.file, args.work_dir, args.pages[0])))
+        sys.exit(0)
+
+    try:
+        report = run_benchmark(args.pages, args.stages, args.corpus_dir)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    output = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
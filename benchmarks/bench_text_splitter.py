@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark RecursiveTextSplitter against langchain's RecursiveCharacterTextSplitter
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from config import CHUNK_SIZE, CHUNK_OVERLAP
+from src.text_splitter import RecursiveTextSplitter
+
+def sample_texts():
+    """Realistic page text plus the inputs that hurt the langchain splitter"""
+    paragraph = "Customers can request a refund within 30 days of purchase. " * 12
+    return {
+        "paragraphs": "\n\n".join([paragraph] * 2000),
+        "lines": "\n".join(["Order #1234 shipped to the customer"] * 20000),
+        "no_whitespace": "x" * 500000,
+    }
+
+def bundled_pages(docs_dir="data/documents"):
+    """Page texts of the bundled PDFs, {filename: [page text, ...]}"""
+    import src.page_cache as page_cache
+    if not os.path.isdir(docs_dir):
+        return {}
+
+    pages = {}
+    # Extract into a throwaway cache rather than the app's data/page_cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        page_cache._default_cache = page_cache.PageCache(cache_dir)
+        for filename in sorted(os.listdir(docs_dir)):
+            if filename.lower().endswith('.pdf'):
+                texts = page_cache.read_pdf_pages(os.path.join(docs_dir, filename))
+                pages[filename] = [text for text in texts if text.strip()]
+    return pages
+
+def best_of(func, text, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def each_page(func):
+    """Split page by page, the way DocumentProcessor chunks a PDF"""
+    def split_pages(pages):
+        for text in pages:
+            func(text)
+    return split_pages
+
+def run_benchmark():
+    reference = RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP, length_function=len
+    )
+    splitter = RecursiveTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+
+    print(f"{'input':<15}{'chars':>10}{'langchain':>12}{'offsets':>12}{'speedup':>10}")
+    for name, text in sample_texts().items():
+        reference_time = best_of(reference.split_text, text)
+        splitter_time = best_of(splitter.split_text, text)
+        print(f"{name:<15}{len(text):>10}{reference_time:>11.3f}s{splitter_time:>11.3f}s"
+              f"{reference_time / splitter_time:>9.1f}x")
+
+    # DocumentProcessor only asks for offsets (split_spans), see src.chunk_store
+    print()
+    print(f"{'bundled PDF':<30}{'pages':>7}{'langchain':>12}{'offsets':>12}{'spans':>12}{'speedup':>10}")
+    for filename, pages in bundled_pages().items():
+        reference_time = best_of(each_page(reference.split_text), pages, repeat=5)
+        splitter_time = best_of(each_page(splitter.split_text), pages, repeat=5)
+        spans_time = best_of(each_page(splitter.split_spans), pages, repeat=5)
+        print(f"{filename:<30}{len(pages):>7}{reference_time * 1000:>10.1f}ms{splitter_time * 1000:>10.1f}ms"
+              f"{spans_time * 1000:>10.1f}ms{reference_time / spans_time:>9.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic PDF and text documents of a given page count for benchmarks
+"""
+
+import os
+import sys
+import zlib
+import random
+import argparse
+from typing import List
+
+MIN_PAGES = 10
+MAX_PAGES = 5000
+
+WORDS = (
+    "account activation address amount application approval assistance backup balance "
+    "battery billing cable cancellation charge checkout configuration connection contract "
+    "customer delivery device discount display download driver email error exchange "
+    "firmware guarantee hardware installation invoice license login maintenance manual "
+    "network notification order package password payment policy power printer privacy "
+    "product purchase receipt refund registration repair replacement request reset return "
+    "router security service settings shipping software storage subscription support "
+    "system technician ticket troubleshooting update upgrade usage user warranty wireless"
+).split()
+
+LINES_PER_PAGE = 48
+LINE_WIDTH = 90
+
+def page_lines(rng: random.Random, page_num: int) -> List[str]:
+    """Lines of one page: a heading, then paragraphs of support-manual-like sentences"""
+    lines = [f"Section {page_num}: {rng.choice(WORDS).title()} {rng.choice(WORDS).title()}", ""]
+    line = ""
+    while len(lines) < LINES_PER_PAGE:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 16)))
+        sentence = sentence[0].upper() + sentence[1:] + "."
+        for word in sentence.split():
+            if len(line) + len(word) + 1 > LINE_WIDTH:
+                lines.append(line.rstrip())
+                line = ""
+            line += word + " "
+        # Roughly one paragraph break every five sentences
+        if rng.random() < 0.2:
+            lines.extend([line.rstrip(), ""])
+            line = ""
+    return lines[:LINES_PER_PAGE]
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_pdf(path: str, pages: int, seed: int = 0) -> None:
+    """Write a PDF with one text page per page number, without any PDF library"""
+    rng = random.Random(seed)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page objects are numbered
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    page_ids = []
+    for page_num in range(1, pages + 1):
+        body = "BT /F1 10 Tf 12 TL 50 790 Td\n" + "".join(
+            f"({_escape(line)}) Tj T*\n" for line in page_lines(rng, page_num)
+        ) + "ET"
+        stream = zlib.compress(body.encode("latin-1"))
+        objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream"
+                       % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                        f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>").encode())
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                % (len(objects) + 1, xref))
+
+def write_text(path: str, pages: int, seed: int = 0) -> None:
+    """Write a text file with the same kind of content, pages separated by blank lines"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for page_num in range(1, pages + 1):
+            f.write("\n".join(page_lines(rng, page_num)) + "\n\n")
+
+def generate_corpus(directory: str, page_counts: List[int], seed: int = 0) -> List[str]:
+    """Write synthetic_<pages>.pdf and synthetic_<pages>.txt for each page count"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for pages in page_counts:
+        if not MIN_PAGES <= pages <= MAX_PAGES:
+            raise ValueError(f"Page count must be between {MIN_PAGES} and {MAX_PAGES}: {pages}")
+        for extension, writer in ((".pdf", write_pdf), (".txt", write_text)):
+            path = os.path.join(directory, f"synthetic_{pages}{extension}")
+            writer(path, pages, seed)
+            paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("directory", help="Where to write the documents")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000],
+                        help=f"Page counts, {MIN_PAGES} to {MAX_PAGES}")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        for path in generate_corpus(args.directory, args.pages, args.seed):
+            print(f"Wrote {path} ({os.path.getsize(path)} bytes)")
+    except ValueError as e:
+        sys.exit(str(e))
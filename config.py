@@ -1,34 +1,61 @@
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# Company Information
-COMPANY_INFO = {
-    "name": "TechCorp Solutions",
-    "email": "support@techcorp.com", 
-    "phone": "+1-800-TECH-HELP"
-}
-
-# AI Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-MODEL_NAME = "gpt-3.5-turbo"
-EMBEDDING_MODEL = "text-embedding-ada-002"
-
-# Alternative: Use Hugging Face models for free deployment
-USE_HUGGINGFACE = os.getenv("USE_HUGGINGFACE", "true").lower() == "true"
-HF_MODEL_NAME = "microsoft/DialoGPT-medium"
-HF_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
-
-# Vector Store Configuration
-VECTOR_DB_PATH = "data/vector_db"
-CHUNK_SIZE = 1000
-CHUNK_OVERLAP = 200
-
-# GitHub Issues Configuration (for ticket system)
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-GITHUB_REPO = os.getenv("GITHUB_REPO", "your-username/support-tickets")
-
-# Chat Configuration  
-MAX_HISTORY_LENGTH = 10
+import os
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    # The Streamlit demo apps run without python-dotenv installed; settings
+    # then come from the environment and the defaults below
+    pass
+
+# Company Information
+COMPANY_INFO = {
+    "name": "TechCorp Solutions",
+    "email": "support@techcorp.com", 
+    "phone": "+1-800-TECH-HELP"
+}
+
+# AI Configuration
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+MODEL_NAME = "gpt-3.5-turbo"
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Alternative: Use Hugging Face models for free deployment
+USE_HUGGINGFACE = os.getenv("USE_HUGGINGFACE", "true").lower() == "true"
+HF_MODEL_NAME = "microsoft/DialoGPT-medium"
+HF_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Vector Store Configuration
+VECTOR_DB_PATH = "data/vector_db"
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+EMBED_BATCH_SIZE = 64
+
+# Document Ingestion Configuration
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", str(os.cpu_count() or 1)))
+INGEST_PAGES_PER_TASK = 16
+PAGE_CACHE_DIR = "data/page_cache"
+PAGE_TIMEOUT_SECONDS = int(os.getenv("PAGE_TIMEOUT_SECONDS", "30"))
+PAGE_MEMORY_LIMIT_MB = int(os.getenv("PAGE_MEMORY_LIMIT_MB", "1024"))
+INGEST_REPORT_PATH = "data/ingestion_report.json"
+EXTRACTOR_SAMPLE_PAGES = 3
+INGEST_CHECKPOINT_PATH = "data/ingest_checkpoint.json"
+INGEST_COMMIT_EVERY = 8  # Embedding batches between durable commits
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.85"))  # 0 keeps every chunk
+DEDUP_NUM_PERM = 64
+DEDUP_SHINGLE_SIZE = 3
+WATCH_DEBOUNCE_SECONDS = 2.0  # Quiet period before changed files are re-indexed
+WATCH_POLL_SECONDS = 2.0  # Used where inotify is not available
+INDEX_ARTIFACT_PATH = "data/index.artifact"  # Written by python -m src.build_index
+TEXT_BLOCK_CHARS = 16384  # Characters per zlib block of stored document and chunk text
+BM25_K1 = 1.2  # Keyword search: how quickly repeated terms stop adding to the score
+BM25_B = 0.75  # Keyword search: how much long paragraphs are penalized
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "256"))  # Cached search results; 0 disables the cache
+QUERY_CACHE_TTL_SECONDS = 600
+
+# GitHub Issues Configuration (for ticket system)
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_REPO = os.getenv("GITHUB_REPO", "your-username/support-tickets")
+
+# Chat Configuration  
+MAX_HISTORY_LENGTH = 10
 CONFIDENCE_THRESHOLD = 0.7
\ No newline at end of file
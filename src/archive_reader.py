@@ -0,0 +1,39 @@
+import tarfile
+import zipfile
+from typing import Iterator, Tuple
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar.gz', '.tgz', '.tar')
+
+def is_archive(filename: str) -> bool:
+    return filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+def member_filename(archive_filename: str, member_name: str) -> str:
+    """Document filename of an archive member: its path inside the archive"""
+    return f"{archive_filename}/{member_name}"
+
+def _clean_name(name: str) -> str:
+    # Member names are only used as labels, never as paths to write to
+    return "/".join(part for part in name.replace("\\", "/").split("/") if part not in ("", "."))
+
+def iter_archive_members(archive_path: str, extensions: Tuple[str, ...]) -> Iterator[Tuple[str, bytes]]:
+    """Yield (member path, contents) for regular members with one of the extensions
+
+    Members are read one at a time straight from the archive, so nothing is
+    unpacked to disk and only the current member is held in memory. Tar
+    archives, compressed or not, are read as a stream in archive order.
+    """
+    if archive_path.lower().endswith('.zip'):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                name = _clean_name(info.filename)
+                if info.is_dir() or not name.lower().endswith(extensions):
+                    continue
+                yield name, archive.read(info)
+        return
+
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for member in archive:
+            name = _clean_name(member.name)
+            if not member.isfile() or not name.lower().endswith(extensions):
+                continue
+            yield name, archive.extractfile(member).read()
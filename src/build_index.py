@@ -0,0 +1,113 @@
+import os
+import sys
+import pickle
+import argparse
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from config import INGEST_WORKERS, INDEX_ARTIFACT_PATH, HF_EMBEDDING_MODEL
+from src.archive_reader import is_archive, iter_archive_members, member_filename
+from src.document_processor import DocumentProcessor
+from src.extractors import PdfSource
+from src.index_artifact import IndexArtifact, write_artifact
+from src.ingest_manifest import file_sha256
+from src.page_cache import read_pdf_pages
+from src.paged_document import PagedDocument
+from src.vector_store import VectorStore
+
+# Text files next to the documents that the apps do not load as documents
+NON_DOCUMENT_FILES = ('requirements.txt', 'runtime.txt')
+
+def _paged_document(filename: str, source: PdfSource) -> Optional[PagedDocument]:
+    """The document the Streamlit app would build for a PDF or text file"""
+    if filename.lower().endswith('.pdf'):
+        page_texts = read_pdf_pages(source)
+        doc = PagedDocument(filename, "pdf", len(page_texts), [
+            (page_num, text) for page_num, text in enumerate(page_texts, 1) if text and text.strip()
+        ])
+    else:
+        if isinstance(source, bytes):
+            text = source.decode('utf-8')
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                text = f.read()
+        doc = PagedDocument.from_text(filename, text) if text.strip() else None
+    return doc if doc and len(doc) else None
+
+def app_documents(directory_path: str) -> Tuple[List[PagedDocument], Dict[str, str]]:
+    """Documents of every file the app loads from a directory, and the files' hashes
+
+    PDFs were just extracted by DocumentProcessor, so their pages come out of
+    the page cache instead of being parsed again.
+    """
+    documents = []
+    files = {}
+
+    for filename in sorted(os.listdir(directory_path)):
+        file_path = os.path.join(directory_path, filename)
+        is_text = filename.lower().endswith('.txt') and filename.lower() not in NON_DOCUMENT_FILES
+        if not os.path.isfile(file_path) or not (filename.lower().endswith('.pdf') or is_text or is_archive(filename)):
+            continue
+
+        try:
+            if is_archive(filename):
+                for member_name, data in iter_archive_members(file_path, ('.pdf', '.txt')):
+                    doc = _paged_document(member_filename(filename, member_name), data)
+                    if doc:
+                        documents.append(doc)
+            else:
+                doc = _paged_document(filename, file_path)
+                if doc:
+                    documents.append(doc)
+            files[filename] = file_sha256(file_path)
+        except Exception as e:
+            print(f"Error reading {filename} for the app documents: {str(e)}")
+
+    return documents, files
+
+def build_index(directory_path: str, output_path: str = INDEX_ARTIFACT_PATH,
+                workers: int = INGEST_WORKERS) -> IndexArtifact:
+    """Run DocumentProcessor -> VectorStore headlessly and write an index artifact
+
+    The artifact holds the FAISS index, the chunks and the app's page texts,
+    so a deployment loads it at startup instead of parsing and embedding.
+    The local vector store is not touched: the index is built in a
+    temporary directory.
+    """
+    processor = DocumentProcessor(workers=workers)
+
+    with tempfile.TemporaryDirectory() as faiss_path:
+        vector_store = VectorStore(faiss_path=faiss_path)
+        total = vector_store.add_documents_stream(processor.iter_documents(directory_path))
+        sections = vector_store.artifact_sections()
+
+    documents, files = app_documents(directory_path)
+    sections["documents"] = pickle.dumps(documents, protocol=pickle.HIGHEST_PROTOCOL)
+
+    write_artifact(output_path, sections, {
+        "embedding_model": HF_EMBEDDING_MODEL,
+        "chunks": total,
+        "files": files,
+        "ingestion": processor.report.summary()
+    })
+
+    # Read it back so a broken artifact fails the build, not the deployment
+    artifact = IndexArtifact(output_path)
+    artifact.verify()
+    return artifact
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a prebuilt index artifact for deployment")
+    parser.add_argument("directory", nargs="?", default=".",
+                        help="Directory with the documents; the app loads them from its own directory")
+    parser.add_argument("--output", default=INDEX_ARTIFACT_PATH, help="Artifact file to write")
+    parser.add_argument("--workers", type=int, default=INGEST_WORKERS, help="PDF extraction worker processes")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        sys.exit(f"No such directory: {args.directory}")
+
+    artifact = build_index(args.directory, args.output, args.workers)
+    print(f"Wrote {args.output}: {artifact.metadata['chunks']} chunks, "
+          f"{len(artifact.metadata['files'])} files, version {artifact.checksum[:12]}, "
+          f"{os.path.getsize(args.output)} bytes")
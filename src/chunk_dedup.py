@@ -0,0 +1,144 @@
+import re
+import random
+import hashlib
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set, Tuple
+
+from src.chunk_store import Chunk
+
+from config import DEDUP_THRESHOLD, DEDUP_NUM_PERM, DEDUP_SHINGLE_SIZE
+
+_WORD = re.compile(r"\w+")
+_DIGITS = re.compile(r"\d+")
+
+# A line in at least this many chunks of a document is a header, footer or
+# template line rather than content
+RECURRING_LINE_CHUNKS = 3
+
+def _stable_hash(text: str) -> int:
+    # hash() is salted per process; chunk selection must not change between runs
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def shingles(text: str, size: int = DEDUP_SHINGLE_SIZE) -> Set[int]:
+    """Hashes of the lowercased word n-grams of a text"""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {_stable_hash(" ".join(words))} if words else set()
+    return {_stable_hash(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+def _line_key(line: str) -> str:
+    # Page numbers and dates in headers and footers differ from page to page
+    return _DIGITS.sub("0", " ".join(_WORD.findall(line.lower())))
+
+def recurring_lines(texts: Sequence[str], min_chunks: int = RECURRING_LINE_CHUNKS) -> Set[str]:
+    """Keys of the lines that appear in at least min_chunks of the texts"""
+    counts: Dict[str, int] = defaultdict(int)
+    for text in texts:
+        for key in {_line_key(line) for line in text.splitlines()}:
+            if key:
+                counts[key] += 1
+    return {key for key, count in counts.items() if count >= min_chunks}
+
+def content_text(text: str, recurring: Set[str]) -> str:
+    """A chunk without its recurring lines: what tells it apart from its neighbours"""
+    return "\n".join(line for line in text.splitlines() if _line_key(line) not in recurring)
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """(bands, rows) whose LSH S-curve rises a little below the threshold
+
+    Candidates are verified with the exact Jaccard similarity afterwards, so
+    the split leans towards recall.
+    """
+    target = max(0.0, threshold - 0.1)
+    splits = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(splits, key=lambda split: abs((1 / split[0]) ** (1 / split[1]) - target))
+
+class MinHasher:
+    """MinHash signatures over shingle hashes, one random XOR mask per permutation"""
+
+    def __init__(self, num_perm: int = DEDUP_NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.masks = [rng.getrandbits(64) for _ in range(num_perm)]
+
+    def signature(self, hashes: Set[int]) -> Tuple[int, ...]:
+        if not hashes:
+            return ()
+        return tuple(min(h ^ mask for h in hashes) for mask in self.masks)
+
+def deduplicate_chunks(chunks: Sequence[Chunk], threshold: float = DEDUP_THRESHOLD,
+                       num_perm: int = DEDUP_NUM_PERM) -> List[Chunk]:
+    """Collapse near-duplicate chunks of one document into their first occurrence
+
+    Chunks are compared by their content: lines that recur in several
+    chunks (headers, footers, the shared template of otherwise different
+    sections) are left out, so two sections that only differ in their
+    title both stay. Chunks made of recurring lines alone are boilerplate
+    and compared as a whole. Chunks are bucketed by banded MinHash
+    signatures of those word shingles, and a chunk whose Jaccard similarity
+    with an earlier kept chunk in one of its buckets is at least threshold
+    is dropped. The kept chunk records the pages of the chunks it stands
+    for, see ChunkSource.add_page_refs. Order is preserved and chunk ids of
+    kept chunks do not change.
+    """
+    if threshold <= 0 or len(chunks) < 2:
+        return list(chunks)
+
+    recurring = recurring_lines([chunk.page_content for chunk in chunks])
+    hasher = MinHasher(num_perm)
+    bands, rows = lsh_bands(num_perm, threshold)
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+
+    kept: List[Chunk] = []
+    kept_shingles: List[Set[int]] = []
+    duplicate_pages: Dict[int, List[int]] = defaultdict(list)
+
+    for chunk in chunks:
+        content = content_text(chunk.page_content, recurring)
+        boilerplate = not content.strip()
+        chunk_shingles = shingles(chunk.page_content if boilerplate else content)
+        signature = hasher.signature(chunk_shingles)
+        # Boilerplate is never matched against the content of another chunk
+        keys = [
+            (boilerplate, band, signature[band * rows:(band + 1) * rows]) for band in range(bands)
+        ] if signature else []
+
+        match = None
+        seen = set()
+        for key in keys:
+            for candidate in buckets.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if jaccard(chunk_shingles, kept_shingles[candidate]) >= threshold:
+                    match = candidate
+                    break
+            if match is not None:
+                break
+
+        if match is not None:
+            duplicate_pages[match].append(chunk.page)
+            continue
+
+        position = len(kept)
+        kept.append(chunk)
+        kept_shingles.append(chunk_shingles)
+        for key in keys:
+            buckets[key].append(position)
+
+    for position, pages in duplicate_pages.items():
+        chunk = kept[position]
+        chunk.source.add_page_refs(chunk.page, chunk.index, pages)
+
+    return kept
+
+def page_refs(metadata: Dict) -> List[int]:
+    """Pages a search hit stands for: its own page plus collapsed duplicates"""
+    refs = metadata.get("page_refs")
+    if refs:
+        return [int(page) for page in str(refs).split(",")]
+    return [metadata.get("page", 0)]
@@ -0,0 +1,250 @@
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.text_store import compress_text
+
+class ChunkSource:
+    """Text buffer shared by all chunks of one document
+
+    ``metadata`` holds the document-level fields (filename, total_pages,
+    source). ``paged`` selects the chunk id scheme: per page for PDFs, per
+    file for text files, or None when the source wraps a single pre-built
+    Document whose metadata already carries its chunk id. ``page_refs``
+    maps (page, index) of a chunk to the pages of near-duplicates collapsed
+    into it, see src.chunk_dedup. ``text`` is a str while chunking and a
+    src.text_store.BlockText once the source is in a ChunkStore.
+    """
+
+    __slots__ = ("text", "metadata", "paged", "page_refs")
+
+    def __init__(self, text: str, metadata: Dict, paged: Optional[bool] = True):
+        self.text = text
+        self.metadata = metadata
+        self.paged = paged
+        self.page_refs: Optional[Dict[Tuple[int, int], List[int]]] = None
+
+    def add_page_refs(self, page: int, index: int, pages: Iterable[int]):
+        """Record pages whose duplicates of chunk (page, index) were dropped"""
+        if self.page_refs is None:
+            self.page_refs = {}
+        refs = self.page_refs.setdefault((page, index), [page])
+        refs.extend(p for p in pages if p not in refs)
+
+    def chunk_id(self, page: int, index: int) -> str:
+        if self.paged is None:
+            return self.metadata["chunk_id"]
+
+        filename = self.metadata["filename"]
+        if self.paged:
+            return f"{filename}_page_{page}_chunk_{index}"
+        return f"{filename}_chunk_{index}"
+
+    def chunk_metadata(self, page: int, index: int) -> Dict:
+        metadata = dict(self.metadata)
+        if self.paged is not None:
+            metadata.update({
+                "page": page,
+                "chunk_id": self.chunk_id(page, index),
+                "chunk_index": index
+            })
+            # Sources pickled before page_refs existed do not have the slot set
+            refs = getattr(self, "page_refs", None)
+            if refs and (page, index) in refs:
+                # A string, since Chroma metadata values cannot be lists
+                metadata["page_refs"] = ",".join(str(p) for p in refs[(page, index)])
+        return metadata
+
+class Chunk:
+    """A chunk stored as (source, page, start, end) offsets into a shared buffer
+
+    Exposes ``page_content`` and ``metadata`` like a langchain Document, but
+    both are only built when read, so overlapping chunks do not duplicate
+    their text and carry no per-chunk dict.
+    """
+
+    __slots__ = ("source", "page", "start", "end", "index")
+
+    def __init__(self, source: ChunkSource, page: int, start: int, end: int, index: int):
+        self.source = source
+        self.page = page
+        self.start = start
+        self.end = end
+        self.index = index
+
+    @property
+    def page_content(self) -> str:
+        return self.source.text[self.start:self.end]
+
+    @property
+    def metadata(self) -> Dict:
+        return self.source.chunk_metadata(self.page, self.index)
+
+def chunk_pages(text_splitter, page_texts: Iterable[Tuple[int, str]],
+                metadata: Dict, paged: bool = True) -> List[Chunk]:
+    """Split pages into offset chunks over one buffer holding the pages' text
+
+    ``text_splitter`` must provide split_spans() (see src.text_splitter).
+    Pages without chunks are left out of the buffer.
+    """
+    source = ChunkSource("", metadata, paged)
+    chunks = []
+    parts = []
+    offset = 0
+
+    for page_num, text in page_texts:
+        spans = text_splitter.split_spans(text)
+        if not spans:
+            continue
+
+        for i, (start, end) in enumerate(spans):
+            chunks.append(Chunk(source, page_num, offset + start, offset + end, i))
+        parts.append(text)
+        offset += len(text)
+
+    source.text = "".join(parts)
+    return chunks
+
+def compact_chunks(chunks: List[Chunk]) -> List[Chunk]:
+    """Copies of chunks over new buffers holding only the text they cover
+
+    Used when only some chunks of a document are stored, e.g. the changed
+    pages of an edited file, so the store does not keep the text of the
+    whole document a second time next to the chunks already in it.
+    """
+    groups: Dict[int, List[Chunk]] = {}
+    for chunk in chunks:
+        groups.setdefault(id(chunk.source), []).append(chunk)
+
+    compacted = {}
+    for group in groups.values():
+        source = group[0].source
+        spans: List[List[int]] = []
+        for chunk in sorted(group, key=lambda c: c.start):
+            if spans and chunk.start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], chunk.end)
+            else:
+                spans.append([chunk.start, chunk.end])
+
+        new_source = ChunkSource("".join(source.text[start:end] for start, end in spans),
+                                 source.metadata, source.paged)
+        new_source.page_refs = getattr(source, "page_refs", None)
+
+        starts = [start for start, _ in spans]
+        shifts = []
+        offset = 0
+        for start, end in spans:
+            shifts.append(offset - start)
+            offset += end - start
+
+        for chunk in group:
+            shift = shifts[bisect_right(starts, chunk.start) - 1]
+            compacted[id(chunk)] = Chunk(new_source, chunk.page, chunk.start + shift,
+                                         chunk.end + shift, chunk.index)
+
+    return [compacted[id(chunk)] for chunk in chunks]
+
+class ChunkStore:
+    """Columnar store of chunk offsets used by the FAISS backend
+
+    Chunks are kept as parallel arrays of (source id, page, start, end,
+    chunk index) next to the list of shared source buffers, so persisting
+    the store writes each document's text once instead of pickling a full
+    Document per chunk. Source texts are block-compressed when they enter
+    the store, so reading a chunk decompresses only the block it lies in.
+    Position i matches vector i of the FAISS index.
+    """
+
+    def __init__(self):
+        self.sources: List[ChunkSource] = []
+        self.source_ids = array('I')
+        self.pages = array('I')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.indexes = array('I')
+        self._source_index: Dict[int, int] = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_source_index"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._source_index = {id(source): i for i, source in enumerate(self.sources)}
+        # Stores saved before text compression hold plain strings
+        for source in self.sources:
+            source.text = compress_text(source.text)
+
+    def __len__(self) -> int:
+        return len(self.source_ids)
+
+    def _source_id(self, source: ChunkSource) -> int:
+        source_id = self._source_index.get(id(source))
+        if source_id is None:
+            source_id = len(self.sources)
+            # The source is complete once chunked; chunks keep slicing it as before
+            source.text = compress_text(source.text)
+            self.sources.append(source)
+            self._source_index[id(source)] = source_id
+        return source_id
+
+    def add(self, chunk) -> None:
+        """Append a Chunk, or any Document-like object as a single-chunk source"""
+        if not isinstance(chunk, Chunk):
+            metadata = dict(chunk.metadata)
+            text = chunk.page_content
+            chunk = Chunk(ChunkSource(text, metadata, None), metadata.get("page", 0),
+                          0, len(text), metadata.get("chunk_index", 0))
+
+        self.source_ids.append(self._source_id(chunk.source))
+        self.pages.append(chunk.page)
+        self.starts.append(chunk.start)
+        self.ends.append(chunk.end)
+        self.indexes.append(chunk.index)
+
+    def extend(self, chunks: Iterable) -> None:
+        for chunk in chunks:
+            self.add(chunk)
+
+    def text(self, position: int) -> str:
+        """Chunk text, sliced from its source buffer on demand"""
+        source = self.sources[self.source_ids[position]]
+        return source.text[self.starts[position]:self.ends[position]]
+
+    def metadata(self, position: int) -> Dict:
+        source = self.sources[self.source_ids[position]]
+        return source.chunk_metadata(self.pages[position], self.indexes[position])
+
+    def chunk_id(self, position: int) -> str:
+        source = self.sources[self.source_ids[position]]
+        return source.chunk_id(self.pages[position], self.indexes[position])
+
+    def chunk_ids(self) -> List[str]:
+        """Chunk ids of all positions, in index order"""
+        return [self.chunk_id(i) for i in range(len(self))]
+
+    def positions_for_filename(self, filename: str) -> List[int]:
+        source_ids = {
+            i for i, source in enumerate(self.sources)
+            if source.metadata.get("filename") == filename
+        }
+        return [i for i, source_id in enumerate(self.source_ids) if source_id in source_ids]
+
+    def filenames(self) -> List[str]:
+        return list({source.metadata.get("filename", "unknown") for source in self.sources})
+
+    def remove(self, positions: Iterable[int]) -> None:
+        """Drop chunks at the given positions, and sources left without chunks"""
+        removed = set(positions)
+        keep = [i for i in range(len(self)) if i not in removed]
+
+        used = sorted({self.source_ids[i] for i in keep})
+        remap = {old: new for new, old in enumerate(used)}
+        self.sources = [self.sources[i] for i in used]
+        self._source_index = {id(source): i for i, source in enumerate(self.sources)}
+
+        self.source_ids = array('I', (remap[self.source_ids[i]] for i in keep))
+        for name in ("pages", "starts", "ends", "indexes"):
+            column = getattr(self, name)
+            setattr(self, name, array('I', (column[i] for i in keep)))
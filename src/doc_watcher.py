@@ -0,0 +1,207 @@
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+import threading
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from config import WATCH_DEBOUNCE_SECONDS, WATCH_POLL_SECONDS
+
+# Changes the watcher cares about: a file finished writing, appeared, moved or went away
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+_RESCAN_MASK = IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF
+_EVENT = struct.Struct("iIII")
+
+class Inotify:
+    """Minimal inotify watch on one directory through libc; raises OSError where unavailable"""
+
+    def __init__(self, directory_path: str):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory_path), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"Cannot watch {directory_path}")
+
+    def read(self, timeout: float) -> Optional[Set[str]]:
+        """Names of entries that changed within timeout seconds
+
+        Returns None when events were lost or the directory itself moved, in
+        which case the caller has to rescan.
+        """
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        names = set()
+        rescan = False
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            _, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _RESCAN_MASK:
+                rescan = True
+            if name:
+                names.add(os.fsdecode(name))
+        return None if rescan else names
+
+    def close(self):
+        os.close(self.fd)
+
+def _snapshot(directory_path: str, extensions: Tuple[str, ...]) -> Dict[str, Tuple[int, int]]:
+    snapshot = {}
+    try:
+        for entry in os.scandir(directory_path):
+            if entry.is_file() and entry.name.lower().endswith(extensions):
+                stat = entry.stat()
+                snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        pass
+    return snapshot
+
+class DirectoryWatcher:
+    """Report changed files of a directory once changes have settled
+
+    Uses inotify where available and otherwise compares file sizes and
+    mtimes every poll_interval seconds. Changed names are collected until no
+    change arrived for debounce seconds, so a file being copied is reported
+    once, after it is complete. on_change receives the set of changed file
+    names, or None when inotify lost events and everything must be checked.
+    """
+
+    def __init__(self, directory_path: str, on_change: Callable[[Optional[Set[str]]], None],
+                 extensions: Tuple[str, ...] = ('.pdf',),
+                 debounce: float = WATCH_DEBOUNCE_SECONDS,
+                 poll_interval: float = WATCH_POLL_SECONDS,
+                 use_inotify: bool = True):
+        self.directory_path = directory_path
+        self.on_change = on_change
+        self.extensions = extensions
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._stop = threading.Event()
+
+    def _open_inotify(self) -> Optional[Inotify]:
+        if not self.use_inotify:
+            return None
+        try:
+            return Inotify(self.directory_path)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), polling every {self.poll_interval}s")
+            return None
+
+    def run(self):
+        """Watch until stop() is called"""
+        inotify = self._open_inotify()
+        snapshot = _snapshot(self.directory_path, self.extensions)
+        pending: Set[str] = set()
+        rescan = False
+        last_change = 0.0
+
+        try:
+            while not self._stop.is_set():
+                if pending or rescan:
+                    timeout = max(0.0, last_change + self.debounce - time.monotonic())
+                else:
+                    timeout = self.poll_interval
+
+                if inotify:
+                    changed = inotify.read(min(timeout, self.poll_interval))
+                else:
+                    self._stop.wait(min(timeout, self.poll_interval))
+                    current = _snapshot(self.directory_path, self.extensions)
+                    changed = {
+                        name for name in set(snapshot) | set(current)
+                        if snapshot.get(name) != current.get(name)
+                    }
+                    snapshot = current
+
+                if changed is None:
+                    rescan = True
+                    last_change = time.monotonic()
+                else:
+                    changed = {name for name in changed if name.lower().endswith(self.extensions)}
+                    if changed:
+                        pending |= changed
+                        last_change = time.monotonic()
+
+                if (pending or rescan) and time.monotonic() - last_change >= self.debounce:
+                    batch = None if rescan else pending
+                    pending = set()
+                    rescan = False
+                    try:
+                        self.on_change(batch)
+                    except Exception as e:
+                        print(f"Error handling changes in {self.directory_path}: {str(e)}")
+        finally:
+            if inotify:
+                inotify.close()
+
+    def start(self) -> threading.Thread:
+        """Run the watcher in a daemon thread"""
+        thread = threading.Thread(target=self.run, name="document-watcher", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+def watch_documents(directory_path: str = "data/documents", use_inotify: bool = True):
+    """Keep the vector store in sync with a directory until interrupted
+
+    Changed files go through DocumentProcessor into VectorStore via
+    IngestJob; every commit writes a new index generation, which running
+    apps pick up on their next search (VectorStore.refresh).
+    """
+    from src.archive_reader import ARCHIVE_EXTENSIONS
+    from src.document_processor import DocumentProcessor
+    from src.ingest_job import IngestJob
+    from src.vector_store import VectorStore
+
+    processor = DocumentProcessor()
+    vector_store = VectorStore()
+
+    def reindex(names: Optional[Set[str]]):
+        paths = None if names is None else [os.path.join(directory_path, name) for name in names]
+        print(f"Re-indexing: {', '.join(sorted(names)) if names else 'all files'}")
+        IngestJob(directory_path, processor, vector_store).run(paths)
+
+    os.makedirs(directory_path, exist_ok=True)
+    # Catch up on changes made while the watcher was not running
+    reindex(None)
+
+    watcher = DirectoryWatcher(directory_path, reindex, processor.SUPPORTED_EXTENSIONS + ARCHIVE_EXTENSIONS,
+                               use_inotify=use_inotify)
+    print(f"Watching {directory_path} for changes (Ctrl+C to stop)")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--poll"]
+    watch_documents(args[0] if args else "data/documents", use_inotify="--poll" not in sys.argv)
@@ -1,108 +1,258 @@
-import os
-import pdfplumber
-from typing import List, Dict
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
-from config import CHUNK_SIZE, CHUNK_OVERLAP
-
-class DocumentProcessor:
-    def __init__(self):
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=CHUNK_SIZE,
-            chunk_overlap=CHUNK_OVERLAP,
-            length_function=len,
-        )
-    
-    def load_documents(self, directory_path: str) -> List[Document]:
-        """Load and process all documents from directory"""
-        documents = []
-        
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)
-            print(f"Created directory: {directory_path}")
-            print("Please add your PDF documents to this directory")
-            return documents
-        
-        for filename in os.listdir(directory_path):
-            if filename.lower().endswith('.pdf'):
-                file_path = os.path.join(directory_path, filename)
-                print(f"Processing: {filename}")
-                
-                try:
-                    pdf_documents = self._process_pdf(file_path, filename)
-                    documents.extend(pdf_documents)
-                    print(f"Successfully processed {filename}: {len(pdf_documents)} chunks")
-                except Exception as e:
-                    print(f"Error processing {filename}: {str(e)}")
-        
-        return documents
-    
-    def _process_pdf(self, file_path: str, filename: str) -> List[Document]:
-        """Process a single PDF file"""
-        documents = []
-        
-        with pdfplumber.open(file_path) as pdf:
-            total_pages = len(pdf.pages)
-            
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    # Extract text from page
-                    text = page.extract_text()
-                    
-                    if text and text.strip():
-                        # Create document with metadata
-                        doc = Document(
-                            page_content=text,
-                            metadata={
-                                "filename": filename,
-                                "page": page_num,
-                                "total_pages": total_pages,
-                                "source": file_path
-                            }
-                        )
-                        
-                        # Split into chunks
-                        chunks = self.text_splitter.split_documents([doc])
-                        
-                        # Update metadata for each chunk
-                        for i, chunk in enumerate(chunks):
-                            chunk.metadata.update({
-                                "chunk_id": f"{filename}_page_{page_num}_chunk_{i}",
-                                "chunk_index": i
-                            })
-                        
-                        documents.extend(chunks)
-                        
-                except Exception as e:
-                    print(f"Error processing page {page_num} of {filename}: {str(e)}")
-                    continue
-        
-        return documents
-    
-    def get_document_stats(self, documents: List[Document]) -> Dict:
-        """Get statistics about processed documents"""
-        if not documents:
-            return {"total_documents": 0, "total_chunks": 0, "files": []}
-        
-        files_info = {}
-        for doc in documents:
-            filename = doc.metadata["filename"]
-            if filename not in files_info:
-                files_info[filename] = {
-                    "pages": doc.metadata["total_pages"],
-                    "chunks": 0
-                }
-            files_info[filename]["chunks"] += 1
-        
-        return {
-            "total_documents": len(files_info),
-            "total_chunks": len(documents),
-            "files": [
-                {
-                    "name": name, 
-                    "pages": info["pages"], 
-                    "chunks": info["chunks"]
-                } 
-                for name, info in files_info.items()
-            ]
+import os
+import hashlib
+from typing import Dict, Iterator, List, Optional, Tuple
+from config import CHUNK_SIZE, CHUNK_OVERLAP, INGEST_WORKERS, DEDUP_THRESHOLD
+from src.text_splitter import RecursiveTextSplitter
+from src.chunk_store import Chunk, chunk_pages
+from src.chunk_dedup import deduplicate_chunks
+from src.ingest_manifest import IngestManifest, page_hash
+from src.ingestion_report import IngestionReport
+from src.page_cache import read_pdf_pages
+from src.archive_reader import is_archive, iter_archive_members, member_filename
+
+class DocumentProcessor:
+    SUPPORTED_EXTENSIONS = ('.pdf',)
+    
+    def __init__(self, workers: int = INGEST_WORKERS, dedup_threshold: float = DEDUP_THRESHOLD):
+        self.text_splitter = RecursiveTextSplitter(
+            chunk_size=CHUNK_SIZE,
+            chunk_overlap=CHUNK_OVERLAP,
+            length_function=len,
+        )
+        self.workers = max(1, workers)
+        self.dedup_threshold = dedup_threshold
+        self.report = IngestionReport()
+    
+    def load_documents(self, directory_path: str, manifest: IngestManifest = None) -> List[Chunk]:
+        """Load and process all documents from directory
+        
+        With a manifest, files it records as unchanged are skipped, and every
+        file loaded without errors is recorded with its chunk ids; save the
+        manifest once the chunks are stored. Chunks of changed and deleted
+        files are left to the caller (see IngestManifest.get and prune);
+        IngestJob does all of this against a VectorStore.
+        """
+        if manifest is None or not os.path.exists(directory_path):
+            return list(self.iter_documents(directory_path))
+        
+        changed_files = []
+        for filename in self._list_files(directory_path):
+            if manifest.is_unchanged(os.path.join(directory_path, filename)):
+                print(f"Skipping unchanged: {filename}")
+            else:
+                changed_files.append(filename)
+        
+        documents = list(self._iter_files(directory_path, changed_files, manifest))
+        
+        # Archives are recorded without chunk ids: a changed one is read again whole
+        chunk_ids = {filename: [] for filename in changed_files}
+        for doc in documents:
+            metadata = doc.metadata
+            if metadata["filename"] in chunk_ids:
+                chunk_ids[metadata["filename"]].append(metadata["chunk_id"])
+        for filename in changed_files:
+            entry = self.report.files.get(filename)
+            if entry is None or not (entry["error"] or entry["skipped_pages"]):
+                manifest.record(os.path.join(directory_path, filename), chunk_ids[filename])
+        return documents
+    
+    def iter_documents(self, directory_path: str) -> Iterator[Chunk]:
+        """Yield chunks of all documents in a directory as they are extracted
+        
+        Only one file's pages are held at a time, so memory does not grow with
+        the size of the corpus. Feed into VectorStore.add_documents_stream().
+        """
+        if not os.path.exists(directory_path):
+            os.makedirs(directory_path)
+            print(f"Created directory: {directory_path}")
+            print("Please add your PDF documents to this directory")
+            return
+        
+        pdf_files = self._list_files(directory_path)
+        
+        # The manifest only remembers which extractor won for each file here
+        manifest = IngestManifest()
+        yield from self._iter_files(directory_path, pdf_files, manifest)
+        manifest.save()
+    
+    def process_file(self, file_path: str, manifest: IngestManifest = None) -> List[Chunk]:
+        """Chunk a single file; errors propagate to the caller"""
+        return self._process_pdf(file_path, os.path.basename(file_path), manifest)
+    
+    def process_file_pages(self, file_path: str,
+                           manifest: IngestManifest = None) -> Tuple[List[Chunk], List[str]]:
+        """Chunk a single file and hash the text of each of its pages
+        
+        The hashes (index 0 is page 1) let IngestManifest.changed_pages tell
+        which pages of an edited file need their chunks embedded again.
+        """
+        filename = os.path.basename(file_path)
+        page_texts = self._read_pages(file_path, filename, manifest)
+        chunks = self._chunk_unique(page_texts, filename, file_path)
+        return chunks, [page_hash(text or "") for text in page_texts]
+    
+    def process_archive(self, archive_path: str,
+                        manifest: IngestManifest) -> Tuple[List[Chunk], List[Tuple]]:
+        """Chunk the new and changed PDFs of an archive
+        
+        Members whose content hash matches the manifest are skipped. Returns
+        the chunks and a (member_path, size, sha256, chunk_ids) tuple for every
+        member read, chunk_ids being None for unchanged members. The manifest
+        is left alone; see IngestManifest.stale_member_ids and record_members.
+        """
+        self.report = IngestionReport()
+        members = []
+        chunks = list(self._iter_archive(archive_path, os.path.basename(archive_path), manifest, members))
+        self.report.save()
+        return chunks, members
+    
+    def _list_files(self, directory_path: str) -> List[str]:
+        """PDF files and archives directly inside a directory"""
+        return [
+            f for f in os.listdir(directory_path)
+            if f.lower().endswith(self.SUPPORTED_EXTENSIONS) or is_archive(f)
+        ]
+    
+    def _iter_files(self, directory_path: str, pdf_files: List[str],
+                    manifest: IngestManifest) -> Iterator[Chunk]:
+        """Yield chunks of the given PDF files and archives of a directory, file by file
+        
+        Outcomes are collected in self.report and written to the ingestion
+        report once all files were processed.
+        """
+        self.report = IngestionReport()
+        
+        for filename in pdf_files:
+            file_path = os.path.join(directory_path, filename)
+            if is_archive(filename):
+                try:
+                    yield from self._iter_archive(file_path, filename, manifest)
+                except Exception as e:
+                    print(f"Error reading archive {filename}: {str(e)}")
+                    self.report.fail_file(filename, str(e))
+                continue
+            
+            print(f"Processing: {filename}")
+            
+            try:
+                pdf_documents = self._process_pdf(file_path, filename, manifest)
+            except Exception as e:
+                print(f"Error processing {filename}: {str(e)}")
+                self.report.fail_file(filename, str(e))
+                continue
+            
+            yield from pdf_documents
+            print(f"Successfully processed {filename}: {len(pdf_documents)} chunks")
+        
+        skipped = self.report.skipped_pages()
+        if skipped:
+            print(f"Skipped {len(skipped)} pages, see ingestion report")
+        self.report.save()
+    
+    def _iter_archive(self, archive_path: str, archive_filename: str,
+                      manifest: IngestManifest, members: Optional[List[Tuple]] = None) -> Iterator[Chunk]:
+        """Yield chunks of the PDFs inside a zip or tar archive, member by member
+        
+        Members are read straight out of the archive without unpacking it, and
+        each one is a document named by its path inside the archive. With
+        members, members whose content hash matches the manifest are skipped,
+        and every member read is appended to it, see process_archive.
+        """
+        for member_name, data in iter_archive_members(archive_path, self.SUPPORTED_EXTENSIONS):
+            member_path = os.path.join(archive_path, member_name)
+            filename = member_filename(archive_filename, member_name)
+            
+            if members is not None:
+                sha256 = hashlib.sha256(data).hexdigest()
+                if manifest.is_member_unchanged(member_path, sha256):
+                    print(f"Skipping unchanged: {filename}")
+                    members.append((member_path, len(data), sha256, None))
+                    continue
+            
+            print(f"Processing: {filename}")
+            try:
+                pdf_documents = self._process_pdf(member_path, filename, manifest, data)
+            except Exception as e:
+                print(f"Error processing {filename}: {str(e)}")
+                self.report.fail_file(filename, str(e))
+                continue
+            
+            if members is not None:
+                members.append((member_path, len(data), sha256,
+                                [doc.metadata["chunk_id"] for doc in pdf_documents]))
+            yield from pdf_documents
+            print(f"Successfully processed {filename}: {len(pdf_documents)} chunks")
+    
+    def _process_pdf(self, file_path: str, filename: str, manifest: IngestManifest,
+                     data: Optional[bytes] = None) -> List[Chunk]:
+        """Process a single PDF file, or the bytes of a PDF read from an archive
+        
+        Pages are extracted by the fastest working extractor in supervised
+        workers, see src.page_cache.read_pdf_pages. Pages that fail or go over
+        their time or memory budget are left empty and reported. Repeated
+        boilerplate chunks are collapsed before they reach the vector store,
+        see src.chunk_dedup.
+        """
+        page_texts = self._read_pages(file_path if data is None else data, filename, manifest)
+        return self._chunk_unique(page_texts, filename, file_path)
+    
+    def _read_pages(self, source, filename: str, manifest: IngestManifest) -> List[str]:
+        """Text of every page of a PDF path or bytes, failed pages left empty"""
+        def on_error(page_num, e):
+            print(f"Error processing page {page_num} of {filename}: {str(e)}")
+            self.report.skip_page(filename, page_num, str(e))
+        
+        return read_pdf_pages(source, on_error=on_error, manifest=manifest, workers=self.workers)
+    
+    def _chunk_unique(self, page_texts: List[str], filename: str, file_path: str) -> List[Chunk]:
+        """Chunks of the pages with near-duplicates collapsed, recorded in the report"""
+        chunks = self._chunk_pages(page_texts, filename, file_path)
+        unique = deduplicate_chunks(chunks, self.dedup_threshold)
+        self.report.record_file(filename, len(page_texts), len(unique), len(chunks) - len(unique))
+        return unique
+    
+    def _chunk_pages(self, page_texts: List[str], filename: str, file_path: str) -> List[Chunk]:
+        """Chunk every page with text, page numbers starting at 1
+        
+        Chunks are offsets into one buffer of the file's page texts instead of
+        separate copies, see src.chunk_store.
+        """
+        metadata = {
+            "filename": filename,
+            "total_pages": len(page_texts),
+            "source": file_path
+        }
+        
+        return chunk_pages(
+            self.text_splitter,
+            ((page_num, text) for page_num, text in enumerate(page_texts, 1) if text and text.strip()),
+            metadata
+        )
+    
+    def get_document_stats(self, documents: List[Chunk]) -> Dict:
+        """Get statistics about processed documents"""
+        if not documents:
+            return {"total_documents": 0, "total_chunks": 0, "files": []}
+        
+        files_info = {}
+        for doc in documents:
+            filename = doc.metadata["filename"]
+            if filename not in files_info:
+                files_info[filename] = {
+                    "pages": doc.metadata["total_pages"],
+                    "chunks": 0
+                }
+            files_info[filename]["chunks"] += 1
+        
+        return {
+            "total_documents": len(files_info),
+            "total_chunks": len(documents),
+            "files": [
+                {
+                    "name": name, 
+                    "pages": info["pages"], 
+                    "chunks": info["chunks"]
+                } 
+                for name, info in files_info.items()
+            ]
         }
\ No newline at end of file
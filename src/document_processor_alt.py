@@ -1,162 +1,203 @@
-import os
-import PyPDF2
-from typing import List, Dict
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
-from config import CHUNK_SIZE, CHUNK_OVERLAP
-
-class DocumentProcessor:
-    def __init__(self):
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=CHUNK_SIZE,
-            chunk_overlap=CHUNK_OVERLAP,
-            length_function=len,
-        )
-    
-    def load_documents(self, directory_path: str) -> List[Document]:
-        """Load and process all documents from directory"""
-        documents = []
-        
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)
-            print(f"Created directory: {directory_path}")
-            print("Please add your PDF documents to this directory")
-            return documents
-        
-        for filename in os.listdir(directory_path):
-            if filename.lower().endswith('.pdf'):
-                file_path = os.path.join(directory_path, filename)
-                print(f"Processing: {filename}")
-                
-                try:
-                    pdf_documents = self._process_pdf(file_path, filename)
-                    documents.extend(pdf_documents)
-                    print(f"Successfully processed {filename}: {len(pdf_documents)} chunks")
-                except Exception as e:
-                    print(f"Error processing {filename}: {str(e)}")
-            elif filename.lower().endswith('.txt'):
-                file_path = os.path.join(directory_path, filename)
-                print(f"Processing: {filename}")
-                
-                try:
-                    txt_documents = self._process_txt(file_path, filename)
-                    documents.extend(txt_documents)
-                    print(f"Successfully processed {filename}: {len(txt_documents)} chunks")
-                except Exception as e:
-                    print(f"Error processing {filename}: {str(e)}")
-        
-        return documents
-    
-    def _process_pdf(self, file_path: str, filename: str) -> List[Document]:
-        """Process a single PDF file using PyPDF2"""
-        documents = []
-        
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
-                
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    try:
-                        # Extract text from page
-                        text = page.extract_text()
-                        
-                        if text and text.strip():
-                            # Create document with metadata
-                            doc = Document(
-                                page_content=text,
-                                metadata={
-                                    "filename": filename,
-                                    "page": page_num,
-                                    "total_pages": total_pages,
-                                    "source": file_path
-                                }
-                            )
-                            
-                            # Split into chunks
-                            chunks = self.text_splitter.split_documents([doc])
-                            
-                            # Update metadata for each chunk
-                            for i, chunk in enumerate(chunks):
-                                chunk.metadata.update({
-                                    "chunk_id": f"{filename}_page_{page_num}_chunk_{i}",
-                                    "chunk_index": i
-                                })
-                            
-                            documents.extend(chunks)
-                            
-                    except Exception as e:
-                        print(f"Error processing page {page_num} of {filename}: {str(e)}")
-                        continue
-        
-        except Exception as e:
-            print(f"Error opening PDF {filename}: {str(e)}")
-            return []
-        
-        return documents
-    
-    def _process_txt(self, file_path: str, filename: str) -> List[Document]:
-        """Process a single text file"""
-        documents = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
-                
-                if text and text.strip():
-                    # Create document with metadata
-                    doc = Document(
-                        page_content=text,
-                        metadata={
-                            "filename": filename,
-                            "page": 1,
-                            "total_pages": 1,
-                            "source": file_path
-                        }
-                    )
-                    
-                    # Split into chunks
-                    chunks = self.text_splitter.split_documents([doc])
-                    
-                    # Update metadata for each chunk
-                    for i, chunk in enumerate(chunks):
-                        chunk.metadata.update({
-                            "chunk_id": f"{filename}_chunk_{i}",
-                            "chunk_index": i
-                        })
-                    
-                    documents.extend(chunks)
-        
-        except Exception as e:
-            print(f"Error processing text file {filename}: {str(e)}")
-            return []
-        
-        return documents
-    
-    def get_document_stats(self, documents: List[Document]) -> Dict:
-        """Get statistics about processed documents"""
-        if not documents:
-            return {"total_documents": 0, "total_chunks": 0, "files": []}
-        
-        files_info = {}
-        for doc in documents:
-            filename = doc.metadata["filename"]
-            if filename not in files_info:
-                files_info[filename] = {
-                    "pages": doc.metadata["total_pages"],
-                    "chunks": 0
-                }
-            files_info[filename]["chunks"] += 1
-        
-        return {
-            "total_documents": len(files_info),
-            "total_chunks": len(documents),
-            "files": [
-                {
-                    "name": name, 
-                    "pages": info["pages"], 
-                    "chunks": info["chunks"]
-                } 
-                for name, info in files_info.items()
-            ]
+import os
+from typing import Dict, Iterator, List, Optional
+from config import CHUNK_SIZE, CHUNK_OVERLAP, DEDUP_THRESHOLD
+from src.text_splitter import RecursiveTextSplitter
+from src.chunk_store import Chunk, chunk_pages
+from src.chunk_dedup import deduplicate_chunks
+from src.ingest_manifest import IngestManifest
+from src.ingestion_report import IngestionReport
+from src.page_cache import read_pdf_pages
+from src.archive_reader import is_archive, iter_archive_members, member_filename
+
+class DocumentProcessor:
+    SUPPORTED_EXTENSIONS = ('.pdf', '.txt')
+    
+    def __init__(self, dedup_threshold: float = DEDUP_THRESHOLD):
+        self.text_splitter = RecursiveTextSplitter(
+            chunk_size=CHUNK_SIZE,
+            chunk_overlap=CHUNK_OVERLAP,
+            length_function=len,
+        )
+        self.dedup_threshold = dedup_threshold
+        self.report = IngestionReport()
+        self.manifest = IngestManifest()
+    
+    def load_documents(self, directory_path: str) -> List[Chunk]:
+        """Load and process all documents from directory"""
+        return list(self.iter_documents(directory_path))
+    
+    def iter_documents(self, directory_path: str) -> Iterator[Chunk]:
+        """Yield chunks of all documents in a directory as they are extracted
+        
+        Only one file's pages are held at a time, so memory does not grow with
+        the size of the corpus. Feed into VectorStore.add_documents_stream().
+        """
+        if not os.path.exists(directory_path):
+            os.makedirs(directory_path)
+            print(f"Created directory: {directory_path}")
+            print("Please add your PDF documents to this directory")
+            return
+        
+        self.report = IngestionReport()
+        # Remembers which extractor won for each PDF
+        self.manifest = IngestManifest()
+        
+        for filename in os.listdir(directory_path):
+            if filename.lower().endswith('.pdf'):
+                file_path = os.path.join(directory_path, filename)
+                print(f"Processing: {filename}")
+                
+                try:
+                    pdf_documents = self._process_pdf(file_path, filename)
+                except Exception as e:
+                    print(f"Error processing {filename}: {str(e)}")
+                    self.report.fail_file(filename, str(e))
+                    continue
+                
+                yield from pdf_documents
+                print(f"Successfully processed {filename}: {len(pdf_documents)} chunks")
+            elif filename.lower().endswith('.txt'):
+                file_path = os.path.join(directory_path, filename)
+                print(f"Processing: {filename}")
+                
+                try:
+                    txt_documents = self._process_txt(file_path, filename)
+                except Exception as e:
+                    print(f"Error processing {filename}: {str(e)}")
+                    self.report.fail_file(filename, str(e))
+                    continue
+                
+                yield from txt_documents
+                print(f"Successfully processed {filename}: {len(txt_documents)} chunks")
+            elif is_archive(filename):
+                file_path = os.path.join(directory_path, filename)
+                try:
+                    yield from self._iter_archive(file_path, filename)
+                except Exception as e:
+                    print(f"Error reading archive {filename}: {str(e)}")
+                    self.report.fail_file(filename, str(e))
+        
+        skipped = self.report.skipped_pages()
+        if skipped:
+            print(f"Skipped {len(skipped)} pages, see ingestion report")
+        self.report.save()
+        self.manifest.save()
+    
+    def process_file(self, file_path: str, manifest: IngestManifest = None) -> List[Chunk]:
+        """Chunk a single PDF or text file"""
+        filename = os.path.basename(file_path)
+        if manifest:
+            self.manifest = manifest
+        
+        if filename.lower().endswith('.pdf'):
+            return self._process_pdf(file_path, filename)
+        return self._process_txt(file_path, filename)
+    
+    def _iter_archive(self, archive_path: str, archive_filename: str) -> Iterator[Chunk]:
+        """Yield chunks of the PDF and text files inside a zip or tar archive
+        
+        Members are streamed out of the archive without unpacking it; each one
+        is a document named by its path inside the archive.
+        """
+        for member_name, data in iter_archive_members(archive_path, self.SUPPORTED_EXTENSIONS):
+            member_path = os.path.join(archive_path, member_name)
+            filename = member_filename(archive_filename, member_name)
+            print(f"Processing: {filename}")
+            
+            if member_name.lower().endswith('.pdf'):
+                member_documents = self._process_pdf(member_path, filename, data)
+            else:
+                member_documents = self._process_txt(member_path, filename, data)
+            
+            yield from member_documents
+            print(f"Successfully processed {filename}: {len(member_documents)} chunks")
+    
+    def _process_pdf(self, file_path: str, filename: str, data: Optional[bytes] = None) -> List[Chunk]:
+        """Process a single PDF file, or PDF bytes from an archive, with the fastest working extractor"""
+        def on_error(page_num, e):
+            print(f"Error processing page {page_num} of {filename}: {str(e)}")
+            self.report.skip_page(filename, page_num, str(e))
+        
+        try:
+            # Page texts come from the shared on-disk cache when the PDF is unchanged
+            page_texts = read_pdf_pages(file_path if data is None else data,
+                                        on_error=on_error, manifest=self.manifest)
+        except Exception as e:
+            print(f"Error opening PDF {filename}: {str(e)}")
+            self.report.fail_file(filename, str(e))
+            return []
+        
+        metadata = {
+            "filename": filename,
+            "total_pages": len(page_texts),
+            "source": file_path
+        }
+        
+        # Chunks are offsets into one buffer of the page texts, see src.chunk_store
+        chunks = chunk_pages(
+            self.text_splitter,
+            ((page_num, text) for page_num, text in enumerate(page_texts, 1) if text and text.strip()),
+            metadata
+        )
+        
+        # Repeated boilerplate is embedded once, see src.chunk_dedup
+        documents = deduplicate_chunks(chunks, self.dedup_threshold)
+        self.report.record_file(filename, len(page_texts), len(documents), len(chunks) - len(documents))
+        return documents
+    
+    def _process_txt(self, file_path: str, filename: str, data: Optional[bytes] = None) -> List[Chunk]:
+        """Process a single text file, or text bytes read from an archive"""
+        documents = []
+        
+        try:
+            if data is None:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    text = file.read()
+            else:
+                text = data.decode('utf-8')
+            
+            if text and text.strip():
+                metadata = {
+                    "filename": filename,
+                    "total_pages": 1,
+                    "source": file_path
+                }
+                
+                chunks = chunk_pages(self.text_splitter, [(1, text)], metadata, paged=False)
+                documents = deduplicate_chunks(chunks, self.dedup_threshold)
+                self.report.record_file(filename, 1, len(documents), len(chunks) - len(documents))
+        
+        except Exception as e:
+            print(f"Error processing text file {filename}: {str(e)}")
+            self.report.fail_file(filename, str(e))
+            return []
+        
+        return documents
+    
+    def get_document_stats(self, documents: List[Chunk]) -> Dict:
+        """Get statistics about processed documents"""
+        if not documents:
+            return {"total_documents": 0, "total_chunks": 0, "files": []}
+        
+        files_info = {}
+        for doc in documents:
+            filename = doc.metadata["filename"]
+            if filename not in files_info:
+                files_info[filename] = {
+                    "pages": doc.metadata["total_pages"],
+                    "chunks": 0
+                }
+            files_info[filename]["chunks"] += 1
+        
+        return {
+            "total_documents": len(files_info),
+            "total_chunks": len(documents),
+            "files": [
+                {
+                    "name": name, 
+                    "pages": info["pages"], 
+                    "chunks": info["chunks"]
+                } 
+                for name, info in files_info.items()
+            ]
         }
\ No newline at end of file
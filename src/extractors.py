@@ -0,0 +1,118 @@
+import io
+import importlib.util
+from typing import Dict, List, Type, Union
+
+# A PDF is read from a file path or, for archive members, from its bytes
+PdfSource = Union[str, bytes]
+
+EXTRACTORS: Dict[str, Type["PageExtractor"]] = {}
+
+def register_extractor(name: str):
+    """Class decorator adding a PageExtractor to the registry under name
+
+    Registration order is the fallback order when no timing is available.
+    """
+    def decorator(cls):
+        cls.name = name
+        EXTRACTORS[name] = cls
+        return cls
+    return decorator
+
+def get_extractor(name: str) -> Type["PageExtractor"]:
+    try:
+        return EXTRACTORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF extractor: {name}")
+
+def open_source(source: PdfSource):
+    """Binary file object for a PDF path or in-memory PDF"""
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return open(source, 'rb')
+
+def describe_source(source: PdfSource) -> str:
+    """Name of a PDF source for log messages"""
+    if isinstance(source, bytes):
+        return f"in-memory PDF ({len(source)} bytes)"
+    return source
+
+def available_extractors() -> List[str]:
+    """Names of registered extractors whose library is installed"""
+    return [name for name, cls in EXTRACTORS.items() if cls.is_available()]
+
+class PageExtractor:
+    """Interface of a PDF text extraction backend
+
+    An instance opens one document for a set of 1-based page numbers and
+    extracts them one at a time; it is created inside a worker process.
+    """
+
+    name = ""
+    module = ""
+
+    def __init__(self, source: PdfSource, page_numbers: List[int]):
+        raise NotImplementedError
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return importlib.util.find_spec(cls.module) is not None
+
+    @staticmethod
+    def page_count(source: PdfSource) -> int:
+        raise NotImplementedError
+
+    def extract(self, page_num: int) -> str:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+@register_extractor("pdfplumber")
+class PdfplumberExtractor(PageExtractor):
+    """Page text extraction with pdfplumber, opening only the requested pages"""
+
+    module = "pdfplumber"
+
+    def __init__(self, source: PdfSource, page_numbers: List[int]):
+        import pdfplumber
+
+        self.pdf = pdfplumber.open(open_source(source), pages=page_numbers)
+        self.pages = {page.page_number: page for page in self.pdf.pages}
+
+    @staticmethod
+    def page_count(source: PdfSource) -> int:
+        import pdfplumber
+
+        with pdfplumber.open(open_source(source)) as pdf:
+            return len(pdf.pages)
+
+    def extract(self, page_num: int) -> str:
+        return self.pages[page_num].extract_text() or ""
+
+    def close(self):
+        self.pdf.close()
+
+@register_extractor("pypdf2")
+class PyPDF2Extractor(PageExtractor):
+    """Page text extraction with PyPDF2"""
+
+    module = "PyPDF2"
+
+    def __init__(self, source: PdfSource, page_numbers: List[int]):
+        import PyPDF2
+
+        self.file = open_source(source)
+        self.reader = PyPDF2.PdfReader(self.file)
+
+    @staticmethod
+    def page_count(source: PdfSource) -> int:
+        import PyPDF2
+
+        with open_source(source) as f:
+            return len(PyPDF2.PdfReader(f).pages)
+
+    def extract(self, page_num: int) -> str:
+        return self.reader.pages[page_num - 1].extract_text() or ""
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,137 @@
+import os
+import json
+import pickle
+import struct
+import hashlib
+from datetime import datetime
+from typing import Dict, List
+
+from src.ingest_manifest import file_sha256
+
+from config import INDEX_ARTIFACT_PATH
+
+# File layout: header (magic, format version, table of contents length), the
+# JSON table of contents, then the sections back to back
+_MAGIC = b"SIDX"
+_HEADER = struct.Struct("<4sII")
+# 2: page and chunk texts are stored block-compressed
+# 3: documents carry their normalized text
+# 4: documents carry their keyword search index
+# 5: the keyword search index holds term positions
+# 6: the keyword search index holds per-term score bounds
+# 7: documents carry the original offsets of their paragraphs
+ARTIFACT_VERSION = 7
+
+def write_artifact(artifact_path: str, sections: Dict[str, bytes], metadata: Dict) -> str:
+    """Write named sections into one artifact file and return its checksum
+
+    Every section is stored with its SHA-256, and the artifact checksum is
+    the SHA-256 of those, so it identifies the build. The file is written
+    under a temporary name and renamed, so a reader never sees half of it.
+    """
+    toc = {}
+    offset = 0
+    for name, data in sections.items():
+        toc[name] = {"offset": offset, "length": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+        offset += len(data)
+    checksum = hashlib.sha256("".join(entry["sha256"] for entry in toc.values()).encode()).hexdigest()
+
+    header = json.dumps({
+        "created": datetime.now().isoformat(),
+        "checksum": checksum,
+        "metadata": metadata,
+        "sections": toc
+    }).encode('utf-8')
+
+    os.makedirs(os.path.dirname(artifact_path) or ".", exist_ok=True)
+    tmp_path = artifact_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, ARTIFACT_VERSION, len(header)))
+        f.write(header)
+        for data in sections.values():
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, artifact_path)
+    return checksum
+
+class IndexArtifact:
+    """A prebuilt index written by src.build_index
+
+    Sections are read on demand and verified against their checksum, so a
+    truncated or corrupted artifact raises ValueError instead of loading
+    garbage.
+    """
+
+    def __init__(self, artifact_path: str = INDEX_ARTIFACT_PATH):
+        self.artifact_path = artifact_path
+        with open(artifact_path, 'rb') as f:
+            raw = f.read(_HEADER.size)
+            if len(raw) < _HEADER.size or raw[:4] != _MAGIC:
+                raise ValueError(f"{artifact_path} is not an index artifact")
+
+            _, version, header_length = _HEADER.unpack(raw)
+            if version != ARTIFACT_VERSION:
+                raise ValueError(f"{artifact_path} has format version {version}, expected "
+                                 f"{ARTIFACT_VERSION}; rebuild it with python -m src.build_index")
+            header = json.loads(f.read(header_length).decode('utf-8'))
+
+        self.created = header["created"]
+        self.checksum = header["checksum"]
+        self.metadata = header["metadata"]
+        self.sections = header["sections"]
+        self._data_offset = _HEADER.size + header_length
+
+    def read(self, name: str) -> bytes:
+        """Bytes of one section, verified against its checksum"""
+        entry = self.sections[name]
+        with open(self.artifact_path, 'rb') as f:
+            f.seek(self._data_offset + entry["offset"])
+            data = f.read(entry["length"])
+
+        if len(data) != entry["length"] or hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Section {name} of {self.artifact_path} is corrupted")
+        return data
+
+    def verify(self):
+        """Check every section; raises ValueError on the first bad one"""
+        for name in self.sections:
+            self.read(name)
+
+    def documents(self) -> List:
+        """PagedDocuments for the Streamlit app, see prebuilt_documents"""
+        if "documents" not in self.sections:
+            return []
+        return pickle.loads(self.read("documents"))
+
+def prebuilt_documents(directory_path: str,
+                       artifact_path: str = INDEX_ARTIFACT_PATH) -> Dict[str, List]:
+    """Documents of an index artifact whose source files are unchanged
+
+    Returns {filename: [PagedDocument, ...]} for the files of directory_path
+    that still have the content hash recorded at build time; an archive maps
+    to the documents of its members. Returns an empty dict when there is no
+    usable artifact, so callers simply fall back to parsing.
+    """
+    if not os.path.exists(artifact_path):
+        return {}
+
+    try:
+        artifact = IndexArtifact(artifact_path)
+        unchanged = {}
+        for filename, sha256 in artifact.metadata.get("files", {}).items():
+            file_path = os.path.join(directory_path, filename)
+            if os.path.isfile(file_path) and file_sha256(file_path) == sha256:
+                unchanged[filename] = []
+        if not unchanged:
+            return {}
+
+        for doc in artifact.documents():
+            # Archive members are named "archive/member"
+            filename = doc.filename.split("/", 1)[0]
+            if filename in unchanged:
+                unchanged[filename].append(doc)
+        return unchanged
+    except Exception as e:
+        print(f"Could not load index artifact {artifact_path}: {e}")
+        return {}
@@ -0,0 +1,251 @@
+import os
+import sys
+import json
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+
+from config import EMBED_BATCH_SIZE, INGEST_CHECKPOINT_PATH, INGEST_COMMIT_EVERY
+from src.archive_reader import ARCHIVE_EXTENSIONS, is_archive
+from src.chunk_store import compact_chunks
+from src.ingest_manifest import IngestManifest
+
+class IngestCheckpoint:
+    """Progress of a running ingestion job, persisted after every commit
+
+    Each file is recorded with the content hash it is being ingested at and
+    whether it finished. A file that is still "started" with the same hash
+    was partially committed: its old chunks are already gone, and whatever
+    the vector store holds for it is new and can be kept.
+    """
+
+    def __init__(self, checkpoint_path: str = INGEST_CHECKPOINT_PATH):
+        self.checkpoint_path = checkpoint_path
+        self.files: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self.checkpoint_path):
+                with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                    self.files = json.load(f).get("files", {})
+        except Exception as e:
+            print(f"Could not load ingestion checkpoint: {e}")
+            self.files = {}
+
+    def get(self, file_path: str) -> Optional[Dict]:
+        return self.files.get(os.path.normpath(file_path))
+
+    def start(self, file_path: str, sha256: str):
+        self.files[os.path.normpath(file_path)] = {"sha256": sha256, "status": "started", "committed": 0}
+
+    def progress(self, file_path: str, committed: int):
+        self.files[os.path.normpath(file_path)]["committed"] = committed
+
+    def finish(self, file_path: str):
+        self.files[os.path.normpath(file_path)]["status"] = "done"
+
+    def save(self):
+        """Write checkpoint atomically and durably"""
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "files": self.files}, f, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear(self):
+        """Remove the checkpoint once the job completed"""
+        self.files = {}
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+class IngestJob:
+    """Resumable ingestion of a directory into a vector store
+
+    Files are chunked one at a time and embedded in batches. Every
+    commit_every batches, and at the end of each file, the vector store is
+    committed and then the checkpoint is saved. A commit that fails raises,
+    so the checkpoint and manifest never move past what the store has
+    written. After a crash the job is simply run again: finished files are
+    skipped, and chunk ids the store already holds are not embedded a
+    second time.
+
+    When the processor hashes pages (DocumentProcessor.process_file_pages)
+    and the manifest has the hashes of the previous version, an edited file
+    only has the chunks of its changed pages deleted and embedded again.
+    Archives are ingested when the processor reads them
+    (DocumentProcessor.process_archive): only their new and changed members
+    are embedded, and chunks of changed or removed members are deleted.
+    """
+
+    def __init__(self, directory_path: str, processor, vector_store,
+                 manifest: IngestManifest = None,
+                 checkpoint: IngestCheckpoint = None,
+                 batch_size: int = EMBED_BATCH_SIZE,
+                 commit_every: int = INGEST_COMMIT_EVERY):
+        self.directory_path = directory_path
+        self.processor = processor
+        self.vector_store = vector_store
+        self.manifest = manifest or IngestManifest()
+        self.checkpoint = checkpoint or IngestCheckpoint()
+        self.batch_size = batch_size
+        self.commit_every = max(1, commit_every)
+
+    def _list_files(self) -> List[str]:
+        extensions = getattr(self.processor, "SUPPORTED_EXTENSIONS", ('.pdf',))
+        if hasattr(self.processor, "process_archive"):
+            extensions = extensions + ARCHIVE_EXTENSIONS
+        return sorted(
+            os.path.join(self.directory_path, f) for f in os.listdir(self.directory_path)
+            if f.lower().endswith(extensions)
+        )
+
+    def run(self, changed_paths: Optional[Iterable[str]] = None) -> Dict:
+        """Ingest new and changed files, returning counts of the work done
+
+        changed_paths limits the work to those files, e.g. the ones a
+        directory watcher reported; deleted files are always pruned.
+        """
+        stats = {"files": 0, "skipped": 0, "failed": 0, "chunks": 0, "reused": 0, "removed": 0,
+                 "pages_kept": 0}
+        if not os.path.exists(self.directory_path):
+            print(f"Directory not found: {self.directory_path}")
+            return stats
+
+        file_paths = self._list_files()
+
+        # Drop chunks of files deleted since the last run
+        removed = self.manifest.prune(self.directory_path, file_paths)
+        for entry in removed:
+            self.vector_store.delete_documents(entry["chunk_ids"])
+            stats["removed"] += len(entry["chunk_ids"])
+        if removed:
+            self.vector_store.commit()
+            self.manifest.save()
+
+        if changed_paths is not None:
+            wanted = {os.path.normpath(p) for p in changed_paths}
+            file_paths = [p for p in file_paths if os.path.normpath(p) in wanted]
+
+        for file_path in file_paths:
+            try:
+                if self._ingest_file(file_path, stats):
+                    stats["files"] += 1
+                else:
+                    stats["skipped"] += 1
+            except Exception as e:
+                print(f"Error ingesting {file_path}: {str(e)}")
+                stats["failed"] += 1
+
+        if not stats["failed"]:
+            self.checkpoint.clear()
+
+        print(f"Ingestion finished: {stats['files']} files ingested, {stats['skipped']} unchanged, "
+              f"{stats['chunks']} chunks embedded, {stats['reused']} resumed, "
+              f"{stats['pages_kept']} unchanged pages kept")
+        return stats
+
+    def _ingest_file(self, file_path: str, stats: Dict) -> bool:
+        """Ingest one file, resuming a partial run; False if it was up to date"""
+        filename = os.path.basename(file_path)
+        entry = self.checkpoint.get(file_path)
+        # Only a checkpointed file is hashed up front; the manifest checks the rest by stat
+        resuming = entry is not None and entry["sha256"] == self.manifest.content_hash(file_path)
+        if resuming and entry["status"] == "done":
+            return False
+        if not resuming and self.manifest.is_unchanged(file_path):
+            return False
+
+        print(f"{'Resuming' if resuming else 'Processing'}: {filename}")
+        members = None
+        process_pages = getattr(self.processor, "process_file_pages", None)
+        if is_archive(filename):
+            chunks, members = self.processor.process_archive(file_path, self.manifest)
+            page_hashes = None
+        elif process_pages is not None:
+            chunks, page_hashes = process_pages(file_path, self.manifest)
+        else:
+            chunks, page_hashes = self.processor.process_file(file_path, self.manifest), None
+        metadatas = [chunk.metadata for chunk in chunks]
+        chunk_ids = [metadata["chunk_id"] for metadata in metadatas]
+        page_refs = {metadata["chunk_id"]: metadata["page_refs"]
+                     for metadata in metadatas if "page_refs" in metadata}
+
+        if resuming:
+            stored = self.vector_store.existing_ids(chunk_ids)
+            stats["reused"] += len(stored)
+        else:
+            changed = None
+            if page_hashes is not None:
+                changed = self.manifest.changed_pages(file_path, page_hashes, chunk_ids)
+
+            if members is not None:
+                # Unchanged members keep their chunks
+                self.vector_store.delete_documents(self.manifest.stale_member_ids(file_path, members))
+                stored = set()
+            elif changed is None:
+                # Old chunks of the file share its chunk ids, so they go first
+                self.vector_store.delete_file(filename)
+                stored = set()
+            else:
+                # Chunks of unchanged pages stay; changed pages are replaced by id,
+                # and so are kept chunks whose page references changed
+                kept_ids = [chunk_id for chunk, chunk_id in zip(chunks, chunk_ids) if chunk.page not in changed]
+                relinked = self.manifest.changed_page_refs(file_path, page_refs).intersection(kept_ids)
+                self.vector_store.delete_documents(
+                    self.manifest.chunk_ids_on_pages(file_path, changed) + sorted(relinked))
+                stored = self.vector_store.existing_ids([
+                    chunk_id for chunk_id in kept_ids if chunk_id not in relinked
+                ])
+                kept = len(page_hashes) - len([page for page in changed if page <= len(page_hashes)])
+                stats["pages_kept"] += kept
+                print(f"{len(changed)} pages changed, {kept} unchanged")
+            self.vector_store.commit()
+            self.checkpoint.start(file_path, self.manifest.content_hash(file_path))
+            self.checkpoint.save()
+
+        todo = [chunk for chunk, chunk_id in zip(chunks, chunk_ids) if chunk_id not in stored]
+        if len(todo) < len(chunks):
+            todo = compact_chunks(todo)
+        todo = iter(todo)
+        committed = len(stored)
+
+        batches = 0
+        while True:
+            batch = list(islice(todo, self.batch_size))
+            if not batch:
+                break
+
+            self.vector_store.add_batch(batch)
+            committed += len(batch)
+            stats["chunks"] += len(batch)
+            batches += 1
+
+            if batches % self.commit_every == 0:
+                self.vector_store.commit()
+                self.checkpoint.progress(file_path, committed)
+                self.checkpoint.save()
+
+        # Store first, then manifest, then checkpoint: each step is safe to repeat
+        self.vector_store.commit()
+        if members is None:
+            self.manifest.record(file_path, chunk_ids, page_hashes=page_hashes, page_refs=page_refs)
+        else:
+            # Members are recorded on their own, the archive gets no chunk ids
+            self.manifest.record_members(file_path, members)
+            self.manifest.record(file_path)
+        self.manifest.save()
+        self.checkpoint.progress(file_path, committed)
+        self.checkpoint.finish(file_path)
+        self.checkpoint.save()
+
+        print(f"Successfully ingested {filename}: {len(chunks)} chunks")
+        return True
+
+if __name__ == "__main__":
+    from src.document_processor import DocumentProcessor
+    from src.vector_store import VectorStore
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else "data/documents"
+    IngestJob(directory, DocumentProcessor(), VectorStore()).run()
@@ -0,0 +1,305 @@
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import VECTOR_DB_PATH
+
+MANIFEST_FILENAME = "ingest_manifest.json"
+# Files embedded into the vector store (IngestJob, DocumentProcessor)
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(VECTOR_DB_PATH) or ".", MANIFEST_FILENAME)
+# Files the Streamlit app has loaded into its in-memory corpus; kept apart so
+# neither consumer mistakes the other's entries for its own
+CORPUS_MANIFEST_PATH = os.path.join(os.path.dirname(VECTOR_DB_PATH) or ".", "corpus_manifest.json")
+
+def file_sha256(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """Hash file contents without reading the whole file into memory"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def page_hash(text: str) -> str:
+    """Short hash of one page's text, for page-level change detection"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+# Chunk ids of paged documents: {filename}_page_{n}_chunk_{i}
+_PAGED_CHUNK_ID = re.compile(r"_page_(\d+)_chunk_\d+$")
+
+def _ids_by_page(chunk_ids: List[str]) -> Optional[Dict[int, Set[str]]]:
+    pages = defaultdict(set)
+    for chunk_id in chunk_ids:
+        match = _PAGED_CHUNK_ID.search(chunk_id)
+        if match is None:
+            return None
+        pages[int(match.group(1))].add(chunk_id)
+    return pages
+
+# The background loader, the upload worker and the watcher each hold a manifest
+_save_lock = threading.Lock()
+
+class IngestManifest:
+    """Persistent record of ingested files keyed by path, size, mtime and content hash
+
+    Several instances may share one manifest file. Each remembers which
+    entries it changed, and save() applies only those onto the file as it is
+    at that moment, so one instance never drops another's entries.
+    """
+
+    def __init__(self, manifest_path: str = DEFAULT_MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.entries: Dict[str, Dict] = {}
+        self.extractors: Dict[str, str] = {}
+        self._hashes: Dict[str, str] = {}
+        self._changed: Set[str] = set()
+        self._removed: Set[str] = set()
+        self._changed_extractors: Set[str] = set()
+        self._load()
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.normpath(file_path)
+
+    def _load(self):
+        """Load manifest from disk, starting empty if missing or unreadable"""
+        self.entries, self.extractors = self._read()
+
+    def _read(self):
+        try:
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return data.get("files", {}), data.get("extractors", {})
+        except Exception as e:
+            print(f"Could not load ingestion manifest: {e}")
+        return {}, {}
+
+    def _set(self, key: str, entry: Dict):
+        self.entries[key] = entry
+        self._changed.add(key)
+        self._removed.discard(key)
+
+    def _pop(self, key: str) -> Optional[Dict]:
+        self._changed.discard(key)
+        self._removed.add(key)
+        return self.entries.pop(key, None)
+
+    def _hash(self, file_path: str) -> str:
+        key = self._key(file_path)
+        if key not in self._hashes:
+            self._hashes[key] = file_sha256(file_path)
+        return self._hashes[key]
+
+    def content_hash(self, file_path: str) -> str:
+        """SHA-256 of a file's contents, computed once per manifest instance"""
+        return self._hash(file_path)
+
+    def get(self, file_path: str) -> Optional[Dict]:
+        """Get the manifest entry for a file"""
+        return self.entries.get(self._key(file_path))
+
+    def is_unchanged(self, file_path: str) -> bool:
+        """Check whether a file matches its manifest entry
+
+        Size and mtime are compared first; the content hash is only computed
+        when the stat differs, so touched-but-identical files are not re-parsed.
+        """
+        entry = self.get(file_path)
+        if entry is None:
+            return False
+
+        stat = os.stat(file_path)
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+
+        if self._hash(file_path) == entry["sha256"]:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self._changed.add(self._key(file_path))
+            return True
+        return False
+
+    def record(self, file_path: str, chunk_ids: List[str] = None, **extra) -> Dict:
+        """Record a file as ingested together with the chunk ids it produced"""
+        stat = os.stat(file_path)
+        entry = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._hash(file_path),
+            "chunk_ids": list(chunk_ids or [])
+        }
+        entry.update(extra)
+        self._set(self._key(file_path), entry)
+        return entry
+
+    def changed_pages(self, file_path: str, page_hashes: List[str],
+                      chunk_ids: List[str]) -> Optional[Set[int]]:
+        """Pages of a file whose text or chunks differ from its manifest entry
+
+        page_hashes (index 0 is page 1) and chunk_ids describe the file as
+        just processed. A page with the same text can still gain or lose
+        chunks, since near-duplicates are collapsed across pages, so those
+        pages count as changed too. Returns None when the entry has no page
+        hashes, i.e. the file is new or was recorded by an older version, and
+        has to be replaced as a whole.
+        """
+        entry = self.get(file_path)
+        if entry is None or entry.get("page_hashes") is None:
+            return None
+
+        old_ids = _ids_by_page(entry["chunk_ids"])
+        new_ids = _ids_by_page(chunk_ids)
+        if old_ids is None or new_ids is None:
+            return None
+
+        old_hashes = entry["page_hashes"]
+        changed = {
+            page for page in range(1, max(len(old_hashes), len(page_hashes)) + 1)
+            if page > len(old_hashes) or page > len(page_hashes)
+            or old_hashes[page - 1] != page_hashes[page - 1]
+        }
+        changed.update(
+            page for page in set(old_ids) | set(new_ids)
+            if old_ids.get(page) != new_ids.get(page)
+        )
+        return changed
+
+    def changed_page_refs(self, file_path: str, page_refs: Dict[str, str]) -> Set[str]:
+        """Chunk ids whose page references differ from the manifest entry
+
+        page_refs maps chunk ids to the "page_refs" metadata of the file as
+        just processed (see src.chunk_dedup). Editing one page can add or
+        drop references on a chunk of another page whose text is unchanged.
+        """
+        entry = self.get(file_path)
+        old_refs = entry.get("page_refs", {}) if entry else {}
+        return {
+            chunk_id for chunk_id in set(old_refs) | set(page_refs)
+            if old_refs.get(chunk_id) != page_refs.get(chunk_id)
+        }
+
+    def chunk_ids_on_pages(self, file_path: str, pages: Set[int]) -> List[str]:
+        """Recorded chunk ids of a file that belong to the given pages"""
+        entry = self.get(file_path)
+        ids_by_page = _ids_by_page(entry["chunk_ids"]) if entry else None
+        if not ids_by_page:
+            return []
+        return [chunk_id for page in sorted(pages) for chunk_id in sorted(ids_by_page.get(page, ()))]
+
+    def is_member_unchanged(self, member_path: str, sha256: str) -> bool:
+        """Check whether an archive member's contents match its manifest entry"""
+        entry = self.get(member_path)
+        return entry is not None and entry["sha256"] == sha256
+
+    def record_member(self, archive_path: str, member_path: str, size: int, sha256: str,
+                      chunk_ids: List[str] = None) -> Dict:
+        """Record an archive member, identified by content hash since it has no stat"""
+        entry = {
+            "size": size,
+            "mtime_ns": None,
+            "sha256": sha256,
+            "chunk_ids": list(chunk_ids or []),
+            "archive": self._key(archive_path)
+        }
+        self._set(self._key(member_path), entry)
+        return entry
+
+    def stale_member_ids(self, archive_path: str, members: List[Tuple]) -> List[str]:
+        """Recorded chunk ids of an archive's members that changed or are gone
+
+        members are the (member_path, size, sha256, chunk_ids) tuples of
+        DocumentProcessor.process_archive; chunk_ids is None for a member
+        that is unchanged.
+        """
+        archive = self._key(archive_path)
+        unchanged = {self._key(member[0]) for member in members if member[3] is None}
+
+        stale = []
+        for key, entry in self.entries.items():
+            if entry.get("archive") == archive and key not in unchanged:
+                stale.extend(entry["chunk_ids"])
+        return stale
+
+    def record_members(self, archive_path: str, members: List[Tuple]):
+        """Record the changed members of an archive and forget the removed ones"""
+        for member_path, size, sha256, chunk_ids in members:
+            if chunk_ids is not None:
+                self.record_member(archive_path, member_path, size, sha256, chunk_ids)
+        self.prune_members(archive_path, [member[0] for member in members])
+
+    def prune_members(self, archive_path: str, existing_member_paths: List[str]) -> List[Dict]:
+        """Drop entries of members that are no longer in an archive"""
+        archive = self._key(archive_path)
+        existing = {self._key(p) for p in existing_member_paths}
+
+        removed = []
+        for key in list(self.entries):
+            if self.entries[key].get("archive") == archive and key not in existing:
+                removed.append(self._pop(key))
+        return removed
+
+    def remove(self, file_path: str) -> Optional[Dict]:
+        """Forget a file, returning its previous entry"""
+        self._hashes.pop(self._key(file_path), None)
+        return self._pop(self._key(file_path))
+
+    def prune(self, directory_path: str, existing_paths: List[str]) -> List[Dict]:
+        """Drop entries under a directory whose files are no longer present"""
+        directory = self._key(directory_path)
+        existing = {self._key(p) for p in existing_paths}
+
+        removed = []
+        for key in list(self.entries):
+            # Archive members go away together with their archive
+            path = self.entries[key].get("archive", key)
+            if (os.path.dirname(path) or ".") == directory and path not in existing:
+                removed.append(self._pop(key))
+        return removed
+
+    def get_extractor(self, content_hash: str) -> Optional[str]:
+        """Fastest working PDF extractor recorded for these contents"""
+        return self.extractors.get(content_hash)
+
+    def set_extractor(self, content_hash: str, name: str):
+        """Remember the extractor chosen for a document, keyed by content hash"""
+        self.extractors[content_hash] = name
+        self._changed_extractors.add(content_hash)
+
+    def save(self):
+        """Write manifest atomically so a crash never leaves a truncated file
+
+        Changes of this instance are applied onto the manifest on disk under
+        a lock, and the merged result is written to a temporary file of its
+        own, so concurrent saves neither mix nor lose each other's entries.
+        """
+        directory = os.path.dirname(self.manifest_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with _save_lock:
+            entries, extractors = self._read()
+            for key in self._removed:
+                entries.pop(key, None)
+            for key in self._changed:
+                entries[key] = self.entries[key]
+            for content_hash in self._changed_extractors:
+                extractors[content_hash] = self.extractors[content_hash]
+
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.manifest_path) + ".",
+                                            suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"version": 1, "files": entries, "extractors": extractors}, f, indent=1)
+                os.replace(tmp_path, self.manifest_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+            self.entries, self.extractors = entries, extractors
+            self._changed.clear()
+            self._removed.clear()
+            self._changed_extractors.clear()
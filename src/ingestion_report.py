@@ -0,0 +1,94 @@
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from config import INGEST_REPORT_PATH
+
+# The background loader and the upload worker can save at the same time
+_save_lock = threading.Lock()
+
+class IngestionReport:
+    """Per-file outcome of one ingestion run: pages, chunks, skipped pages and errors"""
+
+    def __init__(self):
+        self.started = datetime.now().isoformat()
+        self.files: Dict[str, Dict] = {}
+
+    def _entry(self, filename: str) -> Dict:
+        if filename not in self.files:
+            self.files[filename] = {"pages": 0, "chunks": 0, "duplicate_chunks": 0,
+                                    "skipped_pages": [], "error": None}
+        return self.files[filename]
+
+    def record_file(self, filename: str, pages: int = 0, chunks: int = 0, duplicates: int = 0):
+        """Record a processed file and how many near-duplicate chunks were dropped"""
+        entry = self._entry(filename)
+        entry["pages"] = pages
+        entry["chunks"] = chunks
+        entry["duplicate_chunks"] = duplicates
+
+    def skip_page(self, filename: str, page: int, reason: str):
+        """Record a page whose text is missing because it failed or went over budget"""
+        self._entry(filename)["skipped_pages"].append({"page": page, "reason": reason})
+
+    def fail_file(self, filename: str, error: str):
+        """Record a file that could not be processed at all"""
+        self._entry(filename)["error"] = error
+
+    def skipped_pages(self) -> List[Tuple[str, int, str]]:
+        return [
+            (filename, skipped["page"], skipped["reason"])
+            for filename, entry in self.files.items()
+            for skipped in entry["skipped_pages"]
+        ]
+
+    def summary(self) -> str:
+        failed = sum(1 for entry in self.files.values() if entry["error"])
+        return (f"{len(self.files)} files, {len(self.skipped_pages())} skipped pages, "
+                f"{failed} failed files")
+
+    def to_dict(self) -> Dict:
+        return {
+            "started": self.started,
+            "finished": datetime.now().isoformat(),
+            "files": self.files
+        }
+
+    def save(self, report_path: str = INGEST_REPORT_PATH):
+        """Write the report as JSON, replacing the previous run's report
+
+        A report saved after this run started belongs to a run that
+        overlapped it, such as an upload during the initial load; its files
+        are kept, and this run's entries win for files both recorded.
+        """
+        directory = os.path.dirname(report_path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with _save_lock:
+                data = self.to_dict()
+                previous = _read_report(report_path)
+                if previous and previous.get("finished", "") >= self.started:
+                    data["started"] = min(previous.get("started", self.started), self.started)
+                    data["files"] = {**previous.get("files", {}), **self.files}
+
+                fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(report_path) + ".",
+                                                suffix=".tmp", dir=directory)
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=1)
+                    os.replace(tmp_path, report_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+        except OSError as e:
+            print(f"Warning: Failed to write ingestion report: {e}")
+
+def _read_report(report_path: str) -> Dict:
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
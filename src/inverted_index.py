@@ -0,0 +1,383 @@
+import re
+import math
+import heapq
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import Container, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.text_normalizer import paragraph_spans
+
+from config import BM25_K1, BM25_B
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+# Sorts after every term that starts with a given prefix
+_PREFIX_END = "\U0010ffff"
+
+def tokenize(text: str) -> List[str]:
+    """Terms of normalized text: runs of letters and digits"""
+    return _TOKEN.findall(text)
+
+class DocumentIndex:
+    """Inverted index of one document's normalized pages, by paragraph
+
+    Paragraphs are numbered in page order; paragraph i lies on page
+    ``paragraph_pages[i]`` (an index into the document's stored pages) at
+    [paragraph_starts[i], paragraph_ends[i]) of the normalized page and
+    has paragraph_lengths[i] terms. ``terms`` is sorted, and the postings
+    of terms[t] are the (paragraph, term frequency) pairs from
+    posting_starts[t] to posting_starts[t + 1], in paragraph order. Every
+    posting list lives in the same two arrays, so a document's index is a
+    handful of objects however large its vocabulary.
+
+    The index is positional: ``positions`` holds, from position_starts[t]
+    on, the ordinal of every occurrence of terms[t] within its paragraph,
+    posting by posting, so phrases are found by intersecting position
+    lists (see find_phrase).
+
+    For each term, term_max_counts and term_min_lengths keep its highest
+    frequency in a paragraph and its shortest paragraph, which bound what
+    the term can add to a BM25 score (see rank_pages).
+    """
+
+    __slots__ = ("terms", "posting_starts", "posting_paragraphs", "posting_counts",
+                 "position_starts", "positions", "term_max_counts", "term_min_lengths",
+                 "paragraph_pages", "paragraph_starts", "paragraph_ends", "paragraph_lengths",
+                 "length")
+
+    def __init__(self, pages: Iterable[str]):
+        self.paragraph_pages = array('I')
+        self.paragraph_starts = array('L')
+        self.paragraph_ends = array('L')
+        self.paragraph_lengths = array('I')
+        self.length = 0
+
+        postings: Dict[str, List[Tuple[int, List[int]]]] = {}
+        for page_index, page in enumerate(pages):
+            for start, end in paragraph_spans(page):
+                tokens = tokenize(page[start:end])
+                if not tokens:
+                    continue
+
+                paragraph = len(self.paragraph_pages)
+                self.paragraph_pages.append(page_index)
+                self.paragraph_starts.append(start)
+                self.paragraph_ends.append(end)
+                self.paragraph_lengths.append(len(tokens))
+                self.length += len(tokens)
+
+                occurrences: Dict[str, List[int]] = {}
+                for ordinal, term in enumerate(tokens):
+                    occurrences.setdefault(term, []).append(ordinal)
+                for term, ordinals in occurrences.items():
+                    postings.setdefault(term, []).append((paragraph, ordinals))
+
+        self.terms = sorted(postings)
+        self.posting_starts = array('L', [0])
+        self.posting_paragraphs = array('I')
+        self.posting_counts = array('I')
+        self.position_starts = array('L', [0])
+        self.positions = array('I')
+        self.term_max_counts = array('I')
+        self.term_min_lengths = array('I')
+        for term in self.terms:
+            for paragraph, ordinals in postings[term]:
+                self.posting_paragraphs.append(paragraph)
+                self.posting_counts.append(len(ordinals))
+                self.positions.extend(ordinals)
+            self.posting_starts.append(len(self.posting_paragraphs))
+            self.position_starts.append(len(self.positions))
+            self.term_max_counts.append(max(len(ordinals) for _, ordinals in postings[term]))
+            self.term_min_lengths.append(min(self.paragraph_lengths[paragraph] for paragraph, _ in postings[term]))
+
+    def __len__(self) -> int:
+        """Number of indexed paragraphs"""
+        return len(self.paragraph_pages)
+
+    def _term_range(self, term: str, prefix: bool) -> Tuple[int, int]:
+        """Range of ``terms`` equal to term, or starting with it"""
+        first = bisect_left(self.terms, term)
+        if prefix:
+            return first, bisect_left(self.terms, term + _PREFIX_END, first)
+        if first < len(self.terms) and self.terms[first] == term:
+            return first, first + 1
+        return first, first
+
+    def prefix_postings(self, prefix: str) -> Optional[Tuple[Sequence[int], Sequence[int], int, int]]:
+        """Postings of all terms starting with prefix, merged by paragraph
+
+        Returns (paragraphs, counts, max count, min paragraph length), or
+        None when no term matches. Prefix matching keeps the recall of the
+        substring search it replaces: "refund" still finds "refunds" and
+        "refunded". A single matching term is returned as views of the
+        posting arrays, without copying.
+        """
+        first, last = self._term_range(prefix, prefix=True)
+        if first == last:
+            return None
+
+        start, end = self.posting_starts[first], self.posting_starts[last]
+        if last - first == 1:
+            return (memoryview(self.posting_paragraphs)[start:end], memoryview(self.posting_counts)[start:end],
+                    self.term_max_counts[first], self.term_min_lengths[first])
+
+        counts: Dict[int, int] = {}
+        for paragraph, count in zip(self.posting_paragraphs[start:end], self.posting_counts[start:end]):
+            counts[paragraph] = counts.get(paragraph, 0) + count
+        paragraphs = array('I', sorted(counts))
+        merged = array('I', (counts[paragraph] for paragraph in paragraphs))
+        return paragraphs, merged, max(merged), min(self.term_min_lengths[first:last])
+
+    def term_paragraphs(self, terms: Sequence[str]) -> Dict[int, int]:
+        """{paragraph: how many of the terms it holds}, terms matched as prefixes"""
+        found: Dict[int, int] = {}
+        for term in dict.fromkeys(terms):
+            posting = self.prefix_postings(term)
+            if posting is not None:
+                for paragraph in posting[0]:
+                    found[paragraph] = found.get(paragraph, 0) + 1
+        return found
+
+    def _positions(self, first: int, last: int,
+                   paragraphs: Optional[set] = None) -> Dict[int, set]:
+        """{paragraph: ordinals} of terms[first:last], limited to the given paragraphs"""
+        found: Dict[int, set] = {}
+        for term in range(first, last):
+            cursor = self.position_starts[term]
+            for posting in range(self.posting_starts[term], self.posting_starts[term + 1]):
+                paragraph = self.posting_paragraphs[posting]
+                count = self.posting_counts[posting]
+                if paragraphs is None or paragraph in paragraphs:
+                    found.setdefault(paragraph, set()).update(self.positions[cursor:cursor + count])
+                cursor += count
+        return found
+
+    def find_phrase(self, tokens: Sequence[str]) -> Dict[int, Tuple[int, int]]:
+        """First occurrence of a phrase on every page, as {page: (paragraph, ordinal)}
+
+        The phrase matches where its tokens are consecutive terms of a
+        paragraph, whatever separates them, so "essay#288" finds
+        "Essay #288". When the document has no such match, the last token
+        may also be the start of a longer term, as with prefix_counts.
+        Position lists are intersected from the rarest token on, so only
+        paragraphs holding every token are walked.
+        """
+        if not tokens:
+            return {}
+        return self._find_phrase(tokens, prefix=False) or self._find_phrase(tokens, prefix=True)
+
+    def _find_phrase(self, tokens: Sequence[str], prefix: bool) -> Dict[int, Tuple[int, int]]:
+        ranges = [self._term_range(token, prefix and i == len(tokens) - 1) for i, token in enumerate(tokens)]
+        if any(first == last for first, last in ranges):
+            return {}
+
+        def frequency(i):
+            first, last = ranges[i]
+            return self.posting_starts[last] - self.posting_starts[first]
+
+        order = sorted(range(len(tokens)), key=frequency)
+        paragraphs = None
+        for i in order:
+            first, last = ranges[i]
+            found = set(self.posting_paragraphs[self.posting_starts[first]:self.posting_starts[last]])
+            paragraphs = found if paragraphs is None else paragraphs & found
+            if not paragraphs:
+                return {}
+
+        # Phrase starts: ordinal o matches when token i sits at o + i
+        starts = None
+        for i in order:
+            positions = self._positions(*ranges[i], paragraphs)
+            shifted = {paragraph: {o - i for o in ordinals} for paragraph, ordinals in positions.items()}
+            starts = shifted if starts is None else {
+                paragraph: starts[paragraph] & shifted[paragraph]
+                for paragraph in starts if paragraph in shifted and starts[paragraph] & shifted[paragraph]
+            }
+            if not starts:
+                return {}
+
+        matches: Dict[int, Tuple[int, int]] = {}
+        for paragraph in sorted(starts):
+            page = self.paragraph_pages[paragraph]
+            if page not in matches:
+                matches[page] = (paragraph, min(starts[paragraph]))
+        return matches
+
+    def term_span(self, page_norm: str, paragraph: int, ordinal: int, count: int) -> Tuple[int, int]:
+        """Offsets in the normalized page of count terms of a paragraph from ordinal on"""
+        terms = list(islice(_TOKEN.finditer(page_norm, self.paragraph_starts[paragraph],
+                                            self.paragraph_ends[paragraph]), ordinal, ordinal + count))
+        return terms[0].start(), terms[-1].end()
+
+class PageHit:
+    """A page matching a keyword query, with its best paragraph"""
+
+    __slots__ = ("doc", "index", "score", "paragraph", "terms")
+
+    def __init__(self, doc, index: int, score: float, paragraph: int):
+        self.doc = doc
+        self.index = index
+        self.score = score
+        self.paragraph = paragraph
+        self.terms = 0  # Bit mask of the query terms found on the page
+
+    @property
+    def term_count(self) -> int:
+        return bin(self.terms).count("1")
+
+def rank_pages(documents: Sequence, query_terms: Sequence[str], k: int,
+               pages: Optional[Dict[int, Container[int]]] = None,
+               k1: float = BM25_K1, b: float = BM25_B) -> List[PageHit]:
+    """The k pages of documents that best match the query terms by BM25, best first
+
+    Paragraphs are the BM25 documents: collection size, average length and
+    document frequencies are summed over the documents' indexes. A page
+    scores as its best paragraph; of equal pages the earlier one wins.
+    With pages ({id(doc): page indexes}) only those pages are ranked.
+
+    Selection is MaxScore style, document by document, with a heap of the
+    best k pages so far whose lowest score is the threshold to beat (see
+    _rank_document). Pages that cannot reach the threshold are skipped as
+    soon as their bound says so, and only the k selected pages become
+    PageHits.
+    """
+    if not query_terms or k <= 0:
+        return []
+    paragraphs = sum(len(doc.search_index) for doc in documents)
+    if not paragraphs:
+        return []
+    average_length = sum(doc.search_index.length for doc in documents) / paragraphs
+
+    # Postings first, since document frequencies span all documents
+    postings = [[doc.search_index.prefix_postings(term) for term in query_terms] for doc in documents]
+    idfs = []
+    for bit in range(len(query_terms)):
+        frequency = sum(len(terms[bit][0]) for terms in postings if terms[bit] is not None)
+        idfs.append(math.log(1 + (paragraphs - frequency + 0.5) / (frequency + 0.5)))
+
+    heap: List[Tuple[float, int, int, int]] = []
+    ranked = {}
+    for doc_order, (doc, terms) in enumerate(zip(documents, postings)):
+        allowed = None
+        if pages is not None:
+            allowed = pages.get(id(doc))
+            if not allowed:
+                continue
+
+        lists = []
+        for bit, (posting, idf) in enumerate(zip(terms, idfs)):
+            if posting is not None:
+                doc_paragraphs, counts, max_count, min_length = posting
+                bound = idf * max_count * (k1 + 1) / (max_count + k1 * (1 - b + b * min_length / average_length))
+                lists.append((bound, bit, idf, doc_paragraphs, counts))
+        if not lists:
+            continue
+
+        lists.sort(key=lambda entry: (entry[0], entry[1]))
+        ranked[doc_order] = (doc, lists)
+        _rank_document(heap, k, doc_order, doc.search_index, lists, allowed, average_length, k1, b)
+
+    hits = []
+    for score, doc_order, page, paragraph in sorted(heap, reverse=True):
+        doc, lists = ranked[-doc_order]
+        hit = PageHit(doc, -page, score, paragraph)
+
+        # Query terms present anywhere on the page, for the result's match count
+        page_paragraphs = doc.search_index.paragraph_pages
+        first = bisect_left(page_paragraphs, hit.index)
+        last = bisect_left(page_paragraphs, hit.index + 1, first)
+        for _, bit, _, doc_paragraphs, _ in lists:
+            position = bisect_left(doc_paragraphs, first)
+            if position < len(doc_paragraphs) and doc_paragraphs[position] < last:
+                hit.terms |= 1 << bit
+        hits.append(hit)
+    return hits
+
+def _rank_document(heap: List, k: int, doc_order: int, index: DocumentIndex, lists: List,
+                   allowed: Optional[Container[int]], average_length: float, k1: float, b: float):
+    """Push the pages of one document that beat the heap's threshold
+
+    ``lists`` holds (upper bound, bit, idf, paragraphs, counts) per query
+    term, by increasing bound. The leading terms whose bounds add up to no
+    more than the threshold are non-essential: a paragraph holding only
+    those cannot enter the heap, so candidates are drawn from the
+    essential terms' postings alone, and non-essential terms are looked up
+    by binary search only while they could still lift the paragraph over
+    the threshold. Heap entries are (score, -doc_order, -page, paragraph),
+    so the heap's smallest entry is the weakest and latest page.
+    """
+    lengths = index.paragraph_lengths
+    paragraph_pages = index.paragraph_pages
+    count_lists = len(lists)
+    # bounds[i]: sum of the upper bounds of lists[:i]
+    bounds = [0.0]
+    for entry in lists:
+        bounds.append(bounds[-1] + entry[0])
+    cursors = [0] * count_lists
+
+    threshold = -1.0
+    essential = 0
+
+    def push(page: int, score: float, paragraph: int):
+        nonlocal threshold, essential
+        entry = (score, -doc_order, -page, paragraph)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+        else:
+            return
+        if len(heap) == k:
+            threshold = heap[0][0]
+            while essential < count_lists and bounds[essential + 1] <= threshold:
+                essential += 1
+
+    if len(heap) == k:
+        threshold = heap[0][0]
+        while essential < count_lists and bounds[essential + 1] <= threshold:
+            essential += 1
+
+    page, page_score, page_paragraph = -1, 0.0, -1
+    while essential < count_lists:
+        candidate = None
+        for i in range(essential, count_lists):
+            paragraphs = lists[i][3]
+            if cursors[i] < len(paragraphs) and (candidate is None or paragraphs[cursors[i]] < candidate):
+                candidate = paragraphs[cursors[i]]
+        if candidate is None:
+            break
+
+        norm = k1 * (1 - b + b * lengths[candidate] / average_length)
+        score = 0.0
+        for i in range(essential, count_lists):
+            _, _, idf, paragraphs, counts = lists[i]
+            position = cursors[i]
+            if position < len(paragraphs) and paragraphs[position] == candidate:
+                count = counts[position]
+                score += idf * count * (k1 + 1) / (count + norm)
+                cursors[i] = position + 1
+
+        candidate_page = paragraph_pages[candidate]
+        if allowed is not None and candidate_page not in allowed:
+            continue
+
+        for i in range(essential - 1, -1, -1):
+            if score + bounds[i + 1] <= threshold:
+                break
+            _, _, idf, paragraphs, counts = lists[i]
+            position = bisect_left(paragraphs, candidate, cursors[i])
+            cursors[i] = position
+            if position < len(paragraphs) and paragraphs[position] == candidate:
+                count = counts[position]
+                score += idf * count * (k1 + 1) / (count + norm)
+
+        if candidate_page != page:
+            if page >= 0 and page_score > threshold:
+                push(page, page_score, page_paragraph)
+            page, page_score, page_paragraph = candidate_page, 0.0, -1
+        if score > page_score:
+            page_score, page_paragraph = score, candidate
+
+    if page >= 0 and page_score > threshold:
+        push(page, page_score, page_paragraph)
@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from src.query_cache import next_version
+
+def load_priority(file_path: str) -> Tuple[int, int]:
+    """Sort key for loading: FAQ documents first, then smaller files first"""
+    is_faq = "faq" in os.path.basename(file_path).lower()
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        size = 0
+    return (0 if is_faq else 1, size)
+
+class LiveCorpus:
+    """Searchable document set that a background loader fills progressively
+
+    Readers get an immutable snapshot from documents(); publish() swaps in a
+    new list under a lock and bumps ``generation``, so search never sees a
+    half-updated set and never waits for the loader. Generations come from
+    src.query_cache.next_version, so a reloaded corpus never repeats the
+    generation of an earlier one and cached results of either stay apart.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._documents: List = []
+        self._pending: List[str] = []
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+        self.generation = next_version()
+
+    def documents(self) -> List:
+        return self._documents
+
+    def snapshot(self) -> Tuple[int, List]:
+        """The searchable documents together with their generation"""
+        with self._lock:
+            return self.generation, self._documents
+
+    def pending(self) -> List[str]:
+        """Names of files that are queued but not loaded yet"""
+        with self._lock:
+            return list(self._pending)
+
+    @property
+    def loading(self) -> bool:
+        return not self._done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def set_pending(self, names: List[str]):
+        with self._lock:
+            self._pending = list(names)
+
+    def publish(self, name: str, document=None):
+        """Mark a file as done, adding its document to the searchable set"""
+        with self._lock:
+            if name in self._pending:
+                self._pending.remove(name)
+            if document is not None:
+                self._documents = self._documents + [document]
+                self.generation = next_version()
+
+    def replace(self, document):
+        """Add a document outside the initial load, swapping out one with the same filename"""
+        with self._lock:
+            self._documents = [
+                doc for doc in self._documents if doc.filename != document.filename
+            ] + [document]
+            self.generation = next_version()
+
+    def finish(self):
+        with self._lock:
+            self._pending = []
+        self._done.set()
+
+    def cancel(self):
+        """Ask the loader to stop after the current file"""
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until loading finished; True unless the timeout expired"""
+        return self._done.wait(timeout)
+
+    def start(self, loader: Callable[["LiveCorpus"], None]) -> threading.Thread:
+        """Run loader(corpus) in a daemon thread, finishing the corpus when it returns"""
+        def run():
+            try:
+                loader(self)
+            except Exception as e:
+                print(f"Background document loading failed: {e}")
+            finally:
+                self.finish()
+
+        thread = threading.Thread(target=run, name="document-loader", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,180 @@
+import os
+import sys
+import json
+import struct
+import hashlib
+import threading
+from array import array
+from typing import Callable, List, Optional
+
+from src.ingest_manifest import file_sha256
+from src.extractors import PdfSource, available_extractors
+from src.page_extraction import document_page_count, extract_with_fallback, rank_extractors
+
+from config import PAGE_CACHE_DIR
+
+# File layout: header (magic, page count), page_count + 1 little-endian
+# uint32 offsets into the blob, then the UTF-8 blob of all page texts
+_MAGIC = b"PGC1"
+_HEADER = struct.Struct("<4sI")
+_INDEX_FILENAME = "index.json"
+
+class PageCache:
+    """On-disk cache of extracted page texts, one compact file per document
+
+    Entries are keyed by the content hash of the PDF and the extractor that
+    produced them, so a file is only parsed again when its bytes change. A
+    small stat index (path -> size, mtime, hash) avoids re-hashing unchanged
+    files on a warm start.
+    """
+
+    def __init__(self, cache_dir: str = PAGE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict:
+        try:
+            with open(os.path.join(self.cache_dir, _INDEX_FILENAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        self._atomic_write(_INDEX_FILENAME, json.dumps(self._index).encode('utf-8'))
+
+    def _atomic_write(self, name: str, data: bytes):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _file_hash(self, file_path: str) -> str:
+        """Content hash of a file, reusing the stat index when size and mtime match"""
+        key = os.path.normpath(os.path.abspath(file_path))
+        stat = os.stat(file_path)
+
+        with self._lock:
+            cached = self._index.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = file_sha256(file_path)
+        with self._lock:
+            self._index[key] = [stat.st_size, stat.st_mtime_ns, digest]
+            self._save_index()
+        return digest
+
+    def content_hash(self, source: PdfSource) -> str:
+        """SHA-256 of a PDF given as a file path or as in-memory bytes"""
+        if isinstance(source, bytes):
+            return hashlib.sha256(source).hexdigest()
+        return self._file_hash(source)
+
+    def _entry_path(self, content_hash: str, backend: str) -> str:
+        return os.path.join(self.cache_dir, f"{content_hash}.{backend}.pages")
+
+    def get(self, content_hash: str, backend: str) -> Optional[List[str]]:
+        """Return cached page texts (index 0 is page 1), or None on a miss"""
+        try:
+            with open(self._entry_path(content_hash, backend), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            magic, page_count = _HEADER.unpack_from(data)
+            if magic != _MAGIC:
+                return None
+
+            offsets = array('I')
+            table_end = _HEADER.size + (page_count + 1) * offsets.itemsize
+            offsets.frombytes(data[_HEADER.size:table_end])
+            if sys.byteorder != 'little':
+                offsets.byteswap()
+
+            blob = memoryview(data)[table_end:]
+            return [
+                str(blob[offsets[i]:offsets[i + 1]], 'utf-8')
+                for i in range(page_count)
+            ]
+        except (struct.error, ValueError, UnicodeDecodeError):
+            return None
+
+    def put(self, content_hash: str, backend: str, pages: List[str]):
+        """Store page texts for a document"""
+        encoded = [(text or "").encode('utf-8') for text in pages]
+
+        offsets = array('I', [0])
+        for chunk in encoded:
+            offsets.append(offsets[-1] + len(chunk))
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        data = _HEADER.pack(_MAGIC, len(encoded)) + offsets.tobytes() + b"".join(encoded)
+        try:
+            self._atomic_write(os.path.basename(self._entry_path(content_hash, backend)), data)
+        except OSError as e:
+            print(f"Warning: Failed to write page cache entry {content_hash}: {e}")
+
+_default_cache = None
+
+def get_page_cache() -> PageCache:
+    """Process-wide page cache shared by all loaders"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PageCache()
+    return _default_cache
+
+def read_pdf_pages(source: PdfSource,
+                   on_error: Optional[Callable[[int, Exception], None]] = None,
+                   manifest=None, workers: int = 1) -> List[str]:
+    """Extract page texts of a PDF with the fastest working extractor
+
+    source is a file path, or the bytes of a PDF read from an archive. A
+    cached extraction is served when the PDF is unchanged, preferring the
+    extractor recorded in the ingestion manifest. Otherwise the installed
+    extractors are timed on sample pages (skipped when the manifest already
+    knows the winner), the fastest one extracts the document in supervised
+    workers and the others fill in pages it fails on. Pages that still fail
+    are returned as empty strings and reported through on_error, and the
+    extraction is not cached, so they are tried and reported again on the
+    next load instead of silently staying empty. The winner is recorded in
+    manifest if given; the caller saves it.
+    """
+    cache = get_page_cache()
+    content_hash = cache.content_hash(source)
+    backends = available_extractors()
+    preferred = manifest.get_extractor(content_hash) if manifest else None
+
+    for backend in ([preferred] if preferred in backends else []) + backends:
+        pages = cache.get(content_hash, backend)
+        if pages is not None:
+            return pages
+
+    page_count = None
+    if preferred in backends:
+        ranked = [preferred] + [backend for backend in backends if backend != preferred]
+    elif len(backends) > 1:
+        # Counted once for both ranking and extraction; 0 when no backend opens it
+        page_count = document_page_count(source, backends)
+        ranked = rank_extractors(source, page_count=page_count)
+    else:
+        ranked = backends
+
+    failed = []
+
+    def record_error(page_num: int, error: Exception):
+        failed.append(page_num)
+        if on_error:
+            on_error(page_num, error)
+
+    backend, pages = extract_with_fallback(source, ranked, workers=workers, on_error=record_error,
+                                           page_count=page_count or None)
+    if not failed:
+        cache.put(content_hash, backend, pages)
+    if manifest:
+        manifest.set_extractor(content_hash, backend)
+    return pages
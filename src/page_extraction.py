@@ -0,0 +1,332 @@
+import os
+import time
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.extractors import PdfSource, available_extractors, describe_source, get_extractor
+
+from config import (PAGE_TIMEOUT_SECONDS, PAGE_MEMORY_LIMIT_MB, INGEST_PAGES_PER_TASK,
+                    EXTRACTOR_SAMPLE_PAGES)
+
+class PageSkipped(Exception):
+    """A page was skipped because it went over its time or memory budget"""
+
+def _limit_memory(memory_limit_mb: int):
+    """Cap the address space of the current process at its size plus the budget"""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows; pages still get the time budget
+        return
+
+    try:
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        current = 0
+
+    limit = current + memory_limit_mb * 1024 * 1024
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+def _extraction_worker(conn, source: PdfSource, backend: str,
+                       page_numbers: List[int], memory_limit_mb: int):
+    """Worker process: extract pages in order, announcing each before it starts
+
+    The supervisor uses the "start" message to put a deadline on the page,
+    and blames that page if the process dies or stops responding.
+    """
+    _limit_memory(memory_limit_mb)
+
+    try:
+        pages = get_extractor(backend)(source, page_numbers)
+    except Exception as e:
+        conn.send(("failed", None, f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    try:
+        for page_num in page_numbers:
+            conn.send(("start", page_num, None))
+            try:
+                text = pages.extract(page_num)
+            except MemoryError:
+                conn.send(("skipped", page_num, f"exceeded the {memory_limit_mb} MB memory budget"))
+                continue
+            except Exception as e:
+                conn.send(("error", page_num, str(e)))
+                continue
+            conn.send(("done", page_num, text))
+    finally:
+        pages.close()
+        conn.close()
+
+def _count_worker(conn, source: PdfSource, backend: str, memory_limit_mb: int):
+    """Worker process: open the document and report its page count"""
+    _limit_memory(memory_limit_mb)
+
+    try:
+        conn.send(("count", get_extractor(backend).page_count(source), None))
+    except Exception as e:
+        conn.send(("failed", None, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+def count_pages(source: PdfSource, backend: str,
+                page_timeout: float = PAGE_TIMEOUT_SECONDS,
+                memory_limit_mb: int = PAGE_MEMORY_LIMIT_MB) -> int:
+    """Page count of a PDF, read in a supervised worker process
+
+    Opening a malformed PDF can hang or exhaust memory just like extracting
+    one of its pages, so it gets the same budgets. Raises TimeoutError when
+    the document does not open in time and RuntimeError when it fails or
+    kills the worker; either way the document fails with that backend.
+    """
+    conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_count_worker,
+        args=(child_conn, source, backend, memory_limit_mb),
+        daemon=True
+    )
+    process.start()
+    child_conn.close()
+
+    try:
+        if not conn.poll(page_timeout):
+            raise TimeoutError(f"Opening {describe_source(source)} timed out after {page_timeout}s")
+        try:
+            kind, page_count, error = conn.recv()
+        except (EOFError, OSError):
+            process.join()
+            raise RuntimeError(f"Page count worker exited with code {process.exitcode}")
+        if kind == "failed":
+            raise RuntimeError(error)
+        return page_count
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        conn.close()
+
+def document_page_count(source: PdfSource, backends: List[str],
+                        page_timeout: float = PAGE_TIMEOUT_SECONDS) -> int:
+    """Page count from the first backend that opens the document, 0 if none does"""
+    for backend in backends:
+        try:
+            return count_pages(source, backend, page_timeout)
+        except Exception:
+            continue
+    return 0
+
+class _Worker:
+    def __init__(self, source: PdfSource, backend: str, page_numbers: List[int],
+                 memory_limit_mb: int, page_timeout: float):
+        self.remaining = deque(page_numbers)
+        self.conn, child_conn = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=_extraction_worker,
+            args=(child_conn, source, backend, list(page_numbers), memory_limit_mb),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.started = False
+        # Opening the document gets the same budget as a page
+        self.deadline = time.monotonic() + page_timeout
+
+    def stop(self):
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+def extract_pages(source: PdfSource, backend: str, workers: int = 1,
+                  page_numbers: Optional[List[int]] = None,
+                  page_count: Optional[int] = None,
+                  pages_per_task: int = INGEST_PAGES_PER_TASK,
+                  page_timeout: float = PAGE_TIMEOUT_SECONDS,
+                  memory_limit_mb: int = PAGE_MEMORY_LIMIT_MB,
+                  on_error: Optional[Callable[[int, Exception], None]] = None) -> List[str]:
+    """Extract the text of every page of a PDF in supervised worker processes
+
+    source is a file path or the bytes of an in-memory PDF. Pages are split
+    into ranges handled by up to ``workers`` processes. A page that raises,
+    runs longer than page_timeout seconds, exhausts the memory budget or
+    kills its worker is left empty and reported through on_error
+    (PageSkipped for budget overruns); its worker is replaced and resumes
+    after it. Returns page texts with index 0 being page 1; when page_numbers
+    is given only those pages are extracted and the others are left empty.
+    Without page_count the document is opened in a supervised worker first,
+    see count_pages.
+    """
+    if page_count is None:
+        page_count = count_pages(source, backend, page_timeout, memory_limit_mb)
+    texts = [""] * page_count
+
+    if page_numbers is None:
+        page_numbers = list(range(1, page_count + 1))
+    step = max(1, pages_per_task)
+    pending = deque(
+        page_numbers[start:start + step]
+        for start in range(0, len(page_numbers), step)
+    )
+    active: Dict[object, _Worker] = {}
+
+    def start(page_numbers):
+        worker = _Worker(source, backend, page_numbers, memory_limit_mb, page_timeout)
+        active[worker.conn] = worker
+
+    def skip(worker, reason):
+        # The first remaining page is the one the worker was busy with
+        worker.stop()
+        del active[worker.conn]
+        page_num = worker.remaining.popleft()
+        if on_error:
+            on_error(page_num, PageSkipped(reason))
+        if worker.remaining:
+            start(list(worker.remaining))
+
+    try:
+        while pending or active:
+            while pending and len(active) < max(1, workers):
+                start(pending.popleft())
+
+            deadlines = [worker.deadline for worker in active.values() if worker.remaining]
+            timeout = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+
+            for conn in wait(list(active), timeout):
+                worker = active[conn]
+                try:
+                    kind, page_num, payload = conn.recv()
+                except (EOFError, OSError):
+                    worker.process.join()
+                    if not worker.remaining:
+                        worker.stop()
+                        del active[conn]
+                    elif not worker.started:
+                        raise RuntimeError(f"Extraction worker exited with code {worker.process.exitcode}")
+                    else:
+                        skip(worker, f"worker exited with code {worker.process.exitcode}")
+                    continue
+
+                if kind == "failed":
+                    raise RuntimeError(payload)
+                if kind == "start":
+                    worker.started = True
+                    worker.deadline = time.monotonic() + page_timeout
+                    continue
+
+                worker.remaining.popleft()
+                if kind == "done":
+                    texts[page_num - 1] = payload
+                elif on_error:
+                    error = PageSkipped(payload) if kind == "skipped" else Exception(payload)
+                    on_error(page_num, error)
+
+            now = time.monotonic()
+            for worker in list(active.values()):
+                if worker.deadline <= now and worker.remaining:
+                    if not worker.started:
+                        raise TimeoutError(f"Opening {describe_source(source)} timed out after {page_timeout}s")
+                    skip(worker, f"timed out after {page_timeout}s")
+    finally:
+        for worker in active.values():
+            worker.stop()
+
+    return texts
+
+def rank_extractors(source: PdfSource, sample_pages: int = EXTRACTOR_SAMPLE_PAGES,
+                    page_timeout: float = PAGE_TIMEOUT_SECONDS,
+                    page_count: Optional[int] = None) -> List[str]:
+    """Order the installed extractors by their speed on a sample of the document
+
+    Every extractor gets the same evenly spaced sample pages in a supervised
+    worker. Extractors that fail on a sample page, or return no text where
+    another one did, are ranked after the working ones. page_count saves
+    opening the document once more when the caller has counted its pages
+    (see document_page_count).
+    """
+    names = available_extractors()
+    if len(names) <= 1:
+        return names
+
+    if page_count is None:
+        page_count = document_page_count(source, names, page_timeout)
+    if not page_count:
+        return names
+
+    count = min(sample_pages, page_count)
+    sample = sorted({1 + i * (page_count - 1) // max(1, count - 1) for i in range(count)})
+
+    results = {}
+    for name in names:
+        errors = []
+        started = time.perf_counter()
+        try:
+            texts = extract_pages(source, name, page_numbers=sample, page_count=page_count,
+                                  page_timeout=page_timeout,
+                                  on_error=lambda page_num, e: errors.append(page_num))
+        except Exception:
+            continue
+        elapsed = time.perf_counter() - started
+        results[name] = (elapsed, errors, sum(len(text.strip()) for text in texts))
+
+    most_text = max((chars for _, _, chars in results.values()), default=0)
+    working = [
+        name for name, (_, errors, chars) in results.items()
+        if not errors and (chars > 0 or most_text == 0)
+    ]
+    working.sort(key=lambda name: results[name][0])
+    return working + [name for name in names if name not in working]
+
+def extract_with_fallback(source: PdfSource, backends: List[str], workers: int = 1,
+                          on_error: Optional[Callable[[int, Exception], None]] = None,
+                          page_count: Optional[int] = None) -> Tuple[str, List[str]]:
+    """Extract all pages with the first backend that can open the document
+
+    Pages that backend fails on are retried with the remaining backends in
+    order; on_error is only called for pages that no backend could extract.
+    Returns the name of the backend used and the page texts. Without
+    page_count each backend opens the document to count its pages first.
+    """
+    last_error = None
+    for i, backend in enumerate(backends):
+        failed = {}
+        try:
+            texts = extract_pages(source, backend, workers=workers, page_count=page_count,
+                                  on_error=lambda page_num, e: failed.__setitem__(page_num, e))
+        except Exception as e:
+            print(f"PDF extractor {backend} failed on {describe_source(source)}: {str(e)}")
+            last_error = e
+            continue
+
+        for fallback in backends[i + 1:]:
+            if not failed:
+                break
+            still_failed = set()
+            try:
+                retried = extract_pages(source, fallback, workers=workers,
+                                        page_numbers=sorted(failed), page_count=len(texts),
+                                        on_error=lambda page_num, e: still_failed.add(page_num))
+            except Exception:
+                continue
+            for page_num in list(failed):
+                if page_num not in still_failed:
+                    texts[page_num - 1] = retried[page_num - 1]
+                    del failed[page_num]
+
+        if on_error:
+            for page_num in sorted(failed):
+                on_error(page_num, failed[page_num])
+        return backend, texts
+
+    raise last_error or ImportError("No PDF extractor is installed (PyPDF2 or pdfplumber)")
@@ -0,0 +1,132 @@
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from src.inverted_index import DocumentIndex
+from src.text_normalizer import OffsetMap, normalize_text
+from src.text_store import BlockText
+
+class PagedDocument:
+    """A loaded document whose page texts share one buffer
+
+    Pages are stored back to back in one buffer with an offset table, so
+    building a document is linear in its size and search can walk pages
+    directly instead of re-parsing "--- Page N ---" markers. The buffer is
+    block-compressed (src.text_store), so a loaded document holds a fraction
+    of its raw text and reading a page decompresses only the blocks it
+    spans.
+
+    Each page is also normalized once, when the document is built (see
+    src.text_normalizer): search matches queries against the normalized
+    text and maps hits back through ``offset_map`` to quote the original.
+    The normalized pages are indexed by paragraph at the same time
+    (``search_index``, see src.inverted_index) for ranked keyword search,
+    and the stripped original text of each indexed paragraph is located
+    in the buffer (snippet_starts, snippet_ends), so quoting a paragraph
+    is one slice.
+    """
+
+    __slots__ = ("filename", "type", "pages", "_text", "page_numbers", "offsets",
+                 "_normalized", "normalized_offsets", "offset_map", "search_index",
+                 "snippet_starts", "snippet_ends")
+
+    def __init__(self, filename: str, doc_type: str, pages: int,
+                 page_texts: Iterable[Tuple[int, str]]):
+        self.filename = filename
+        self.type = doc_type
+        self.pages = pages
+        self.page_numbers = array('L')
+        self.offsets = array('L', [0])
+        self.normalized_offsets = array('L', [0])
+        self.offset_map = OffsetMap()
+
+        parts = []
+        normalized_parts = []
+        for page_num, page_text in page_texts:
+            normalized, page_map = normalize_text(page_text)
+            self.offset_map.extend(page_map, self.normalized_offsets[-1], self.offsets[-1])
+            parts.append(page_text)
+            normalized_parts.append(normalized)
+            self.page_numbers.append(page_num)
+            self.offsets.append(self.offsets[-1] + len(page_text))
+            self.normalized_offsets.append(self.normalized_offsets[-1] + len(normalized))
+        self._text = BlockText("".join(parts))
+        self._normalized = BlockText("".join(normalized_parts))
+        self.search_index = DocumentIndex(normalized_parts)
+
+        index = self.search_index
+        self.snippet_starts = array('L')
+        self.snippet_ends = array('L')
+        for paragraph in range(len(index)):
+            page = index.paragraph_pages[paragraph]
+            start, end = self.original_span(page, index.paragraph_starts[paragraph], index.paragraph_ends[paragraph])
+            original = parts[page][start:end]
+            base = self.offsets[page] + start
+            self.snippet_starts.append(base + len(original) - len(original.lstrip()))
+            self.snippet_ends.append(base + len(original.rstrip()))
+
+    @classmethod
+    def from_text(cls, filename: str, text: str) -> "PagedDocument":
+        """Single-page document for plain text files"""
+        return cls(filename, "text", 1, [(1, text)])
+
+    @property
+    def text(self) -> str:
+        """Whole text of the document; page_text() and iter_pages() decompress less"""
+        return str(self._text)
+
+    def __len__(self) -> int:
+        """Number of pages that have text"""
+        return len(self.page_numbers)
+
+    def page_text(self, index: int) -> str:
+        """Text of the index-th stored page"""
+        return self._text[self.offsets[index]:self.offsets[index + 1]]
+
+    def iter_pages(self) -> Iterator[Tuple[int, str]]:
+        """Yield (page number, page text) for every page with text"""
+        for index, page_num in enumerate(self.page_numbers):
+            yield page_num, self.page_text(index)
+
+    @property
+    def normalized_text(self) -> str:
+        """Whole normalized text; pages are concatenated as in ``text``"""
+        return str(self._normalized)
+
+    def normalized_page(self, index: int) -> str:
+        """Normalized text of the index-th stored page"""
+        return self._normalized[self.normalized_offsets[index]:self.normalized_offsets[index + 1]]
+
+    def iter_normalized_pages(self) -> Iterator[Tuple[int, str]]:
+        """Yield (page number, normalized page text) for every page with text"""
+        for index, page_num in enumerate(self.page_numbers):
+            yield page_num, self.normalized_page(index)
+
+    def original_span(self, index: int, start: int, end: int) -> Tuple[int, int]:
+        """Offsets in page_text(index) of the normalized span [start, end) of that page"""
+        base = self.normalized_offsets[index]
+        orig_start, orig_end = self.offset_map.span_to_original(base + start, base + end)
+        return orig_start - self.offsets[index], orig_end - self.offsets[index]
+
+    def paragraph_page(self, paragraph: int) -> int:
+        """Page number of an indexed paragraph"""
+        return self.page_numbers[self.search_index.paragraph_pages[paragraph]]
+
+    def paragraph_text(self, paragraph: int, limit: Optional[int] = None) -> str:
+        """Original text of an indexed paragraph, stripped; longer than limit it is cut, with "..." """
+        start, end = self.snippet_starts[paragraph], self.snippet_ends[paragraph]
+        if limit is not None and end - start > limit:
+            return self._text[start:start + limit] + "..."
+        return self._text[start:end]
+
+    def best_paragraph(self, terms: Sequence[str], min_chars: int = 0) -> Tuple[int, int]:
+        """(paragraph, number of terms) of the paragraph holding most of the terms
+
+        Only paragraphs longer than min_chars count, and the first one wins
+        ties. Returns (-1, 0) when no paragraph holds any term.
+        """
+        best, best_count = -1, 0
+        for paragraph, count in self.search_index.term_paragraphs(terms).items():
+            if count > best_count or (count == best_count and paragraph < best):
+                if self.snippet_ends[paragraph] - self.snippet_starts[paragraph] > min_chars:
+                    best, best_count = paragraph, count
+        return best, best_count
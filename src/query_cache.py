@@ -0,0 +1,71 @@
+import time
+import threading
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Dict, Hashable
+
+from config import QUERY_CACHE_SIZE, QUERY_CACHE_TTL_SECONDS
+
+_versions = count(1)
+
+def next_version() -> int:
+    """A number not handed out before in this process
+
+    Searchable data stamps itself with one whenever it changes, and cache
+    keys carry that stamp, so results computed from a replaced or reloaded
+    corpus are never served again; they simply age out of the cache.
+    """
+    return next(_versions)
+
+class QueryCache:
+    """Size-bounded LRU cache of search results whose entries expire after a TTL
+
+    Shared by every Streamlit session and thread of the process. Values are
+    handed out as is, so callers must not modify cached results. Searches
+    run outside the lock: two sessions asking the same new question at once
+    both compute it, which is cheaper than making one wait for the other.
+    """
+
+    def __init__(self, max_entries: int = QUERY_CACHE_SIZE,
+                 ttl_seconds: float = QUERY_CACHE_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value of key, or compute() stored under it"""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute()
+        if self.max_entries <= 0:
+            return value
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+# Repeated questions hit this from every session until the corpus changes
+search_cache = QueryCache()
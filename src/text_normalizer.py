@@ -0,0 +1,119 @@
+import re
+import unicodedata
+from array import array
+from bisect import bisect_right
+from typing import Iterator, List, Tuple
+
+# Characters extractors leave in PDF text that never help matching
+_DROP = frozenset("\u00ad\u200b\u200c\u200d\u2060\ufeff")
+
+_SPECIAL = re.compile(
+    # A word hyphenated across a line break, hard or soft hyphen
+    r"(?P<hyphen>(?<=[^\W\d_])[-\u00ad][ \t]*\r?\n\s*(?=[^\W\d_]))"
+    # Whitespace that is not a single plain space
+    r"|(?P<space>\s{2,}|[^\S ])"
+    # Ligatures, soft hyphens and other non-ASCII text
+    r"|(?P<other>[^\x00-\x7f]+)"
+)
+
+class OffsetMap:
+    """Maps positions in normalized text back to the original text
+
+    Kept as segments: from norm_starts[i] on, normalized and original text
+    advance together from orig_starts[i]. A segment only starts where
+    normalization dropped, merged or expanded characters, so the map stays
+    small next to the text.
+    """
+
+    __slots__ = ("norm_starts", "orig_starts")
+
+    def __init__(self):
+        self.norm_starts = array('L')
+        self.orig_starts = array('L')
+
+    def add(self, norm_pos: int, orig_pos: int):
+        """Record that normalized position norm_pos comes from orig_pos"""
+        if self.norm_starts and orig_pos - self.orig_starts[-1] == norm_pos - self.norm_starts[-1]:
+            return
+        self.norm_starts.append(norm_pos)
+        self.orig_starts.append(orig_pos)
+
+    def extend(self, other: "OffsetMap", norm_base: int, orig_base: int):
+        """Append the map of a text that follows at the given base offsets"""
+        for norm_pos, orig_pos in zip(other.norm_starts, other.orig_starts):
+            self.add(norm_base + norm_pos, orig_base + orig_pos)
+
+    def to_original(self, pos: int) -> int:
+        i = bisect_right(self.norm_starts, pos) - 1
+        if i < 0:
+            return pos
+        return self.orig_starts[i] + pos - self.norm_starts[i]
+
+    def span_to_original(self, start: int, end: int) -> Tuple[int, int]:
+        """Original span covering the normalized span [start, end)"""
+        if end <= start:
+            orig = self.to_original(start)
+            return orig, orig
+        return self.to_original(start), self.to_original(end - 1) + 1
+
+def _fold(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+def normalize_text(text: str) -> Tuple[str, OffsetMap]:
+    """Normalize extracted text for matching, with a map back to the original
+
+    Applies NFKC (which expands ligatures such as "ﬁ"), lowercases, drops
+    soft hyphens and zero-width characters, joins words hyphenated across a
+    line break, and turns line wraps into spaces. Runs of whitespace become
+    one space, or a blank line where the original had one, so paragraphs
+    still split on "\\n\\n".
+    """
+    parts: List[str] = []
+    mapping = OffsetMap()
+    norm_pos = 0
+    last = 0
+
+    def emit(chunk: str, orig_pos: int):
+        nonlocal norm_pos
+        if chunk:
+            mapping.add(norm_pos, orig_pos)
+            parts.append(chunk)
+            norm_pos += len(chunk)
+
+    for match in _SPECIAL.finditer(text):
+        # Plain ASCII keeps its length when lowercased: one segment
+        emit(text[last:match.start()].lower(), last)
+        last = match.end()
+        kind = match.lastgroup
+
+        if kind == "hyphen":
+            # Only rejoin when the word continues in lowercase; keep "Anti-Virus"
+            if not text[match.end()].islower():
+                emit("-", match.start())
+        elif kind == "space":
+            emit("\n\n" if match.group().count("\n") >= 2 else " ", match.start())
+        else:
+            run = match.group()
+            folded = _fold(run)
+            if len(folded) == len(run) and not _DROP.intersection(run):
+                emit(folded, match.start())
+            else:
+                for i, ch in enumerate(run, match.start()):
+                    if ch not in _DROP:
+                        for c in _fold(ch):
+                            emit(c, i)
+
+    emit(text[last:].lower(), last)
+    return "".join(parts), mapping
+
+def normalize_query(query: str) -> str:
+    """A query normalized like document text, so it can be matched directly"""
+    return normalize_text(query)[0].strip()
+
+def paragraph_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """(start, end) of every non-blank paragraph of a text, split on blank lines"""
+    start = 0
+    for paragraph in text.split('\n\n'):
+        if paragraph.strip():
+            yield start, start + len(paragraph)
+        start += len(paragraph) + 2
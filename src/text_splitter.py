@@ -0,0 +1,146 @@
+import copy
+from typing import Callable, Dict, List, Optional, Tuple
+from langchain.schema import Document
+
+DEFAULT_SEPARATORS = ["\n\n", "\n", " ", ""]
+
+class RecursiveTextSplitter:
+    """Offset-based drop-in for langchain's RecursiveCharacterTextSplitter
+
+    Produces exactly the chunks RecursiveCharacterTextSplitter gives with its
+    default settings (keep_separator=True, strip_whitespace=True, len as the
+    length function), but works on (start, end) offsets into the original
+    text. Pieces are located with str.find and merged with a sliding window,
+    so no intermediate strings are built until a chunk is returned.
+
+    The offsets are what DocumentProcessor needs: src.chunk_store keeps
+    chunks as spans of one page buffer instead of copies. Chunking the
+    bundled PDFs page by page is also about 1.6x faster than with langchain,
+    and text without whitespace about 4x (see benchmarks/bench_text_splitter.py).
+    """
+
+    def __init__(self, chunk_size: int = 4000, chunk_overlap: int = 200,
+                 length_function: Callable[[str], int] = len,
+                 separators: Optional[List[str]] = None):
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"Got a larger chunk overlap ({chunk_overlap}) than chunk size "
+                f"({chunk_size}), should be smaller."
+            )
+        if length_function is not len:
+            raise ValueError("RecursiveTextSplitter only supports len as length function")
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = separators or DEFAULT_SEPARATORS
+
+    def split_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Return (start, end) offsets of every chunk of text"""
+        spans = []
+        self._split(text, 0, len(text), 0, spans)
+        return spans
+
+    def split_text(self, text: str) -> List[str]:
+        """Split text into chunks"""
+        return [text[start:end] for start, end in self.split_spans(text)]
+
+    def create_documents(self, texts: List[str],
+                         metadatas: Optional[List[Dict]] = None) -> List[Document]:
+        """Create chunk documents from texts, copying metadata per chunk"""
+        metadatas = metadatas or [{}] * len(texts)
+        return [
+            Document(page_content=chunk, metadata=copy.deepcopy(metadatas[i]))
+            for i, text in enumerate(texts)
+            for chunk in self.split_text(text)
+        ]
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        """Split documents into chunk documents"""
+        return self.create_documents(
+            [doc.page_content for doc in documents],
+            [doc.metadata for doc in documents]
+        )
+
+    def _split(self, text: str, start: int, end: int, level: int,
+               spans: List[Tuple[int, int]]):
+        """Split text[start:end] with separators[level:], appending chunk spans"""
+        separators = self.separators
+
+        # Pick the first separator present in this range; "" always matches
+        separator = separators[-1]
+        next_level = len(separators)
+        for i in range(level, len(separators)):
+            if separators[i] == "":
+                separator = ""
+                break
+            if text.find(separators[i], start, end) != -1:
+                separator = separators[i]
+                next_level = i + 1
+                break
+
+        # Pieces keep their leading separator, as with keep_separator=True,
+        # so consecutive pieces are always contiguous ranges of text
+        pieces = []
+        if separator:
+            piece_start = start
+            pos = text.find(separator, start, end)
+            while pos != -1:
+                if pos > piece_start:
+                    pieces.append((piece_start, pos))
+                piece_start = pos
+                pos = text.find(separator, pos + len(separator), end)
+            if end > piece_start:
+                pieces.append((piece_start, end))
+        else:
+            pieces = [(i, i + 1) for i in range(start, end)]
+
+        good = []
+        for piece in pieces:
+            if piece[1] - piece[0] < self.chunk_size:
+                good.append(piece)
+                continue
+
+            if good:
+                self._merge(text, good, spans)
+                good = []
+            if next_level >= len(separators):
+                spans.append(piece)
+            else:
+                self._split(text, piece[0], piece[1], next_level, spans)
+
+        if good:
+            self._merge(text, good, spans)
+
+    def _merge(self, text: str, pieces: List[Tuple[int, int]],
+               spans: List[Tuple[int, int]]):
+        """Merge contiguous pieces into overlapping chunks with a sliding window"""
+        first = 0
+        total = 0
+
+        for i, (piece_start, piece_end) in enumerate(pieces):
+            length = piece_end - piece_start
+
+            if total + length > self.chunk_size and i > first:
+                self._emit(text, pieces[first][0], pieces[i - 1][1], spans)
+
+                # Drop pieces from the front until the window fits the overlap
+                while total > self.chunk_overlap or (
+                    total + length > self.chunk_size and total > 0
+                ):
+                    total -= pieces[first][1] - pieces[first][0]
+                    first += 1
+
+            total += length
+
+        if first < len(pieces):
+            self._emit(text, pieces[first][0], pieces[-1][1], spans)
+
+    @staticmethod
+    def _emit(text: str, start: int, end: int, spans: List[Tuple[int, int]]):
+        """Append the whitespace-stripped span, skipping empty chunks"""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end > start:
+            spans.append((start, end))
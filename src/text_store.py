@@ -0,0 +1,93 @@
+import zlib
+from array import array
+from typing import Iterator, Union
+
+from config import TEXT_BLOCK_CHARS
+
+class BlockText:
+    """Read-only text kept as independently zlib-compressed blocks
+
+    The text is cut into blocks of block_chars characters, and ``offsets``
+    holds where each compressed block starts in ``data``. Slicing
+    decompresses only the blocks the slice covers, so reading one chunk or
+    snippet of a large document touches a few kilobytes instead of the
+    whole text. The last block read stays decompressed, since neighbouring
+    slices are usually read one after another.
+
+    Supports len(), str() and slicing with step 1, which is all chunk and
+    page access needs.
+    """
+
+    __slots__ = ("data", "offsets", "length", "block_chars", "_cached")
+
+    def __init__(self, text: str, block_chars: int = TEXT_BLOCK_CHARS, level: int = 6):
+        parts = []
+        self.offsets = array('Q', [0])
+        for start in range(0, len(text), block_chars):
+            block = zlib.compress(text[start:start + block_chars].encode('utf-8'), level)
+            parts.append(block)
+            self.offsets.append(self.offsets[-1] + len(block))
+
+        self.data = b"".join(parts)
+        self.length = len(text)
+        self.block_chars = block_chars
+        self._cached = None
+
+    def __getstate__(self):
+        return (self.data, self.offsets, self.length, self.block_chars)
+
+    def __setstate__(self, state):
+        self.data, self.offsets, self.length, self.block_chars = state
+        self._cached = None
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _block(self, number: int) -> str:
+        # One (number, text) tuple, so concurrent readers never see a mismatched pair
+        cached = self._cached
+        if cached is not None and cached[0] == number:
+            return cached[1]
+
+        view = memoryview(self.data)[self.offsets[number]:self.offsets[number + 1]]
+        text = zlib.decompress(view).decode('utf-8')
+        self._cached = (number, text)
+        return text
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        if isinstance(key, int):
+            if key < 0:
+                key += self.length
+            if not 0 <= key < self.length:
+                raise IndexError("BlockText index out of range")
+            return self._block(key // self.block_chars)[key % self.block_chars]
+
+        start, stop, step = key.indices(self.length)
+        if step != 1:
+            return str(self)[key]
+        if start >= stop:
+            return ""
+
+        first = start // self.block_chars
+        last = (stop - 1) // self.block_chars
+        text = "".join(self._block(number) for number in range(first, last + 1))
+        base = first * self.block_chars
+        return text[start - base:stop - base]
+
+    def iter_blocks(self) -> Iterator[str]:
+        """Decompressed blocks in order, without disturbing the cached block"""
+        for number in range(len(self.offsets) - 1):
+            view = memoryview(self.data)[self.offsets[number]:self.offsets[number + 1]]
+            yield zlib.decompress(view).decode('utf-8')
+
+    def __str__(self) -> str:
+        return "".join(self.iter_blocks())
+
+    @property
+    def compressed_size(self) -> int:
+        """Bytes held for the text: compressed blocks plus the offset index"""
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+def compress_text(text: Union[str, BlockText]) -> BlockText:
+    """BlockText of a string; already compressed text is returned as is"""
+    return text if isinstance(text, BlockText) else BlockText(text)
@@ -0,0 +1,145 @@
+import os
+import queue
+import tempfile
+import threading
+from typing import Callable, List, Tuple
+
+class UploadStatus:
+    """Progress of one uploaded file, written by the worker thread and read by the UI
+
+    ``state`` goes queued -> extracting -> indexing -> done, or failed with
+    ``error`` set. ``chunks`` and ``indexed`` count the file's chunks (or
+    documents, for a plain document list) once they are known.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.state = "queued"
+        self.chunks = 0
+        self.indexed = 0
+        self.error = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("done", "failed")
+
+    @property
+    def progress(self) -> float:
+        """Fraction done, for a progress bar"""
+        if self.finished:
+            return 1.0
+        if self.state == "indexing" and self.chunks:
+            return 0.2 + 0.8 * self.indexed / self.chunks
+        if self.state == "extracting":
+            return 0.1
+        return 0.0
+
+def upload_filename(name: str) -> str:
+    """File name to store an upload under, without any directory part"""
+    filename = os.path.basename(name.replace("\\", "/")).strip()
+    if filename in ("", ".", ".."):
+        raise ValueError(f"Invalid upload file name: {name!r}")
+    return filename
+
+class UploadWorker:
+    """One background thread that ingests uploaded files in submission order
+
+    submit() saves the upload into upload_dir and returns at once; the
+    worker then calls process(file_path, status), which extracts, chunks and
+    indexes the file and reports progress on status. An upload never
+    replaces an existing file: when its name is taken in upload_dir or in
+    one of reserved_dirs (such as the directory of the bundled documents)
+    it is stored as "name (2).pdf" and so on. A failing file is marked
+    failed and deleted, so it is not retried on every later load, and the
+    worker moves on to the next one; since every stored file was created
+    by submit(), that never removes anything but the upload itself.
+    """
+
+    def __init__(self, process: Callable[[str, UploadStatus], None], upload_dir: str,
+                 extensions: Tuple[str, ...] = ('.pdf',), reserved_dirs: Tuple[str, ...] = ()):
+        self.process = process
+        self.upload_dir = upload_dir
+        self.extensions = extensions
+        self.reserved_dirs = reserved_dirs
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._statuses: List[UploadStatus] = []
+        self._thread = None
+
+    def submit(self, name: str, data: bytes) -> UploadStatus:
+        """Save an upload and queue it for ingestion"""
+        filename = upload_filename(name)
+        if not filename.lower().endswith(self.extensions):
+            raise ValueError(f"Unsupported file type: {filename}")
+
+        # Write under a temporary name so a half-written file is never ingested
+        os.makedirs(self.upload_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".part", dir=self.upload_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            file_path = self._store(tmp_path, filename)
+        finally:
+            os.remove(tmp_path)
+
+        status = UploadStatus(os.path.basename(file_path))
+        with self._lock:
+            self._statuses.append(status)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="upload-worker", daemon=True)
+                self._thread.start()
+        self._queue.put((file_path, status))
+        return status
+
+    def _store(self, tmp_path: str, filename: str) -> str:
+        """Link a written upload under the first free name and return its path"""
+        extension = next(ext for ext in self.extensions if filename.lower().endswith(ext))
+        stem, extension = filename[:-len(extension)], filename[-len(extension):]
+
+        number = 1
+        while True:
+            candidate = filename if number == 1 else f"{stem} ({number}){extension}"
+            number += 1
+            if any(os.path.exists(os.path.join(directory, candidate)) for directory in self.reserved_dirs):
+                continue
+
+            file_path = os.path.join(self.upload_dir, candidate)
+            try:
+                # Unlike os.replace, a link fails instead of overwriting an existing file
+                os.link(tmp_path, file_path)
+                return file_path
+            except FileExistsError:
+                continue
+
+    def statuses(self) -> List[UploadStatus]:
+        with self._lock:
+            return list(self._statuses)
+
+    @property
+    def busy(self) -> bool:
+        return any(not status.finished for status in self.statuses())
+
+    def clear_finished(self):
+        with self._lock:
+            self._statuses = [status for status in self._statuses if not status.finished]
+
+    def join(self):
+        """Block until every submitted file has been processed"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            file_path, status = self._queue.get()
+            try:
+                self.process(file_path, status)
+                status.state = "done"
+            except Exception as e:
+                print(f"Error ingesting upload {status.filename}: {str(e)}")
+                status.error = str(e)
+                status.state = "failed"
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+            finally:
+                self._queue.task_done()
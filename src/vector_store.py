@@ -1,289 +1,571 @@
-import os
-import sys
-from typing import List, Dict, Tuple
-from langchain.schema import Document
-from sentence_transformers import SentenceTransformer
-from config import VECTOR_DB_PATH, HF_EMBEDDING_MODEL
-
-# Try to fix SQLite issue first
-try:
-    import pysqlite3.dbapi2 as sqlite3
-    sys.modules['sqlite3'] = sqlite3
-    print("Using pysqlite3-binary for SQLite compatibility")
-except ImportError:
-    pass
-
-# Try ChromaDB first, fall back to FAISS if SQLite issues
-USE_CHROMADB = True
-try:
-    import chromadb
-    from chromadb.config import Settings
-    print("Using ChromaDB for vector storage")
-except RuntimeError as e:
-    if "sqlite3" in str(e).lower():
-        print("ChromaDB SQLite issue detected, falling back to FAISS")
-        USE_CHROMADB = False
-        import faiss
-        import numpy as np
-        import pickle
-    else:
-        raise e
-
-class VectorStore:
-    def __init__(self):
-        self.embedding_model = SentenceTransformer(HF_EMBEDDING_MODEL)
-        
-        if USE_CHROMADB:
-            self._init_chromadb()
-        else:
-            self._init_faiss()
-    
-    def _init_chromadb(self):
-        """Initialize ChromaDB"""
-        self.client = chromadb.PersistentClient(
-            path=VECTOR_DB_PATH,
-            settings=Settings(allow_reset=True)
-        )
-        
-        self.collection = self.client.get_or_create_collection(
-            name="documents",
-            metadata={"description": "Customer support documents"}
-        )
-    
-    def _init_faiss(self):
-        """Initialize FAISS as fallback"""
-        self.faiss_path = VECTOR_DB_PATH + "_faiss"
-        os.makedirs(self.faiss_path, exist_ok=True)
-        
-        self.index = None
-        self.documents = []
-        self.metadatas = []
-        
-        # Try to load existing index
-        self._load_faiss_index()
-    
-    def add_documents(self, documents: List[Document]) -> None:
-        """Add documents to the vector store"""
-        if not documents:
-            return
-        
-        print(f"Adding {len(documents)} documents to vector store...")
-        
-        if USE_CHROMADB:
-            self._add_documents_chromadb(documents)
-        else:
-            self._add_documents_faiss(documents)
-    
-    def _add_documents_chromadb(self, documents: List[Document]) -> None:
-        """Add documents to ChromaDB"""
-        texts = [doc.page_content for doc in documents]
-        metadatas = [doc.metadata for doc in documents]
-        ids = [doc.metadata["chunk_id"] for doc in documents]
-        
-        # Generate embeddings
-        embeddings = self.embedding_model.encode(texts).tolist()
-        
-        # Add to collection in batches
-        batch_size = 100
-        for i in range(0, len(documents), batch_size):
-            end_idx = min(i + batch_size, len(documents))
-            
-            self.collection.add(
-                documents=texts[i:end_idx],
-                metadatas=metadatas[i:end_idx],
-                ids=ids[i:end_idx],
-                embeddings=embeddings[i:end_idx]
-            )
-        
-        print(f"Successfully added {len(documents)} documents to ChromaDB")
-    
-    def _add_documents_faiss(self, documents: List[Document]) -> None:
-        """Add documents to FAISS"""
-        texts = [doc.page_content for doc in documents]
-        embeddings = self.embedding_model.encode(texts)
-        
-        # Initialize or expand FAISS index
-        if self.index is None:
-            dimension = embeddings.shape[1]
-            self.index = faiss.IndexFlatIP(dimension)
-        
-        # Normalize embeddings for cosine similarity
-        faiss.normalize_L2(embeddings)
-        
-        # Add to index
-        self.index.add(embeddings.astype('float32'))
-        
-        # Store documents and metadata
-        self.documents.extend(documents)
-        self.metadatas.extend([doc.metadata for doc in documents])
-        
-        # Save index
-        self._save_faiss_index()
-        
-        print(f"Successfully added {len(documents)} documents to FAISS")
-    
-    def search(self, query: str, n_results: int = 5) -> List[Dict]:
-        """Search for relevant documents"""
-        if self.is_empty():
-            return []
-        
-        if USE_CHROMADB:
-            return self._search_chromadb(query, n_results)
-        else:
-            return self._search_faiss(query, n_results)
-    
-    def _search_chromadb(self, query: str, n_results: int) -> List[Dict]:
-        """Search using ChromaDB"""
-        query_embedding = self.embedding_model.encode([query]).tolist()
-        
-        results = self.collection.query(
-            query_embeddings=query_embedding,
-            n_results=n_results,
-            include=["documents", "metadatas", "distances"]
-        )
-        
-        formatted_results = []
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                formatted_results.append({
-                    "content": doc,
-                    "metadata": results["metadatas"][0][i],
-                    "distance": results["distances"][0][i],
-                    "filename": results["metadatas"][0][i]["filename"],
-                    "page": results["metadatas"][0][i]["page"],
-                    "chunk": doc[:200] + "..." if len(doc) > 200 else doc
-                })
-        
-        return formatted_results
-    
-    def _search_faiss(self, query: str, n_results: int) -> List[Dict]:
-        """Search using FAISS"""
-        query_embedding = self.embedding_model.encode([query])
-        faiss.normalize_L2(query_embedding)
-        
-        scores, indices = self.index.search(query_embedding.astype('float32'), n_results)
-        
-        results = []
-        for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
-            if idx < len(self.documents):
-                doc = self.documents[idx]
-                metadata = self.metadatas[idx]
-                
-                results.append({
-                    "content": doc.page_content,
-                    "metadata": metadata,
-                    "distance": 1 - score,  # Convert similarity to distance
-                    "filename": metadata.get("filename", "unknown"),
-                    "page": metadata.get("page", 0),
-                    "chunk": doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content
-                })
-        
-        return results
-    
-    def is_empty(self) -> bool:
-        """Check if vector store is empty"""
-        if USE_CHROMADB:
-            try:
-                count = self.collection.count()
-                return count == 0
-            except:
-                return True
-        else:
-            return self.index is None or len(self.documents) == 0
-    
-    def get_stats(self) -> Dict:
-        """Get vector store statistics"""
-        try:
-            if USE_CHROMADB:
-                count = self.collection.count()
-                sample_results = self.collection.get(limit=min(100, count))
-                files = set()
-                if sample_results["metadatas"]:
-                    files = {meta["filename"] for meta in sample_results["metadatas"]}
-                
-                return {
-                    "total_chunks": count,
-                    "total_files": len(files),
-                    "files": list(files),
-                    "backend": "ChromaDB"
-                }
-            else:
-                if self.is_empty():
-                    return {"total_chunks": 0, "total_files": 0, "files": [], "backend": "FAISS"}
-                
-                files = set(meta.get("filename", "unknown") for meta in self.metadatas)
-                
-                return {
-                    "total_chunks": len(self.documents),
-                    "total_files": len(files),
-                    "files": list(files),
-                    "backend": "FAISS"
-                }
-        except Exception as e:
-            return {
-                "total_chunks": 0,
-                "total_files": 0,
-                "files": [],
-                "error": str(e),
-                "backend": "FAISS" if not USE_CHROMADB else "ChromaDB"
-            }
-    
-    def _save_faiss_index(self):
-        """Save FAISS index and metadata"""
-        try:
-            if self.index is not None:
-                faiss.write_index(self.index, os.path.join(self.faiss_path, "index.faiss"))
-            
-            with open(os.path.join(self.faiss_path, "documents.pkl"), "wb") as f:
-                pickle.dump(self.documents, f)
-            
-            with open(os.path.join(self.faiss_path, "metadata.pkl"), "wb") as f:
-                pickle.dump(self.metadatas, f)
-        except Exception as e:
-            print(f"Warning: Failed to save FAISS index: {e}")
-    
-    def _load_faiss_index(self):
-        """Load FAISS index and metadata"""
-        try:
-            index_path = os.path.join(self.faiss_path, "index.faiss")
-            docs_path = os.path.join(self.faiss_path, "documents.pkl")
-            meta_path = os.path.join(self.faiss_path, "metadata.pkl")
-            
-            if all(os.path.exists(p) for p in [index_path, docs_path, meta_path]):
-                self.index = faiss.read_index(index_path)
-                
-                with open(docs_path, "rb") as f:
-                    self.documents = pickle.load(f)
-                
-                with open(meta_path, "rb") as f:
-                    self.metadatas = pickle.load(f)
-                
-                print(f"Loaded existing FAISS index with {len(self.documents)} documents")
-        except Exception as e:
-            print(f"Could not load existing FAISS index: {e}")
-            self.index = None
-            self.documents = []
-            self.metadatas = []
-    
-    def reset(self) -> None:
-        """Reset the vector store"""
-        try:
-            if USE_CHROMADB:
-                self.client.reset()
-                self.collection = self.client.get_or_create_collection(
-                    name="documents",
-                    metadata={"description": "Customer support documents"}
-                )
-            else:
-                self.index = None
-                self.documents = []
-                self.metadatas = []
-                # Remove saved files
-                for filename in ["index.faiss", "documents.pkl", "metadata.pkl"]:
-                    filepath = os.path.join(self.faiss_path, filename)
-                    if os.path.exists(filepath):
-                        os.remove(filepath)
-            
-            print("Vector store reset successfully")
-        except Exception as e:
-            print(f"Error resetting vector store: {str(e)}")
\ No newline at end of file
+import os
+import sys
+import copy
+import json
+import pickle
+import threading
+from itertools import islice
+from typing import Iterable, List, Dict, Optional, Set, Tuple
+from langchain.schema import Document
+from sentence_transformers import SentenceTransformer
+from config import VECTOR_DB_PATH, HF_EMBEDDING_MODEL, EMBED_BATCH_SIZE
+from src.chunk_store import ChunkStore
+from src.chunk_dedup import page_refs
+from src.index_artifact import IndexArtifact
+from src.query_cache import next_version, search_cache
+from src.text_normalizer import normalize_query
+
+# Try to fix SQLite issue first
+try:
+    import pysqlite3.dbapi2 as sqlite3
+    sys.modules['sqlite3'] = sqlite3
+    print("Using pysqlite3-binary for SQLite compatibility")
+except ImportError:
+    pass
+
+# Try ChromaDB first, fall back to FAISS if SQLite issues
+USE_CHROMADB = True
+try:
+    import chromadb
+    from chromadb.config import Settings
+    print("Using ChromaDB for vector storage")
+except RuntimeError as e:
+    if "sqlite3" in str(e).lower():
+        print("ChromaDB SQLite issue detected, falling back to FAISS")
+        USE_CHROMADB = False
+    else:
+        raise e
+
+# FAISS is the fallback backend and serves prebuilt index artifacts
+try:
+    import faiss
+    import numpy as np
+except ImportError:
+    faiss = None
+
+class VectorStore:
+    def __init__(self, faiss_path: Optional[str] = None, artifact_path: Optional[str] = None):
+        """Open the vector store
+        
+        faiss_path or artifact_path select the FAISS backend even where
+        ChromaDB works. With artifact_path the index and chunks are loaded
+        from a prebuilt artifact (see src.build_index) and nothing is parsed
+        or embedded at startup.
+        """
+        self._embedding_model = None
+        self.artifact_path = artifact_path
+        # Stamped anew on every change, so cached search results of older contents miss
+        self.cache_version = next_version()
+        self.use_chromadb = USE_CHROMADB and faiss_path is None and artifact_path is None
+        
+        if self.use_chromadb:
+            self._init_chromadb()
+        else:
+            self._init_faiss(faiss_path or VECTOR_DB_PATH + "_faiss")
+    
+    @property
+    def embedding_model(self) -> SentenceTransformer:
+        """Embedding model, loaded on first use rather than at startup"""
+        if self._embedding_model is None:
+            self._embedding_model = SentenceTransformer(HF_EMBEDDING_MODEL)
+        return self._embedding_model
+    
+    def _init_chromadb(self):
+        """Initialize ChromaDB"""
+        self.client = chromadb.PersistentClient(
+            path=VECTOR_DB_PATH,
+            settings=Settings(allow_reset=True)
+        )
+        
+        self.collection = self.client.get_or_create_collection(
+            name="documents",
+            metadata={"description": "Customer support documents"}
+        )
+    
+    def _init_faiss(self, faiss_path: str):
+        """Initialize FAISS as fallback"""
+        if faiss is None:
+            raise ImportError("faiss is required for the FAISS backend (pip install faiss-cpu)")
+        
+        self.faiss_path = faiss_path
+        os.makedirs(self.faiss_path, exist_ok=True)
+        
+        self.index = None
+        self.chunks = ChunkStore()
+        self.generation = 0
+        self._dirty = False
+        # Uploads are embedded on a worker thread while the chat searches
+        self._lock = threading.RLock()
+        self._current_stat = None
+        
+        # Try to load existing index
+        if self.artifact_path:
+            self._load_artifact(self.artifact_path)
+        else:
+            self._load_faiss_index()
+    
+    def add_documents(self, documents: List[Document]) -> None:
+        """Add documents to the vector store"""
+        if not documents:
+            return
+        
+        print(f"Adding {len(documents)} documents to vector store...")
+        self.add_documents_stream(documents)
+    
+    def add_documents_stream(self, documents: Iterable[Document],
+                             batch_size: int = EMBED_BATCH_SIZE) -> int:
+        """Embed and store documents from any iterable in fixed-size batches
+        
+        Each batch is encoded and written before the next one is pulled from
+        the iterable, so peak memory depends on the batch size rather than the
+        corpus size. Returns the number of documents added.
+        """
+        total = 0
+        iterator = iter(documents)
+        
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            
+            self.add_batch(batch)
+            total += len(batch)
+        
+        if total:
+            self.commit()
+        
+        backend = "ChromaDB" if self.use_chromadb else "FAISS"
+        print(f"Successfully added {total} documents to {backend}")
+        return total
+    
+    def add_batch(self, documents: List[Document]) -> None:
+        """Embed and add one batch; FAISS batches become durable on commit()"""
+        if self.use_chromadb:
+            self._add_documents_chromadb(documents)
+        else:
+            self._add_documents_faiss(documents)
+    
+    def commit(self) -> None:
+        """Make all added batches durable
+        
+        ChromaDB writes every batch in its own transaction already. FAISS is
+        saved as a new generation that replaces the previous one atomically;
+        added batches and deletions since the last commit are written
+        together. A failed save raises and leaves them pending, so callers
+        never record work as done that is not on disk.
+        """
+        if not self.use_chromadb and self._dirty:
+            with self._lock:
+                self._save_faiss_index()
+    
+    def existing_ids(self, chunk_ids: List[str]) -> Set[str]:
+        """Return the subset of chunk_ids that are already stored"""
+        if not chunk_ids:
+            return set()
+        
+        if self.use_chromadb:
+            found = set()
+            batch_size = 100
+            for i in range(0, len(chunk_ids), batch_size):
+                result = self.collection.get(ids=chunk_ids[i:i + batch_size], include=[])
+                found.update(result["ids"])
+            return found
+        
+        wanted = set(chunk_ids)
+        with self._lock:
+            return {chunk_id for chunk_id in self.chunks.chunk_ids() if chunk_id in wanted}
+    
+    def _add_documents_chromadb(self, documents: List[Document]) -> None:
+        """Add one batch of documents to ChromaDB"""
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        ids = [doc.metadata["chunk_id"] for doc in documents]
+        
+        # Generate embeddings
+        embeddings = self.embedding_model.encode(texts).tolist()
+        
+        # Upsert so a batch replayed after an interrupted run does not fail
+        self.collection.upsert(
+            documents=texts,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=embeddings
+        )
+        self.cache_version = next_version()
+    
+    def _add_documents_faiss(self, documents: List[Document]) -> None:
+        """Add one batch of documents to the in-memory FAISS index"""
+        texts = [doc.page_content for doc in documents]
+        embeddings = self.embedding_model.encode(texts)
+        
+        # Normalize embeddings for cosine similarity
+        faiss.normalize_L2(embeddings)
+        
+        # Encoding above runs unlocked; index and chunks change together
+        with self._lock:
+            # Initialize or expand FAISS index
+            if self.index is None:
+                dimension = embeddings.shape[1]
+                self.index = faiss.IndexFlatIP(dimension)
+            
+            # Add to index
+            self.index.add(embeddings.astype('float32'))
+            
+            # Store chunk offsets; offset chunks share their document's text buffer
+            self.chunks.extend(documents)
+            self._dirty = True
+            self.cache_version = next_version()
+    
+    def delete_documents(self, chunk_ids: List[str]) -> None:
+        """Remove chunks from the vector store by chunk id; FAISS deletions become durable on commit()"""
+        if not chunk_ids:
+            return
+        
+        print(f"Removing {len(chunk_ids)} documents from vector store...")
+        
+        if self.use_chromadb:
+            batch_size = 100
+            for i in range(0, len(chunk_ids), batch_size):
+                self.collection.delete(ids=chunk_ids[i:i + batch_size])
+            self.cache_version = next_version()
+        else:
+            self._delete_documents_faiss(chunk_ids)
+    
+    def delete_file(self, filename: str) -> None:
+        """Remove every chunk of a file, whatever chunk ids it had"""
+        if self.use_chromadb:
+            self.collection.delete(where={"filename": filename})
+            self.cache_version = next_version()
+        elif self.index is not None:
+            with self._lock:
+                positions = self.chunks.positions_for_filename(filename)
+                if positions:
+                    self.index.remove_ids(np.array(positions, dtype='int64'))
+                    self.chunks.remove(positions)
+                    self._dirty = True
+                    self.cache_version = next_version()
+    
+    def _delete_documents_faiss(self, chunk_ids: List[str]) -> None:
+        """Remove chunks from FAISS, keeping documents and vectors aligned"""
+        if self.index is None:
+            return
+        
+        with self._lock:
+            stale = set(chunk_ids)
+            positions = [i for i, chunk_id in enumerate(self.chunks.chunk_ids()) if chunk_id in stale]
+            if not positions:
+                return
+            
+            self.index.remove_ids(np.array(positions, dtype='int64'))
+            self.chunks.remove(positions)
+            self._dirty = True
+            self.cache_version = next_version()
+    
+    def refresh(self) -> bool:
+        """Switch to a newer FAISS generation saved by another process
+        
+        The directory watcher writes new generations while the app is
+        running; a stat of the CURRENT pointer tells whether one appeared.
+        Skipped while this instance has uncommitted batches, and for a store
+        serving an index artifact. ChromaDB reads its shared database
+        directly, so there is nothing to reload.
+        """
+        if self.use_chromadb or self._dirty or self.artifact_path:
+            return False
+        
+        current_path = os.path.join(self.faiss_path, "CURRENT")
+        try:
+            stat = os.stat(current_path)
+        except OSError:
+            return False
+        
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._current_stat:
+            return False
+        
+        try:
+            current = self._read_current()
+            if current["generation"] == self.generation:
+                self._current_stat = key
+                return False
+            index, chunks = self._read_generation(current)
+        except Exception as e:
+            # The writer may have replaced that generation meanwhile; retry on the next call
+            print(f"Could not load FAISS generation: {e}")
+            return False
+        
+        with self._lock:
+            self.index = index
+            self.chunks = chunks
+            self.generation = current["generation"]
+            self._current_stat = key
+            self.cache_version = next_version()
+        print(f"Loaded FAISS generation {self.generation} with {len(chunks)} documents")
+        return True
+    
+    def search(self, query: str, n_results: int = 5) -> List[Dict]:
+        """Search for relevant documents
+        
+        Results are kept in the shared query cache under the normalized
+        query and cache_version, so a repeated question skips embedding and
+        search until this store changes. ChromaDB writes of other processes
+        are not seen by cache_version; QUERY_CACHE_TTL_SECONDS bounds how
+        long such results stay cached. Callers get copies of the cached
+        results, which every session shares.
+        """
+        if not self.use_chromadb:
+            self.refresh()
+        
+        if self.is_empty():
+            return []
+        
+        key = ("vectors", self.cache_version, normalize_query(query), n_results)
+        return copy.deepcopy(search_cache.get_or_compute(key, lambda: self._search(query, n_results)))
+    
+    def _search(self, query: str, n_results: int) -> List[Dict]:
+        if self.use_chromadb:
+            return self._search_chromadb(query, n_results)
+        else:
+            return self._search_faiss(query, n_results)
+    
+    def _search_chromadb(self, query: str, n_results: int) -> List[Dict]:
+        """Search using ChromaDB"""
+        query_embedding = self.embedding_model.encode([query]).tolist()
+        
+        results = self.collection.query(
+            query_embeddings=query_embedding,
+            n_results=n_results,
+            include=["documents", "metadatas", "distances"]
+        )
+        
+        formatted_results = []
+        if results["documents"] and results["documents"][0]:
+            for i, doc in enumerate(results["documents"][0]):
+                formatted_results.append({
+                    "content": doc,
+                    "metadata": results["metadatas"][0][i],
+                    "distance": results["distances"][0][i],
+                    "filename": results["metadatas"][0][i]["filename"],
+                    "page": results["metadatas"][0][i]["page"],
+                    "page_refs": page_refs(results["metadatas"][0][i]),
+                    "chunk": doc[:200] + "..." if len(doc) > 200 else doc
+                })
+        
+        return formatted_results
+    
+    def _search_faiss(self, query: str, n_results: int) -> List[Dict]:
+        """Search using FAISS"""
+        query_embedding = self.embedding_model.encode([query])
+        faiss.normalize_L2(query_embedding)
+        
+        results = []
+        with self._lock:
+            scores, indices = self.index.search(query_embedding.astype('float32'), n_results)
+            
+            for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
+                if 0 <= idx < len(self.chunks):
+                    # Text is only sliced out of the shared buffer for returned results
+                    content = self.chunks.text(idx)
+                    metadata = self.chunks.metadata(idx)
+                    
+                    results.append({
+                        "content": content,
+                        "metadata": metadata,
+                        "distance": 1 - score,  # Convert similarity to distance
+                        "filename": metadata.get("filename", "unknown"),
+                        "page": metadata.get("page", 0),
+                        "page_refs": page_refs(metadata),
+                        "chunk": content[:200] + "..." if len(content) > 200 else content
+                    })
+        
+        return results
+    
+    def is_empty(self) -> bool:
+        """Check if vector store is empty"""
+        if self.use_chromadb:
+            try:
+                count = self.collection.count()
+                return count == 0
+            except:
+                return True
+        else:
+            return self.index is None or len(self.chunks) == 0
+    
+    def get_stats(self) -> Dict:
+        """Get vector store statistics"""
+        try:
+            if self.use_chromadb:
+                count = self.collection.count()
+                sample_results = self.collection.get(limit=min(100, count))
+                files = set()
+                if sample_results["metadatas"]:
+                    files = {meta["filename"] for meta in sample_results["metadatas"]}
+                
+                return {
+                    "total_chunks": count,
+                    "total_files": len(files),
+                    "files": list(files),
+                    "backend": "ChromaDB"
+                }
+            else:
+                if self.is_empty():
+                    return {"total_chunks": 0, "total_files": 0, "files": [], "backend": "FAISS"}
+                
+                files = self.chunks.filenames()
+                
+                return {
+                    "total_chunks": len(self.chunks),
+                    "total_files": len(files),
+                    "files": list(files),
+                    "backend": "FAISS"
+                }
+        except Exception as e:
+            return {
+                "total_chunks": 0,
+                "total_files": 0,
+                "files": [],
+                "error": str(e),
+                "backend": "FAISS" if not self.use_chromadb else "ChromaDB"
+            }
+    
+    def _save_faiss_index(self):
+        """Save FAISS index and chunks as a new generation
+        
+        Both files are written under new names and fsynced before the CURRENT
+        pointer is atomically replaced, so a crash at any point leaves the
+        previous generation intact instead of a half-written index. Errors
+        propagate to commit(); only removing older generations is best effort.
+        """
+        generation = self.generation + 1
+        index_name = f"index.{generation}.faiss" if self.index is not None else None
+        chunks_name = f"chunks.{generation}.pkl"
+        
+        if index_name:
+            index_path = os.path.join(self.faiss_path, index_name)
+            faiss.write_index(self.index, index_path)
+            _fsync_path(index_path)
+        
+        with open(os.path.join(self.faiss_path, chunks_name), "wb") as f:
+            pickle.dump(self.chunks, f)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        current_path = os.path.join(self.faiss_path, "CURRENT")
+        with open(current_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"generation": generation, "index": index_name, "chunks": chunks_name}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(current_path + ".tmp", current_path)
+        self.generation = generation
+        self._dirty = False
+        
+        # Drop older generations and the single-file layouts of older versions
+        keep = {"CURRENT", index_name, chunks_name}
+        try:
+            for filename in os.listdir(self.faiss_path):
+                if filename not in keep and filename.endswith((".faiss", ".pkl")):
+                    os.remove(os.path.join(self.faiss_path, filename))
+        except OSError as e:
+            print(f"Warning: Failed to remove old FAISS generations: {e}")
+    
+    def _read_current(self) -> Dict:
+        with open(os.path.join(self.faiss_path, "CURRENT"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def _read_generation(self, current: Dict):
+        """Read the index and chunks a CURRENT pointer refers to"""
+        index = None
+        if current["index"]:
+            index = faiss.read_index(os.path.join(self.faiss_path, current["index"]))
+        
+        with open(os.path.join(self.faiss_path, current["chunks"]), "rb") as f:
+            chunks = pickle.load(f)
+        return index, chunks
+    
+    def _load_faiss_index(self):
+        """Load FAISS index and chunks of the current generation"""
+        try:
+            current_path = os.path.join(self.faiss_path, "CURRENT")
+            index_path = os.path.join(self.faiss_path, "index.faiss")
+            chunks_path = os.path.join(self.faiss_path, "chunks.pkl")
+            docs_path = os.path.join(self.faiss_path, "documents.pkl")
+            
+            if os.path.exists(current_path):
+                current = self._read_current()
+                self.index, self.chunks = self._read_generation(current)
+                self.generation = current["generation"]
+                print(f"Loaded existing FAISS index with {len(self.chunks)} documents")
+            elif os.path.exists(index_path) and os.path.exists(chunks_path):
+                self.index = faiss.read_index(index_path)
+                
+                with open(chunks_path, "rb") as f:
+                    self.chunks = pickle.load(f)
+                
+                print(f"Loaded existing FAISS index with {len(self.chunks)} documents")
+            elif os.path.exists(index_path) and os.path.exists(docs_path):
+                # Index written by an older version: one pickled Document per chunk
+                self.index = faiss.read_index(index_path)
+                
+                with open(docs_path, "rb") as f:
+                    self.chunks.extend(pickle.load(f))
+                
+                print(f"Loaded existing FAISS index with {len(self.chunks)} documents")
+        except Exception as e:
+            print(f"Could not load existing FAISS index: {e}")
+            self.index = None
+            self.chunks = ChunkStore()
+    
+    def _load_artifact(self, artifact_path: str):
+        """Load index and chunks from a prebuilt artifact
+        
+        Unlike a missing local index, a bad artifact is an error: it was
+        asked for explicitly and serving an empty store would hide that.
+        """
+        artifact = IndexArtifact(artifact_path)
+        model = artifact.metadata.get("embedding_model")
+        if model != HF_EMBEDDING_MODEL:
+            raise ValueError(f"{artifact_path} was embedded with {model}, not {HF_EMBEDDING_MODEL}")
+        
+        if "index" in artifact.sections:
+            self.index = faiss.deserialize_index(np.frombuffer(artifact.read("index"), dtype='uint8'))
+        self.chunks = pickle.loads(artifact.read("chunks"))
+        print(f"Loaded index artifact {artifact.checksum[:12]} with {len(self.chunks)} documents")
+    
+    def artifact_sections(self) -> Dict[str, bytes]:
+        """Serialized FAISS index and chunks for src.index_artifact.write_artifact"""
+        if self.use_chromadb:
+            raise ValueError("Index artifacts are built with the FAISS backend")
+        
+        with self._lock:
+            sections = {"chunks": pickle.dumps(self.chunks, protocol=pickle.HIGHEST_PROTOCOL)}
+            if self.index is not None:
+                sections["index"] = faiss.serialize_index(self.index).tobytes()
+        return sections
+    
+    def reset(self) -> None:
+        """Reset the vector store"""
+        try:
+            if self.use_chromadb:
+                self.client.reset()
+                self.collection = self.client.get_or_create_collection(
+                    name="documents",
+                    metadata={"description": "Customer support documents"}
+                )
+            else:
+                self.index = None
+                self.chunks = ChunkStore()
+                self._dirty = False
+                # Remove saved files of every generation
+                for filename in os.listdir(self.faiss_path):
+                    if filename == "CURRENT" or filename.endswith((".faiss", ".pkl")):
+                        os.remove(os.path.join(self.faiss_path, filename))
+            
+            self.cache_version = next_version()
+            print("Vector store reset successfully")
+        except Exception as e:
+            print(f"Error resetting vector store: {str(e)}")
+
+def _fsync_path(path: str) -> None:
+    """Flush a file written by a library that does not expose its handle"""
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
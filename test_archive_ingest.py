@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script to check that PDFs inside archives are ingested member by member
+"""
+
+import os
+import tempfile
+import zipfile
+
+import src.page_cache as page_cache
+from src.document_processor import DocumentProcessor
+from src.ingest_manifest import IngestManifest
+
+DOCUMENTS = "data/documents"
+
+def write_archive(archive_path, members):
+    """Zip of {member name: PDF file in data/documents}"""
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        for name, source in members.items():
+            archive.write(os.path.join(DOCUMENTS, source), name)
+        archive.writestr("readme.txt", "Not a document")
+
+def test_archive_members_reingested_on_change():
+    with tempfile.TemporaryDirectory() as work_dir:
+        saved_cache = page_cache._default_cache
+        page_cache._default_cache = page_cache.PageCache(os.path.join(work_dir, "page_cache"))
+        try:
+            archive_path = os.path.join(work_dir, "docs.zip")
+            manifest = IngestManifest(os.path.join(work_dir, "manifest.json"))
+            processor = DocumentProcessor(workers=1)
+
+            write_archive(archive_path, {"faq.pdf": "FAQ_TechCorp.pdf",
+                                         "policies/policies.pdf": "Company_Policies.pdf"})
+            chunks, members = processor.process_archive(archive_path, manifest)
+            assert sorted(member[0] for member in members) == [
+                os.path.join(archive_path, "faq.pdf"), os.path.join(archive_path, "policies/policies.pdf")]
+            assert chunks and all(member[3] for member in members)
+            assert {chunk.metadata["filename"] for chunk in chunks} == {"docs.zip/faq.pdf",
+                                                                         "docs.zip/policies/policies.pdf"}
+            assert manifest.stale_member_ids(archive_path, members) == []
+            manifest.record_members(archive_path, members)
+            faq_path, _, faq_sha256, faq_ids = next(m for m in members if m[0].endswith("faq.pdf"))
+            assert manifest.is_member_unchanged(faq_path, faq_sha256)
+            assert not manifest.is_member_unchanged(faq_path, "0" * 64)
+
+            # Unchanged archive: nothing is read again
+            chunks, members = processor.process_archive(archive_path, manifest)
+            assert chunks == [] and all(member[3] is None for member in members)
+            assert manifest.stale_member_ids(archive_path, members) == []
+
+            # One member edited, one removed, one added
+            policies_ids = manifest.get(os.path.join(archive_path, "policies/policies.pdf"))["chunk_ids"]
+            write_archive(archive_path, {"faq.pdf": "Product_Manual_TechCorp.pdf",
+                                         "manual.pdf": "Company_Policies.pdf"})
+            chunks, members = processor.process_archive(archive_path, manifest)
+            assert {chunk.metadata["filename"] for chunk in chunks} == {"docs.zip/faq.pdf", "docs.zip/manual.pdf"}
+            stale = manifest.stale_member_ids(archive_path, members)
+            assert sorted(stale) == sorted(faq_ids + policies_ids), stale
+
+            manifest.record_members(archive_path, members)
+            assert sorted(manifest.entries) == [os.path.join(archive_path, "faq.pdf"),
+                                                os.path.join(archive_path, "manual.pdf")]
+            assert not manifest.is_member_unchanged(faq_path, faq_sha256)
+        finally:
+            page_cache._default_cache = saved_cache
+        print("✅ Archive members skipped when unchanged, stale chunks of edited and removed members found")
+
+if __name__ == "__main__":
+    test_archive_members_reingested_on_change()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script to check near-duplicate chunk elimination
+"""
+
+from src.chunk_dedup import deduplicate_chunks
+from src.chunk_store import chunk_pages
+from src.text_splitter import RecursiveTextSplitter
+
+TEMPLATE = """{title}
+In today's rapidly changing world, the topic of "{title}" has become
+increasingly significant. Various perspectives on this issue suggest that it has both
+positive and negative implications. On the one hand, it encourages progress and
+innovation; on the other, it presents new challenges and dilemmas.
+One important aspect to consider is how it affects individuals and communities. Experts
+believe that by understanding and addressing this topic, society can benefit in numerous
+ways. It is also essential to examine how different cultures and demographics perceive this
+issue, as this often influences public opinion and policy decisions. By studying historical
+examples and current trends, we can gain valuable insights. While some critics argue against
+certain approaches, others believe in their potential to bring about meaningful change."""
+
+FOOTER = "TechCorp Solutions - Confidential - Page {page}"
+
+def make_chunks(page_texts):
+    splitter = RecursiveTextSplitter(chunk_size=1000, chunk_overlap=200)
+    return chunk_pages(splitter, enumerate(page_texts, 1), {"filename": "test.pdf", "total_pages": len(page_texts)})
+
+def test_template_sections_survive():
+    titles = ["Fundamental value-added architecture - Essay #1",
+              "Decentralized next generation array - Essay #2",
+              "Synergized modular budgetary management - Essay #3",
+              "Horizontal mobile emulation - Essay #4"]
+    pages = [TEMPLATE.format(title=title) + "\n" + FOOTER.format(page=page)
+             for page, title in enumerate(titles, 1)]
+
+    unique = deduplicate_chunks(make_chunks(pages), threshold=0.85)
+    kept_titles = [chunk.page_content.split("\n", 1)[0] for chunk in unique]
+    assert kept_titles == titles, f"Sections sharing a template were merged: {kept_titles}"
+    print(f"✅ {len(titles)} sections with a shared template all kept")
+
+def test_repeated_pages_collapse():
+    boilerplate = "All rights reserved. TechCorp Solutions accepts no liability for misuse."
+    answer = "Q: What is your refund policy?\nA: We offer full refunds within 30 days of purchase."
+    pages = [boilerplate + "\n" + FOOTER.format(page=page) for page in range(1, 6)]
+    pages.insert(2, answer)
+
+    unique = deduplicate_chunks(make_chunks(pages), threshold=0.85)
+    assert [chunk.page for chunk in unique] == [1, 3], [chunk.page for chunk in unique]
+    assert unique[0].metadata["page_refs"] == "1,2,4,5,6", unique[0].metadata
+    print("✅ Repeated boilerplate pages collapsed into one chunk with page references")
+
+if __name__ == "__main__":
+    test_template_sections_survive()
+    test_repeated_pages_collapse()
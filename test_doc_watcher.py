@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script to check that the document watcher reports settled changes once
+"""
+
+import os
+import queue
+import tempfile
+import time
+
+from src.doc_watcher import DirectoryWatcher
+
+DEBOUNCE = 0.5
+
+def write(path, size):
+    with open(path, 'wb') as f:
+        f.write(b"x" * size)
+
+def test_polling_debounce():
+    with tempfile.TemporaryDirectory() as directory:
+        write(os.path.join(directory, "old.pdf"), 10)
+        changes = queue.Queue()
+        watcher = DirectoryWatcher(directory, lambda names: changes.put((time.monotonic(), names)),
+                                   extensions=('.pdf', '.zip'), debounce=DEBOUNCE,
+                                   poll_interval=0.05, use_inotify=False)
+        watcher.start()
+        try:
+            time.sleep(0.2)
+            assert changes.empty(), "Files present at start were reported"
+
+            # A file copied in several writes, plus others arriving meanwhile
+            for size in range(1, 6):
+                write(os.path.join(directory, "manual.pdf"), size * 100)
+                time.sleep(0.1)
+            write(os.path.join(directory, "bundle.zip"), 50)
+            write(os.path.join(directory, "notes.txt"), 50)
+            last_write = time.monotonic()
+
+            reported_at, names = changes.get(timeout=5)
+            assert names == {"manual.pdf", "bundle.zip"}, names
+            assert reported_at - last_write >= DEBOUNCE, "Reported before the changes settled"
+            time.sleep(DEBOUNCE + 0.2)
+            assert changes.empty(), "One burst of changes was reported more than once"
+
+            # Edits and deletions are reported by name as well
+            write(os.path.join(directory, "old.pdf"), 20)
+            os.remove(os.path.join(directory, "bundle.zip"))
+            _, names = changes.get(timeout=5)
+            assert names == {"old.pdf", "bundle.zip"}, names
+        finally:
+            watcher.stop()
+        print("✅ Polling watcher reports each burst of changes once, after it settled")
+
+if __name__ == "__main__":
+    test_polling_debounce()
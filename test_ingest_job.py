@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test script to check that an interrupted ingestion job resumes without re-embedding
+"""
+
+import os
+import tempfile
+
+from src.chunk_dedup import deduplicate_chunks
+from src.chunk_store import chunk_pages
+from src.ingest_job import IngestCheckpoint, IngestJob
+from src.ingest_manifest import IngestManifest, page_hash
+from src.text_splitter import RecursiveTextSplitter
+
+class TextProcessor:
+    """Chunks .txt files whose pages are separated by form feeds"""
+
+    SUPPORTED_EXTENSIONS = ('.txt',)
+
+    def __init__(self):
+        self.splitter = RecursiveTextSplitter(chunk_size=200, chunk_overlap=0)
+
+    def process_file(self, file_path, manifest=None):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            pages = f.read().split("\f")
+        metadata = {"filename": os.path.basename(file_path), "total_pages": len(pages)}
+        return chunk_pages(self.splitter, enumerate(pages, 1), metadata)
+
+class PagedTextProcessor(TextProcessor):
+    """TextProcessor that hashes pages and collapses near-duplicate chunks, like DocumentProcessor"""
+
+    def process_file_pages(self, file_path, manifest=None):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            pages = f.read().split("\f")
+        chunks = deduplicate_chunks(self.process_file(file_path, manifest), threshold=0.85)
+        return chunks, [page_hash(page) for page in pages]
+
+class MemoryVectorStore:
+    """Vector store that keeps chunk ids, losing uncommitted work when a commit fails"""
+
+    def __init__(self):
+        self.committed = {}
+        self.pending = {}
+        self.deleted = set()
+        self.embedded = []
+        self.removed = []
+        self.fail_commits_after = None
+
+    def add_batch(self, documents):
+        for doc in documents:
+            self.embedded.append(doc.metadata["chunk_id"])
+            self.pending[doc.metadata["chunk_id"]] = doc.metadata
+
+    def commit(self):
+        if self.fail_commits_after is not None:
+            if self.fail_commits_after == 0:
+                self.pending.clear()
+                self.deleted.clear()
+                raise OSError("disk full")
+            self.fail_commits_after -= 1
+        for chunk_id in self.deleted:
+            self.committed.pop(chunk_id, None)
+        self.committed.update(self.pending)
+        self.pending.clear()
+        self.deleted.clear()
+
+    def existing_ids(self, chunk_ids):
+        return {chunk_id for chunk_id in chunk_ids if chunk_id in self.committed}
+
+    def delete_documents(self, chunk_ids):
+        self.removed.extend(chunk_ids)
+        self.deleted.update(chunk_ids)
+        for chunk_id in chunk_ids:
+            self.pending.pop(chunk_id, None)
+
+    def delete_file(self, filename):
+        self.delete_documents([chunk_id for chunk_id, metadata in self.committed.items()
+                               if metadata["filename"] == filename])
+
+def write_text(path, pages, words=60):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\f".join(" ".join(f"{name}{i}" for i in range(words)) for name in pages))
+
+def make_job(work_dir, store, processor=None):
+    return IngestJob(os.path.join(work_dir, "docs"), processor or TextProcessor(), store,
+                     manifest=IngestManifest(os.path.join(work_dir, "manifest.json")),
+                     checkpoint=IngestCheckpoint(os.path.join(work_dir, "checkpoint.json")),
+                     batch_size=2, commit_every=1)
+
+def test_resume_after_failed_commit():
+    with tempfile.TemporaryDirectory() as work_dir:
+        docs = os.path.join(work_dir, "docs")
+        os.makedirs(docs)
+        write_text(os.path.join(docs, "a.txt"), ["alpha", "beta"])
+        write_text(os.path.join(docs, "b.txt"), ["gamma", "delta", "epsilon"])
+        a_ids = [chunk.metadata["chunk_id"] for chunk in TextProcessor().process_file(os.path.join(docs, "a.txt"))]
+        b_ids = [chunk.metadata["chunk_id"] for chunk in TextProcessor().process_file(os.path.join(docs, "b.txt"))]
+        assert (len(a_ids), len(b_ids)) == (6, 9)
+
+        # a.txt commits 5 times (start, 3 batches, end); b.txt fails on its third batch
+        store = MemoryVectorStore()
+        store.fail_commits_after = 5 + 1 + 2
+        stats = make_job(work_dir, store).run()
+        assert (stats["files"], stats["failed"]) == (1, 1), stats
+        assert set(store.committed) == set(a_ids + b_ids[:4]), sorted(store.committed)
+        manifest = IngestManifest(os.path.join(work_dir, "manifest.json"))
+        assert manifest.get(os.path.join(docs, "a.txt")) and not manifest.get(os.path.join(docs, "b.txt")), \
+            "The manifest moved past what the store committed"
+
+        # A new run skips a.txt and embeds only what b.txt is missing
+        store.fail_commits_after = None
+        store.embedded.clear()
+        stats = make_job(work_dir, store).run()
+        assert (stats["files"], stats["skipped"], stats["failed"]) == (1, 1, 0), stats
+        assert (stats["reused"], stats["chunks"]) == (4, 5), stats
+        assert store.embedded == b_ids[4:], store.embedded
+        assert set(store.committed) == set(a_ids + b_ids)
+        assert not os.path.exists(os.path.join(work_dir, "checkpoint.json"))
+        print(f"✅ Resumed after a failed commit: {stats['reused']} chunks kept, {stats['chunks']} embedded")
+
+        # Nothing changed: nothing to do, and no file is even hashed
+        job = make_job(work_dir, store)
+        stats = job.run()
+        assert (stats["files"], stats["skipped"], stats["chunks"]) == (0, 2, 0), stats
+        assert not job.manifest._hashes, "Unchanged files were hashed"
+
+        # An edited file is replaced, a deleted one pruned
+        write_text(os.path.join(docs, "a.txt"), ["alpha"])
+        os.remove(os.path.join(docs, "b.txt"))
+        stats = make_job(work_dir, store).run()
+        assert (stats["files"], stats["removed"]) == (1, len(b_ids)), stats
+        assert set(store.committed) == set(a_ids[:3]), sorted(store.committed)
+        print("✅ Unchanged files skipped, edited files replaced and deleted files pruned")
+
+def test_edited_page_only():
+    with tempfile.TemporaryDirectory() as work_dir:
+        docs = os.path.join(work_dir, "docs")
+        os.makedirs(docs)
+        path = os.path.join(docs, "manual.txt")
+        write_text(path, ["alpha", "beta", "gamma"])
+        store = MemoryVectorStore()
+        make_job(work_dir, store, PagedTextProcessor()).run()
+        page_2 = sorted(chunk_id for chunk_id in store.committed if "_page_2_" in chunk_id)
+
+        write_text(path, ["alpha", "delta", "gamma"])
+        store.embedded.clear()
+        store.removed.clear()
+        stats = make_job(work_dir, store, PagedTextProcessor()).run()
+        assert stats["pages_kept"] == 2, stats
+        assert sorted(store.removed) == page_2, store.removed
+        assert sorted(store.embedded) == page_2, store.embedded
+        print("✅ Only the chunks of the edited page were replaced")
+
+def test_page_refs_updated_on_kept_pages():
+    with tempfile.TemporaryDirectory() as work_dir:
+        docs = os.path.join(work_dir, "docs")
+        os.makedirs(docs)
+        path = os.path.join(docs, "manual.txt")
+        # Page 3 repeats page 1, so its chunks collapse into page 1's
+        write_text(path, ["alpha", "beta", "alpha"])
+        store = MemoryVectorStore()
+        make_job(work_dir, store, PagedTextProcessor()).run()
+        page_1 = sorted(chunk_id for chunk_id in store.committed if "_page_1_" in chunk_id)
+        assert all(store.committed[chunk_id]["page_refs"] == "1,3" for chunk_id in page_1)
+
+        # Page 1 is unchanged, but its chunks no longer stand for page 3
+        write_text(path, ["alpha", "beta", "gamma"])
+        store.embedded.clear()
+        stats = make_job(work_dir, store, PagedTextProcessor()).run()
+        assert stats["pages_kept"] == 2, stats
+        assert sorted(store.embedded) == page_1 + sorted(
+            chunk_id for chunk_id in store.committed if "_page_3_" in chunk_id), store.embedded
+        assert all("page_refs" not in store.committed[chunk_id] for chunk_id in page_1)
+        print("✅ Kept chunks whose page references changed were written again")
+
+if __name__ == "__main__":
+    test_resume_after_failed_commit()
+    test_edited_page_only()
+    test_page_refs_updated_on_kept_pages()
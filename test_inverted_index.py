@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test script to check ranked keyword search over the inverted index
+"""
+
+import math
+import random
+
+from src.inverted_index import rank_pages, tokenize
+from src.paged_document import PagedDocument
+from src.text_normalizer import normalize_query, paragraph_spans
+
+K1 = 1.2
+B = 0.75
+
+def make_document(filename, page_texts):
+    return PagedDocument(filename, "pdf", len(page_texts), enumerate(page_texts, 1))
+
+def exhaustive_bm25(documents, query_terms, k1=K1, b=B):
+    """{(document order, page index): score}, scoring every paragraph of every page"""
+    paragraphs = []
+    for doc_order, doc in enumerate(documents):
+        for index in range(len(doc)):
+            page = doc.normalized_page(index)
+            for start, end in paragraph_spans(page):
+                tokens = tokenize(page[start:end])
+                if tokens:
+                    paragraphs.append((doc_order, index, tokens))
+    average_length = sum(len(tokens) for _, _, tokens in paragraphs) / len(paragraphs)
+
+    idfs = []
+    for term in query_terms:
+        frequency = sum(1 for _, _, tokens in paragraphs if any(token.startswith(term) for token in tokens))
+        idfs.append(math.log(1 + (len(paragraphs) - frequency + 0.5) / (frequency + 0.5)))
+
+    scores = {}
+    for doc_order, index, tokens in paragraphs:
+        norm = k1 * (1 - b + b * len(tokens) / average_length)
+        score = 0.0
+        for term, idf in zip(query_terms, idfs):
+            count = sum(1 for token in tokens if token.startswith(term))
+            score += idf * count * (k1 + 1) / (count + norm)
+        if score > 0:
+            scores[doc_order, index] = max(score, scores.get((doc_order, index), 0.0))
+    return scores
+
+def test_bm25_scores():
+    documents = [
+        make_document("refunds.pdf", [
+            "Refund policy\n\nWe refund purchases within 30 days. Refunds go to the original card.",
+            "Shipping\n\nOrders ship in two days. Refunded orders are not shipped.",
+        ]),
+        make_document("support.pdf", [
+            "Contact support by email.\n\nSupport answers refund questions within a day.",
+            "Warranty\n\nThe warranty covers hardware faults for one year.",
+        ]),
+    ]
+    query_terms = ["refund", "days"]
+    expected = exhaustive_bm25(documents, query_terms)
+
+    hits = rank_pages(documents, query_terms, k=10, k1=K1, b=B)
+    found = {(documents.index(hit.doc), hit.index): hit.score for hit in hits}
+    assert found.keys() == expected.keys(), (found, expected)
+    for key, score in expected.items():
+        assert math.isclose(found[key], score), (key, found[key], score)
+    assert [hit.score for hit in hits] == sorted(found.values(), reverse=True)
+
+    # "refund" also matches "refunds" and "refunded", as the substring search did
+    best = hits[0]
+    assert (best.doc.filename, best.index, best.term_count) == ("refunds.pdf", 0, 2)
+    assert "Refunds go to the original card" in best.doc.paragraph_text(best.paragraph)
+    print(f"✅ BM25 scores of {len(hits)} pages match the formula")
+
+def find_phrase_spans(doc, query):
+    """{page index: original text} of the first match of a phrase on each page"""
+    tokens = tokenize(normalize_query(query))
+    spans = {}
+    for index, (paragraph, ordinal) in doc.search_index.find_phrase(tokens).items():
+        start, end = doc.search_index.term_span(doc.normalized_page(index), paragraph, ordinal, len(tokens))
+        orig_start, orig_end = doc.original_span(index, start, end)
+        spans[index] = doc.page_text(index)[orig_start:orig_end]
+    return spans
+
+def test_phrase_hits_map_to_original():
+    doc = make_document("essays.pdf", [
+        "Introduction\n\nThe ﬁrst essays are listed below.",
+        "Essay  #288 - Cross-platform re\u00adfund work-\nflow\n\nEssay #289 follows.",
+        "See ESSAY#288 again.\n\nThe refund workflow for essay 288 is in the appendix.",
+        "Nothing here but essay and 288 apart.",
+    ])
+
+    assert find_phrase_spans(doc, "Essay#288") == {1: "Essay  #288", 2: "ESSAY#288"}
+    assert find_phrase_spans(doc, "refund workflow") == {1: "re\u00adfund work-\nflow", 2: "refund workflow"}
+    assert find_phrase_spans(doc, "first essays") == {0: "ﬁrst essays"}
+    # The last token may be the start of a longer term when nothing matches whole
+    assert find_phrase_spans(doc, "essay #28") == {1: "Essay  #288", 2: "ESSAY#288"}
+    # Tokens must be consecutive within one paragraph
+    assert find_phrase_spans(doc, "workflow essay") == {}
+    assert find_phrase_spans(doc, "flow essay") == {}
+    print("✅ Phrase hits mapped back to their original text")
+
+def random_documents(rng, words):
+    documents = []
+    for doc_number in range(6):
+        pages = []
+        for _ in range(rng.randint(1, 8)):
+            paragraphs = [" ".join(rng.choices(words, k=rng.randint(3, 40))) for _ in range(rng.randint(1, 4))]
+            pages.append("\n\n".join(paragraphs))
+        documents.append(make_document(f"doc{doc_number}.pdf", pages))
+    return documents
+
+def ranking(scores, k):
+    """Top k of {(document order, page index): score}: best score, then earliest page"""
+    order = sorted(scores.items(), key=lambda item: (-round(item[1], 9), item[0]))
+    return [(key, round(score, 9)) for key, score in order[:k]]
+
+def test_maxscore_matches_exhaustive():
+    rng = random.Random(42)
+    # Skewed term frequencies, and terms that are prefixes of others
+    words = [f"w{n}" for n in range(60)] + ["refund", "refunds", "refunded", "ship", "shipping"]
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    documents = random_documents(rng, rng.choices(words, weights, k=2000))
+
+    queries = 300
+    for _ in range(queries):
+        query_terms = list(dict.fromkeys(rng.choices(words, k=rng.randint(1, 5))))
+        k = rng.choice([1, 3, 5, 10])
+        pages = None
+        if rng.random() < 0.3:
+            pages = {id(doc): set(rng.sample(range(len(doc)), rng.randint(0, len(doc)))) for doc in documents}
+
+        scores = exhaustive_bm25(documents, query_terms)
+        if pages is not None:
+            scores = {(doc_order, index): score for (doc_order, index), score in scores.items()
+                      if index in pages[id(documents[doc_order])]}
+        hits = rank_pages(documents, query_terms, k, pages=pages, k1=K1, b=B)
+        found = [((documents.index(hit.doc), hit.index), round(hit.score, 9)) for hit in hits]
+        assert found == ranking(scores, k), (query_terms, k, found, ranking(scores, k))
+    print(f"✅ MaxScore top-k equals exhaustive BM25 top-k on {queries} random queries")
+
+if __name__ == "__main__":
+    test_bm25_scores()
+    test_phrase_hits_map_to_original()
+    test_maxscore_matches_exhaustive()
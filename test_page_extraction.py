@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script to check supervised page extraction with stub extractors
+
+A stub "PDF" is bytes naming what each page does, e.g. b"ok sleep ok":
+"ok" returns text, "sleep" hangs, "alloc" goes over the memory budget,
+"exit" kills the worker and "error" raises. Stubs can also be made slow,
+blank, unable to open documents or unable to read some kinds of page, to
+check how extractors are ranked and fall back on each other.
+"""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+import src.page_cache as page_cache
+from src.extractors import EXTRACTORS, PageExtractor, register_extractor
+from src.page_extraction import (PageSkipped, count_pages, extract_pages, extract_with_fallback,
+                                 rank_extractors)
+
+# Stub page counts run in worker processes; they append here while the file exists
+COUNT_LOG = os.path.join(tempfile.gettempdir(), f"test_page_extraction_{os.getpid()}.log")
+
+class StubExtractor(PageExtractor):
+    delay = 0.0
+    blank = False
+    unreadable = ()
+    opens = True
+
+    def __init__(self, source, page_numbers):
+        if not self.opens:
+            raise ValueError(f"{self.name} cannot open this document")
+        self.actions = source.decode().split()
+
+    @classmethod
+    def is_available(cls):
+        return True
+
+    @staticmethod
+    def page_count(source):
+        if os.path.exists(COUNT_LOG):
+            with open(COUNT_LOG, 'a') as f:
+                f.write("count\n")
+        if source.startswith(b"hang"):
+            time.sleep(30)
+        return len(source.split())
+
+    def extract(self, page_num):
+        action = self.actions[page_num - 1]
+        time.sleep(self.delay)
+        if self.blank:
+            return ""
+        if action in self.unreadable:
+            raise ValueError(f"{self.name} cannot read page {page_num}")
+        if action == "sleep":
+            time.sleep(30)
+        elif action == "alloc":
+            return str(len(bytearray(1024 * 1024 * 1024)))
+        elif action == "exit":
+            os._exit(3)
+        elif action == "error":
+            raise ValueError(f"bad page {page_num}")
+        return f"page {page_num}"
+
+@contextmanager
+def stub_extractors(*names, **behaviors):
+    """Replace the installed extractors with stubs for the duration of a test
+
+    behaviors maps a stub name to class attributes overriding StubExtractor's.
+    """
+    saved = dict(EXTRACTORS)
+    EXTRACTORS.clear()
+    try:
+        for name in names:
+            register_extractor(name)(type(name, (StubExtractor,), behaviors.get(name, {})))
+        yield
+    finally:
+        EXTRACTORS.clear()
+        EXTRACTORS.update(saved)
+
+def test_budgets_skip_pages():
+    errors = {}
+    with stub_extractors("stub"):
+        texts = extract_pages(b"ok sleep ok alloc ok exit ok error ok", "stub", workers=2,
+                              pages_per_task=4, page_timeout=1, memory_limit_mb=256,
+                              on_error=lambda page_num, e: errors.__setitem__(page_num, e))
+
+    assert texts == ["page 1", "", "page 3", "", "page 5", "", "page 7", "", "page 9"], texts
+    assert sorted(errors) == [2, 4, 6, 8], errors
+    assert isinstance(errors[2], PageSkipped) and "timed out" in str(errors[2])
+    assert isinstance(errors[4], PageSkipped) and "memory budget" in str(errors[4])
+    assert isinstance(errors[6], PageSkipped) and "exited with code 3" in str(errors[6])
+    assert not isinstance(errors[8], PageSkipped) and "bad page 8" in str(errors[8])
+    print("✅ Hanging, oversized, crashing and failing pages skipped, the rest extracted")
+
+def test_open_timeout():
+    with stub_extractors("stub"):
+        started = time.monotonic()
+        try:
+            count_pages(b"hang ok", "stub", page_timeout=1)
+        except TimeoutError:
+            pass
+        else:
+            raise AssertionError("A document that does not open was counted")
+    assert time.monotonic() - started < 10
+    print("✅ Opening a hanging document times out")
+
+def test_pages_counted_once():
+    with tempfile.TemporaryDirectory() as cache_dir, stub_extractors("stub_a", "stub_b"):
+        saved_cache = page_cache._default_cache
+        page_cache._default_cache = page_cache.PageCache(cache_dir)
+        try:
+            open(COUNT_LOG, 'w').close()
+            pages = page_cache.read_pdf_pages(b"ok ok ok ok")
+            with open(COUNT_LOG) as f:
+                counts = f.read().split()
+        finally:
+            page_cache._default_cache = saved_cache
+            os.remove(COUNT_LOG)
+
+    assert pages == ["page 1", "page 2", "page 3", "page 4"], pages
+    assert len(counts) == 1, f"Document opened {len(counts)} times to count its pages"
+    print("✅ Pages counted once for ranking and extraction")
+
+def test_rank_extractors():
+    with stub_extractors("slow", "blank", "broken", "fast",
+                         slow={"delay": 0.2}, blank={"blank": True}, broken={"unreadable": ("ok",)}):
+        ranked = rank_extractors(b"ok ok ok ok ok ok", sample_pages=3)
+    # Working extractors by speed, then the rest in registration order
+    assert ranked == ["fast", "slow", "blank", "broken"], ranked
+    print("✅ Extractors ranked by speed, failing and blank ones last")
+
+def test_extract_with_fallback():
+    errors = {}
+    with stub_extractors("first", "second", "third", first={"unreadable": ("scan",)},
+                         second={"unreadable": ("scan", "table")}):
+        backend, texts = extract_with_fallback(b"ok scan table error", ["first", "second"],
+                                               on_error=lambda page_num, e: errors.__setitem__(page_num, e))
+        assert backend == "first"
+        # Page 2 is read by no backend; page 4 raises in every backend
+        assert texts == ["page 1", "", "page 3", ""], texts
+        assert sorted(errors) == [2, 4], errors
+
+        backend, texts = extract_with_fallback(b"ok scan table", ["first", "third"])
+        assert (backend, texts) == ("first", ["page 1", "page 2", "page 3"]), (backend, texts)
+
+    with stub_extractors("closed", "open", closed={"opens": False}):
+        backend, texts = extract_with_fallback(b"ok ok", ["closed", "open"])
+        assert (backend, texts) == ("open", ["page 1", "page 2"]), (backend, texts)
+    print("✅ Pages a backend fails on filled in by the next, unopenable documents passed on")
+
+if __name__ == "__main__":
+    test_budgets_skip_pages()
+    test_open_timeout()
+    test_pages_counted_once()
+    test_rank_extractors()
+    test_extract_with_fallback()
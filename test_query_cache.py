@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script to check the shared search result cache
+"""
+
+from src.live_corpus import LiveCorpus
+from src.paged_document import PagedDocument
+from src.query_cache import QueryCache
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def counting(value):
+    calls = []
+
+    def compute():
+        calls.append(value)
+        return value
+    return compute, calls
+
+def test_lru_eviction():
+    cache = QueryCache(max_entries=2, ttl_seconds=60)
+    for key in ("a", "b"):
+        cache.get_or_compute(key, lambda: key.upper())
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get_or_compute("a", lambda: "recomputed") == "A"
+    cache.get_or_compute("c", lambda: "C")
+
+    compute, calls = counting("B again")
+    assert cache.get_or_compute("b", compute) == "B again" and calls, "Least recently used entry was kept"
+    assert cache.get_or_compute("c", lambda: "recomputed") == "C"
+    assert cache.stats() == {"hits": 2, "misses": 4, "entries": 2}, cache.stats()
+
+    disabled = QueryCache(max_entries=0)
+    disabled.get_or_compute("a", lambda: "A")
+    assert disabled.stats()["entries"] == 0
+    print("✅ Least recently used entries evicted beyond max_entries")
+
+def test_ttl_expiry():
+    clock = Clock()
+    cache = QueryCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.get_or_compute("refund policy", lambda: ["old"])
+
+    clock.now = 59.9
+    assert cache.get_or_compute("refund policy", lambda: ["new"]) == ["old"]
+    clock.now = 60.0
+    assert cache.get_or_compute("refund policy", lambda: ["new"]) == ["new"], "Expired entry served"
+    clock.now = 100.0
+    assert cache.get_or_compute("refund policy", lambda: ["newer"]) == ["new"]
+    print("✅ Entries expire after ttl_seconds")
+
+def test_corpus_generation_invalidates():
+    cache = QueryCache(max_entries=10, ttl_seconds=60)
+    corpus = LiveCorpus()
+
+    def search(query):
+        # Keyed like app.search_documents: generation and normalized query
+        generation, documents = corpus.snapshot()
+        return cache.get_or_compute(("documents", generation, query),
+                                    lambda: [doc.text for doc in documents])
+
+    assert search("reset password") == []
+    corpus.publish("faq.txt", PagedDocument.from_text("faq.txt", "Reset your password in settings."))
+    assert search("reset password") == ["Reset your password in settings."], "Result of an older generation served"
+    assert search("reset password") == ["Reset your password in settings."]
+    corpus.replace(PagedDocument.from_text("faq.txt", "Reset your password from the login page."))
+    assert search("reset password") == ["Reset your password from the login page."]
+
+    # A reloaded corpus starts from a generation no earlier corpus had
+    reloaded = LiveCorpus()
+    assert reloaded.generation > corpus.generation
+    assert cache.stats()["hits"] == 1, cache.stats()
+    print("✅ Publishing or replacing documents invalidates cached results")
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_ttl_expiry()
+    test_corpus_generation_invalidates()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script to check text normalization and its map back to the original text
+"""
+
+from src.paged_document import PagedDocument
+from src.text_normalizer import OffsetMap, normalize_query, normalize_text
+
+ORIGINAL = ("Our re\u00adfund  policy is simple:\u200b the ﬁnal decision is made with-\n"
+            "in 30 days.\n\n\nContact   Support\tfor Anti-\nVirus help; café hours vary.")
+
+def test_normalize_text():
+    normalized, _ = normalize_text(ORIGINAL)
+    assert normalized == ("our refund policy is simple: the final decision is made within 30 days."
+                          "\n\ncontact support for anti-virus help; café hours vary."), repr(normalized)
+    assert normalize_query("  Essay\u00a0#288 ") == "essay #288"
+    print("✅ Soft hyphens, ligatures, line wraps and whitespace runs normalized")
+
+def test_offset_map_round_trip():
+    normalized, mapping = normalize_text(ORIGINAL)
+    expected = {
+        "refund": "re\u00adfund",
+        "final": "ﬁnal",
+        "within": "with-\nin",
+        "simple: the": "simple:\u200b the",
+        "contact support": "Contact   Support",
+        "anti-virus": "Anti-\nVirus",
+        "café": "café",
+        "vary.": "vary.",
+    }
+    for word, original in expected.items():
+        start = normalized.index(word)
+        orig_start, orig_end = mapping.span_to_original(start, start + len(word))
+        assert ORIGINAL[orig_start:orig_end] == original, (word, ORIGINAL[orig_start:orig_end])
+
+    # Every normalized character maps into the original, in order
+    positions = [mapping.to_original(pos) for pos in range(len(normalized))]
+    assert positions == sorted(positions) and positions[-1] < len(ORIGINAL)
+    print(f"✅ {len(expected)} normalized spans mapped back to the original text")
+
+def test_offset_map_across_pages():
+    pages = [(1, "First  page."), (2, "Second ﬁle page."), (3, "Third\npage.")]
+    doc = PagedDocument("test.pdf", "pdf", 3, pages)
+    for index, (_, text) in enumerate(pages):
+        normalized = doc.normalized_page(index)
+        start = normalized.index("page")
+        orig_start, orig_end = doc.original_span(index, start, start + len("page"))
+        assert doc.page_text(index)[orig_start:orig_end] == "page", (index, orig_start, orig_end)
+
+    mapping = OffsetMap()
+    mapping.add(0, 0)
+    mapping.add(5, 5)  # Same offset as the previous segment: not stored
+    assert len(mapping.norm_starts) == 1
+    print("✅ Spans of every page mapped through the document's combined offset map")
+
+if __name__ == "__main__":
+    test_normalize_text()
+    test_offset_map_round_trip()
+    test_offset_map_across_pages()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script to check RecursiveTextSplitter matches langchain's splitter
+"""
+
+import os
+import random
+import tempfile
+
+def sample_texts():
+    random.seed(0)
+    texts = ["", "   ", "short text", "x" * 2500, "a\n\n" * 700]
+    for _ in range(300):
+        alphabet = random.choice(["ab \n", "a\n\n b", "xyz", "a  \n\t\n\nb c"])
+        texts.append("".join(random.choice(alphabet) for _ in range(random.randint(0, 3000))))
+    
+    docs_dir = "data/documents"
+    if os.path.exists(docs_dir):
+        import src.page_cache as page_cache
+        # Extract into a throwaway cache rather than the app's data/page_cache
+        with tempfile.TemporaryDirectory() as cache_dir:
+            page_cache._default_cache = page_cache.PageCache(cache_dir)
+            for filename in sorted(os.listdir(docs_dir)):
+                if filename.lower().endswith('.pdf'):
+                    texts.extend(page_cache.read_pdf_pages(os.path.join(docs_dir, filename)))
+            page_cache._default_cache = None
+    return texts
+
+def test_text_splitter():
+    try:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+    except ImportError:
+        print("❌ langchain not installed, skipping")
+        return
+    
+    from src.text_splitter import RecursiveTextSplitter
+    
+    texts = sample_texts()
+    print(f"🔍 Comparing splitters on {len(texts)} texts...")
+    
+    for chunk_size, chunk_overlap in [(1000, 200), (100, 20), (40, 0), (30, 29)]:
+        reference = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=len
+        )
+        splitter = RecursiveTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        
+        for text in texts:
+            assert splitter.split_text(text) == reference.split_text(text), \
+                f"Chunks differ for chunk_size={chunk_size}, overlap={chunk_overlap}: {text[:60]!r}"
+            for start, end in splitter.split_spans(text):
+                assert 0 <= start < end <= len(text)
+        
+        print(f"✅ chunk_size={chunk_size}, overlap={chunk_overlap}: identical chunks")
+
+if __name__ == "__main__":
+    test_text_splitter()
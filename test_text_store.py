@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script to check that compressed text reads back like the original string
+"""
+
+import pickle
+
+from src.text_store import BlockText, compress_text
+
+TEXT = "".join(f"Line {number}: résumé ✓ refund policy.\n" for number in range(40))
+
+def test_slicing_across_blocks():
+    text = BlockText(TEXT, block_chars=64)
+    assert len(text) == len(TEXT) and str(text) == TEXT
+    assert len(text.offsets) - 1 == -(-len(TEXT) // 64)
+
+    for start, stop in [(0, 64), (60, 70), (63, 129), (10, 300), (64, 64), (100, 90),
+                        (-5, None), (None, 5), (0, len(TEXT) + 100)]:
+        assert text[start:stop] == TEXT[start:stop], (start, stop)
+    assert text[::-1] == TEXT[::-1] and text[3:200:7] == TEXT[3:200:7]
+    print("✅ Slices within and across block boundaries match the original text")
+
+def test_indexing():
+    text = BlockText(TEXT, block_chars=64)
+    for index in (0, 63, 64, 65, 127, 128, len(TEXT) - 1, -1, -len(TEXT)):
+        assert text[index] == TEXT[index], index
+    for index in (len(TEXT), -len(TEXT) - 1):
+        try:
+            text[index]
+        except IndexError:
+            continue
+        raise AssertionError(f"Index {index} out of range was read")
+    print("✅ Single characters read from any block, out of range indexes rejected")
+
+def test_round_trip():
+    text = BlockText(TEXT, block_chars=64)
+    text[70:80]  # Pickled with a block decompressed
+    restored = pickle.loads(pickle.dumps(text))
+    assert str(restored) == TEXT and restored[60:130] == TEXT[60:130]
+    assert compress_text(text) is text and str(compress_text(TEXT)) == TEXT
+    assert str(BlockText("")) == "" and BlockText("")[0:10] == ""
+    assert BlockText(TEXT).compressed_size < len(TEXT.encode('utf-8'))
+    print("✅ Compressed text survives pickling and is smaller than the original")
+
+if __name__ == "__main__":
+    test_slicing_across_blocks()
+    test_indexing()
+    test_round_trip()
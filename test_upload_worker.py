@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script to check background ingestion of uploaded files
+"""
+
+import os
+import tempfile
+
+from src.upload_worker import UploadWorker, upload_filename
+
+def test_upload_filename():
+    assert upload_filename("report.pdf") == "report.pdf"
+    assert upload_filename("../../etc/report.pdf") == "report.pdf"
+    assert upload_filename("C:\\Users\\me\\report.pdf") == "report.pdf"
+    for name in ("", "..", "dir/"):
+        try:
+            upload_filename(name)
+        except ValueError:
+            continue
+        raise AssertionError(f"{name!r} accepted as an upload name")
+    print("✅ Upload names stripped of directories, empty names rejected")
+
+def test_uploads_never_overwrite():
+    with tempfile.TemporaryDirectory() as root:
+        documents = os.path.join(root, "documents")
+        uploads = os.path.join(root, "uploads")
+        os.makedirs(documents)
+        with open(os.path.join(documents, "manual.pdf"), 'wb') as f:
+            f.write(b"bundled")
+
+        processed = []
+
+        def process(file_path, status):
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            processed.append((os.path.basename(file_path), data))
+            if data == b"broken":
+                raise ValueError("unreadable PDF")
+
+        worker = UploadWorker(process, uploads, reserved_dirs=(documents,))
+        first = worker.submit("manual.pdf", b"first")
+        second = worker.submit("manual.pdf", b"second")
+        broken = worker.submit("other.pdf", b"broken")
+        worker.join()
+
+        assert processed == [("manual (2).pdf", b"first"), ("manual (3).pdf", b"second"),
+                             ("other.pdf", b"broken")], processed
+        assert (first.state, second.state, broken.state) == ("done", "done", "failed")
+        assert broken.error == "unreadable PDF" and not worker.busy
+
+        # The bundled document is untouched and only the failed upload was removed
+        with open(os.path.join(documents, "manual.pdf"), 'rb') as f:
+            assert f.read() == b"bundled"
+        assert sorted(os.listdir(uploads)) == ["manual (2).pdf", "manual (3).pdf"], os.listdir(uploads)
+
+        try:
+            worker.submit("notes.exe", b"data")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Unsupported file type accepted")
+
+        worker.clear_finished()
+        assert worker.statuses() == []
+        print("✅ Uploads stored under free names, failed uploads removed, bundled files kept")
+
+if __name__ == "__main__":
+    test_upload_filename()
+    test_uploads_never_overwrite()